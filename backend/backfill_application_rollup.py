@@ -0,0 +1,40 @@
+"""Rebuild the per-day applications rollup (``application_daily_counts``).
+
+The dashboard stats, 30-day plan counter and last-activity card read the
+rollup, which ``log_applications`` keeps current. It is filled automatically
+the first time the table is created; run this after importing or editing
+``applications`` rows by hand, or to repair drift.
+
+Usage:
+    uv run python backfill_application_rollup.py            # every user
+    uv run python backfill_application_rollup.py you@gmail.com
+    (set DATABASE_URL first to run against Postgres)
+"""
+
+import os
+import sys
+
+_BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+_CONFIG_DIR = os.path.join(_BACKEND_DIR, "config")
+for _path in (_CONFIG_DIR, _BACKEND_DIR):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from dotenv import load_dotenv
+
+load_dotenv(os.path.join(_BACKEND_DIR, ".env"))
+
+from db_manager import db
+
+
+def main(user_id: str | None = None) -> None:
+    written = db.rebuild_application_rollup(user_id)
+    print(f"DB: {db.db_url.split('@')[-1] if '@' in db.db_url else db.db_url}")
+    scope = repr(user_id) if user_id else "all users"
+    print(f"Rebuilt {written} rollup rows for {scope}.")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2:
+        raise SystemExit(__doc__)
+    main(sys.argv[1].strip() if len(sys.argv) == 2 else None)
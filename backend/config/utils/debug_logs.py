@@ -15,11 +15,15 @@ Legacy flat bot-<id>.txt at logs root are still read when no run folder exists.
 
 from __future__ import annotations
 
+import atexit
 import glob
 import logging
 import os
+import signal
+import threading
+import time
 from datetime import datetime, timezone
-from typing import Iterable
+from typing import IO, Iterable, Iterator
 
 from app_paths import get_logs_dir
 
@@ -199,13 +203,238 @@ def configure_api_logging() -> logging.Logger:
     return logger
 
 
+class BufferedLogSink:
+    """Process-wide append-only text sink for high-volume plain-text logs.
+
+    Keeps one handle per path open and buffers writes in memory. Buffers are
+    flushed once they reach ``max_buffer_bytes``, by a daemon thread every
+    ``flush_interval`` seconds (so idle bots still show their last lines in
+    the dashboard), on ``flush()``, and at interpreter exit / SIGTERM.
+
+    Files are opened in append mode, so each flush is a single ``O_APPEND``
+    write and lines never interleave mid-line with other writers of the same
+    file (``logging.FileHandler``, sibling processes). The sink never touches
+    stdout/stderr, which stay with the supervisor's console capture.
+    """
+
+    def __init__(self, *, max_buffer_bytes: int = 8192, flush_interval: float = 1.0):
+        self.max_buffer_bytes = max_buffer_bytes
+        self.flush_interval = flush_interval
+        self._lock = threading.RLock()
+        self._handles: dict[str, IO[str]] = {}
+        self._buffers: dict[str, list[str]] = {}
+        self._sizes: dict[str, int] = {}
+        self._flusher: threading.Thread | None = None
+        self._closed = False
+
+    def write(self, path: str, text: str) -> None:
+        with self._lock:
+            if self._closed:
+                self._append_now(path, text)
+                return
+            self._buffers.setdefault(path, []).append(text)
+            size = self._sizes.get(path, 0) + len(text)
+            self._sizes[path] = size
+            if size >= self.max_buffer_bytes:
+                self._flush_path(path)
+            self._ensure_flusher()
+
+    def flush(self) -> None:
+        with self._lock:
+            for path in list(self._buffers):
+                self._flush_path(path)
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            for handle in self._handles.values():
+                try:
+                    handle.close()
+                except Exception:
+                    pass
+            self._handles.clear()
+            self._closed = True
+
+    def _handle(self, path: str) -> IO[str]:
+        handle = self._handles.get(path)
+        if handle is None or handle.closed:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            handle = open(path, "a", encoding="utf-8")
+            self._handles[path] = handle
+        return handle
+
+    def _flush_path(self, path: str) -> None:
+        chunks = self._buffers.pop(path, None)
+        self._sizes.pop(path, None)
+        if not chunks:
+            return
+        try:
+            handle = self._handle(path)
+            handle.write("".join(chunks))
+            handle.flush()
+        except OSError as exc:
+            self._handles.pop(path, None)
+            print(f"Logging error: {exc}")
+
+    @staticmethod
+    def _append_now(path: str, text: str) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a", encoding="utf-8") as fh:
+            fh.write(text)
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is not None and self._flusher.is_alive():
+            return
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="log-sink-flusher", daemon=True
+        )
+        self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        while not self._closed:
+            time.sleep(self.flush_interval)
+            if self._buffers:
+                self.flush()
+
+
+_log_sink: BufferedLogSink | None = None
+_log_sink_lock = threading.Lock()
+
+
+def _flush_then_terminate(signum, frame) -> None:
+    if _log_sink is not None:
+        _log_sink.flush()
+    signal.signal(signum, signal.SIG_DFL)
+    os.kill(os.getpid(), signum)
+
+
+def buffered_log_sink() -> BufferedLogSink:
+    """Shared sink for this process; flushed at exit (and on SIGTERM when unhandled)."""
+    global _log_sink
+    if _log_sink is not None:
+        return _log_sink
+    with _log_sink_lock:
+        if _log_sink is None:
+            _log_sink = BufferedLogSink()
+            atexit.register(_log_sink.close)
+            # Supervisor stops workers with terminate(); only take over SIGTERM
+            # when nobody else installed a handler.
+            if (
+                hasattr(signal, "SIGTERM")
+                and threading.current_thread() is threading.main_thread()
+                and signal.getsignal(signal.SIGTERM) == signal.SIG_DFL
+            ):
+                signal.signal(signal.SIGTERM, _flush_then_terminate)
+    return _log_sink
+
+
+TAIL_BLOCK_SIZE = 64 * 1024
+# Upper bound for one incremental read so a client far behind cannot pull a
+# multi-MB log into a single response.
+MAX_INCREMENT_BYTES = 1024 * 1024
+
+
+def read_tail(path: str, lines: int = 120, *, block_size: int = TAIL_BLOCK_SIZE) -> tuple[str, int]:
+    """Last ``lines`` lines of ``path`` plus the byte offset of EOF.
+
+    Seeks backwards from the end in ``block_size`` chunks until enough
+    newlines have been seen, so the cost is proportional to the tail size,
+    not the file size. Pass the returned offset to ``read_since`` to follow
+    the file incrementally. Raises ``OSError`` when the file cannot be read.
+    """
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        if lines <= 0 or end == 0:
+            return "", end
+        chunks: list[bytes] = []
+        pos = end
+        newlines = 0
+        trailing = None
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            if trailing is None:
+                trailing = chunk.endswith(b"\n")
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+            # A final newline terminates the last line rather than starting one.
+            if newlines - (1 if trailing else 0) >= lines:
+                break
+    data = b"".join(reversed(chunks))
+    body = data[:-1] if trailing else data
+    parts = body.rsplit(b"\n", lines)
+    if len(parts) > lines:
+        parts = parts[1:]
+    text = b"\n".join(parts) + (b"\n" if trailing else b"")
+    return text.decode("utf-8", errors="replace"), end
+
+
+def iter_lines_reverse(
+    path: str, *, max_bytes: int | None = None, block_size: int = TAIL_BLOCK_SIZE
+) -> Iterator[str]:
+    """Lines of ``path`` from last to first, reading ``block_size`` chunks from EOF.
+
+    Stops after ``max_bytes`` from the end (the line cut by that bound is
+    dropped), so a search that finds its match near the end never reads the
+    rest of the file. Raises ``OSError`` when the file cannot be read.
+    """
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        floor = max(0, pos - max_bytes) if max_bytes is not None else 0
+        partial = b""
+        at_eof = True
+        while pos > floor:
+            step = min(block_size, pos - floor)
+            pos -= step
+            f.seek(pos)
+            block = f.read(step) + partial
+            pieces = block.split(b"\n")
+            partial = pieces[0]
+            tail = pieces[1:]
+            if at_eof:
+                at_eof = False
+                # A final newline terminates the last line rather than starting one.
+                if tail and tail[-1] == b"":
+                    tail.pop()
+            for piece in reversed(tail):
+                yield piece.decode("utf-8", errors="replace")
+        if floor == 0 and not at_eof:
+            yield partial.decode("utf-8", errors="replace")
+
+
+def read_since(path: str, offset: int, *, max_bytes: int = MAX_INCREMENT_BYTES) -> tuple[str, int]:
+    """Complete lines appended to ``path`` after byte ``offset`` and the next offset.
+
+    A trailing partial line is left for the next call (the writer may be
+    mid-append) unless it alone exceeds ``max_bytes``. An offset past EOF
+    means the file was truncated or replaced, so reading restarts at 0.
+    Raises ``OSError`` when the file cannot be read.
+    """
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        offset = max(0, int(offset))
+        if offset > size:
+            offset = 0
+        f.seek(offset)
+        chunk = f.read(max(1, max_bytes))
+    cut = chunk.rfind(b"\n")
+    if cut >= 0:
+        chunk = chunk[: cut + 1]
+    elif len(chunk) < max_bytes:
+        chunk = b""
+    return chunk.decode("utf-8", errors="replace"), offset + len(chunk)
+
+
 def tail_file(path: str, lines: int = 120) -> str:
     if not os.path.isfile(path):
         return ""
     try:
-        with open(path, "r", encoding="utf-8", errors="replace") as f:
-            buf = f.readlines()
-        return "".join(buf[-lines:])
+        return read_tail(path, lines)[0]
     except Exception as ex:
         return f"(read error: {ex})"
 
@@ -0,0 +1,62 @@
+"""Run blocking DB / filesystem work from async routes without stalling the loop.
+
+Routes are ``async def`` (they await ``resolve_user_id``), but the ``db``
+singleton, log tails and framework file reads are synchronous. Calling them
+inline blocks every other request for as long as one SQLite write or large
+read takes. ``run_blocking`` hands such work to one bounded thread pool, so
+concurrent DB work stays under SQLAlchemy's default connection limit
+(5 + 10 overflow) instead of queueing on checkout.
+
+Env:
+  BLOCKING_IO_WORKERS  pool size (default 8)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _workers() -> int:
+    raw = (os.getenv("BLOCKING_IO_WORKERS") or "").strip()
+    try:
+        return max(1, int(raw)) if raw else 8
+    except ValueError:
+        return 8
+
+
+def blocking_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_workers(), thread_name_prefix="blocking-io"
+            )
+        return _executor
+
+
+async def run_blocking(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Await ``func(*args, **kwargs)`` on the blocking-I/O pool (context vars preserved)."""
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, func, *args, **kwargs)
+    return await loop.run_in_executor(blocking_executor(), call)
+
+
+def shutdown_blocking_executor() -> None:
+    """Stop the pool (app lifespan shutdown); a later call recreates it."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
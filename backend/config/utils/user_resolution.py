@@ -10,9 +10,20 @@ Env vars:
   REQUIRE_AUTH          "true" on public deployments — reject requests
                         without a valid session instead of falling back.
   NEXTAUTH_SESSION_URL  Where to verify sessions (default: local Next.js).
+  SESSION_CACHE_TTL     Seconds a verified cookie -> email mapping is reused
+                        (default 30; 0 disables the cache).
+  SESSION_CACHE_NEGATIVE_TTL
+                        Seconds an unauthenticated cookie is remembered
+                        (default 5).
+  SESSION_CACHE_MAX     Max cached cookies (default 1024, LRU).
 """
 
+import asyncio
+import hashlib
 import os
+import threading
+import time
+from collections import OrderedDict
 
 import httpx
 from fastapi import HTTPException, Request
@@ -40,25 +51,161 @@ def _trusted_proxy_email(request: Request) -> str | None:
     return email or None
 
 
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+# sha256(cookie) -> (email or None, monotonic expiry)
+_session_cache: "OrderedDict[str, tuple[str | None, float]]" = OrderedDict()
+_session_cache_lock = threading.Lock()
+_stats = {
+    "hits": 0,
+    "negative_hits": 0,
+    "misses": 0,
+    "verifications": 0,
+    "verify_errors": 0,
+    "verify_ms_total": 0.0,
+    "verify_ms_max": 0.0,
+}
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = (os.getenv(name) or "").strip()
+    try:
+        return float(raw) if raw else default
+    except ValueError:
+        return default
+
+
+def session_http_client() -> httpx.AsyncClient:
+    """Shared keep-alive client for session verification.
+
+    Bound to the running event loop; a new loop (tests, reloads) gets a
+    fresh client instead of reusing connections owned by a dead loop.
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            timeout=4.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_session_http_client() -> None:
+    """Close the shared client (called from the app lifespan on shutdown)."""
+    global _http_client, _http_client_loop
+    client, _http_client, _http_client_loop = _http_client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def _cache_get(cookie_hash: str) -> tuple[bool, str | None]:
+    with _session_cache_lock:
+        entry = _session_cache.get(cookie_hash)
+        if entry is None:
+            return False, None
+        email, expires = entry
+        if expires <= time.monotonic():
+            del _session_cache[cookie_hash]
+            return False, None
+        _session_cache.move_to_end(cookie_hash)
+        _stats["hits" if email else "negative_hits"] += 1
+        return True, email
+
+
+def _cache_put(cookie_hash: str, email: str | None) -> None:
+    ttl = (
+        _env_float("SESSION_CACHE_TTL", 30.0)
+        if email
+        else _env_float("SESSION_CACHE_NEGATIVE_TTL", 5.0)
+    )
+    if ttl <= 0:
+        return
+    max_entries = max(1, int(_env_float("SESSION_CACHE_MAX", 1024)))
+    with _session_cache_lock:
+        _session_cache[cookie_hash] = (email, time.monotonic() + ttl)
+        _session_cache.move_to_end(cookie_hash)
+        while len(_session_cache) > max_entries:
+            _session_cache.popitem(last=False)
+
+
+def clear_session_cache() -> None:
+    with _session_cache_lock:
+        _session_cache.clear()
+        for key in _stats:
+            _stats[key] = 0
+
+
+def get_session_cache_stats() -> dict:
+    """Hit rate and NextAuth verification latency for this process."""
+    with _session_cache_lock:
+        stats = dict(_stats)
+        stats["size"] = len(_session_cache)
+    lookups = stats["hits"] + stats["negative_hits"] + stats["misses"]
+    stats["hit_rate"] = (
+        round((stats["hits"] + stats["negative_hits"]) / lookups, 3) if lookups else 0.0
+    )
+    verified = stats["verifications"]
+    stats["verify_ms_avg"] = round(stats["verify_ms_total"] / verified, 1) if verified else 0.0
+    stats["verify_ms_total"] = round(stats["verify_ms_total"], 1)
+    stats["verify_ms_max"] = round(stats["verify_ms_max"], 1)
+    return stats
+
+
+async def _verify_session_cookie(cookie: str) -> str | None:
+    """Ask NextAuth who owns ``cookie``; raises on transport errors."""
+    started = time.perf_counter()
+    try:
+        resp = await session_http_client().get(
+            _session_url(), headers={"cookie": cookie}
+        )
+    finally:
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        with _session_cache_lock:
+            _stats["verifications"] += 1
+            _stats["verify_ms_total"] += elapsed_ms
+            _stats["verify_ms_max"] = max(_stats["verify_ms_max"], elapsed_ms)
+    if resp.status_code == 200:
+        data = resp.json() or {}
+        email = (data.get("user") or {}).get("email")
+        if email:
+            return email.strip()
+    elif resp.status_code >= 500:
+        raise httpx.HTTPStatusError(
+            "Auth service error", request=resp.request, response=resp
+        )
+    return None
+
+
 async def _session_email(request: Request) -> str | None:
     """Return the verified session email, or None when unauthenticated."""
     cookie = request.headers.get("cookie")
     if not cookie:
         return None
+    cookie_hash = hashlib.sha256(cookie.encode("utf-8")).hexdigest()
+    found, email = _cache_get(cookie_hash)
+    if found:
+        return email
+    with _session_cache_lock:
+        _stats["misses"] += 1
     try:
-        async with httpx.AsyncClient(timeout=4.0) as client:
-            resp = await client.get(_session_url(), headers={"cookie": cookie})
-        if resp.status_code == 200:
-            data = resp.json() or {}
-            email = (data.get("user") or {}).get("email")
-            if email:
-                return email.strip()
+        email = await _verify_session_cookie(cookie)
+    except httpx.HTTPStatusError:
+        # Upstream 5xx: unauthenticated for this request, but not remembered.
+        return None
     except Exception:
+        # Transport / upstream failures are never cached.
+        with _session_cache_lock:
+            _stats["verify_errors"] += 1
         if _require_auth():
             raise HTTPException(
                 status_code=503, detail="Auth service unavailable"
             )
-    return None
+        return None
+    _cache_put(cookie_hash, email)
+    return email
 
 
 def _local_desktop_trust_claimed() -> bool:
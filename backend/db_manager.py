@@ -1,11 +1,14 @@
 import os
+import copy
 import json
 import logging
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from sqlalchemy import create_engine, select, update, insert, func, case, literal, union_all
+from sqlalchemy import create_engine, event, inspect, select, update, insert, func, case, literal, union_all, and_, or_
 from sqlalchemy.orm import sessionmaker, Session
 from app_paths import get_runtime_writable_root
-from models import Base, Config, Subscription, BotRun, Application, UserSession, Asset, ResumeMetadata, AutomationTask, Feedback, CommunityPost, CommunityReply
+from models import Base, Config, ConfigVersion, Subscription, BotRun, Application, ApplicationDailyCount, AiAnswerCache, UserSession, Asset, ResumeMetadata, AutomationTask, Feedback, CommunityPost, CommunityReply, ConnectCampaign, ConnectCampaignRun
 from utils.encryption import encrypt_data, decrypt_data
 
 SENSITIVE_KEYS = [
@@ -23,6 +26,11 @@ def _is_sensitive_key(key: str) -> bool:
         return True
     return key.startswith("LINKEDIN_PASSWORD_")
 
+# ``list_applications`` returns these columns; the heavy text ones (often
+# kilobytes per row) only when named in ``include``.
+APPLICATION_LIST_COLUMNS = ("id", "job_title", "company", "location", "job_url", "status", "resume_used", "timestamp")
+APPLICATION_HEAVY_COLUMNS = ("reason", "answer_generated")
+
 # Legacy namespace used only when upgrading pre-multi-tenant DB schemas.
 _LEGACY_MIGRATION_OWNER = "local-user"
 
@@ -42,6 +50,60 @@ def _ts_to_utc_iso(dt: datetime | None) -> str | None:
     return s
 
 
+def _as_utc(dt: datetime) -> datetime:
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
+
+
+def _sqlite_busy_timeout_ms() -> int:
+    raw = (os.getenv("SQLITE_BUSY_TIMEOUT_MS") or "").strip()
+    try:
+        return max(0, int(raw)) if raw else 30000
+    except ValueError:
+        return 30000
+
+
+def create_db_engine(db_url: str):
+    """Engine for ``db_url``; SQLite files get the multi-process write profile.
+
+    The API, the supervisor and every bot worker open the same ``data.db``.
+    Each SQLite connection is set up on connect with:
+
+      * ``journal_mode`` (``SQLITE_JOURNAL_MODE``, default WAL): readers no
+        longer block the writer or each other;
+      * ``synchronous`` (``SQLITE_SYNCHRONOUS``, default NORMAL): no fsync per
+        commit, which is safe under WAL (a power cut may drop the last commits
+        but cannot corrupt the file);
+      * ``busy_timeout`` (``SQLITE_BUSY_TIMEOUT_MS``, default 30000): a writer
+        waits for the lock instead of failing with ``database is locked``.
+
+    Keep the journal mode at WAL unless the file is on a network share.
+    """
+    if "sqlite" not in db_url:
+        return create_engine(db_url)
+
+    busy_ms = _sqlite_busy_timeout_ms()
+    journal_mode = (os.getenv("SQLITE_JOURNAL_MODE") or "WAL").strip().upper()
+    synchronous = (os.getenv("SQLITE_SYNCHRONOUS") or "NORMAL").strip().upper()
+    engine = create_engine(
+        db_url,
+        connect_args={"check_same_thread": False, "timeout": busy_ms / 1000},
+    )
+
+    @event.listens_for(engine, "connect")
+    def _sqlite_pragmas(dbapi_conn, _record):
+        cursor = dbapi_conn.cursor()
+        try:
+            cursor.execute(f"PRAGMA busy_timeout = {busy_ms}")
+            if journal_mode.isalpha():
+                cursor.execute(f"PRAGMA journal_mode = {journal_mode}")
+            if synchronous.isalpha():
+                cursor.execute(f"PRAGMA synchronous = {synchronous}")
+        finally:
+            cursor.close()
+
+    return engine
+
+
 class DatabaseManager:
     def __init__(self):
         # Desktop sidecar: configs, secrets, applications, and bot history stay on
@@ -64,9 +126,15 @@ class DatabaseManager:
             db_path = os.path.join(get_runtime_writable_root(), "data.db")
             self.db_url = f"sqlite:///{db_path}"
             
-        # Create engine
-        self.engine = create_engine(self.db_url, connect_args={"check_same_thread": False} if "sqlite" in self.db_url else {})
-        
+        self.engine = create_db_engine(self.db_url)
+
+        # The applications rollup is filled from history the first time its
+        # table appears (``backfill_application_rollup.py`` redoes it by hand).
+        try:
+            needs_rollup = not inspect(self.engine).has_table(ApplicationDailyCount.__tablename__)
+        except Exception:
+            needs_rollup = False
+
         # Ensure all tables exist
         Base.metadata.create_all(self.engine)
         # Add columns that are new since this DB file was first created.
@@ -76,6 +144,22 @@ class DatabaseManager:
         # Create session factory
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
 
+        if needs_rollup:
+            try:
+                self.rebuild_application_rollup()
+            except Exception as exc:
+                logging.warning(f"Application rollup backfill skipped: {exc}")
+
+        # In-process change counters per user (``None`` = affects everyone).
+        self._user_versions: dict[str | None, int] = {}
+        self._user_versions_lock = threading.Lock()
+
+        # Decoded ``get_all_by_category`` results: (user_id, category) ->
+        # (values, config_versions.version or None). LRU, CONFIG_CACHE_MAX entries.
+        self._config_cache: OrderedDict[tuple[str, str], tuple[dict, int | None]] = OrderedDict()
+        self._config_cache_lock = threading.Lock()
+        self._config_cache_generation = 0
+
     def _migrate_runtime_columns(self):
         """Best-effort additive schema migration (no Alembic for two changes).
 
@@ -316,6 +400,81 @@ class DatabaseManager:
     def get_session(self) -> Session:
         return self.SessionLocal()
 
+    def bump_user_version(self, user_id: str | None = None) -> None:
+        """Record that state shown on ``user_id``'s dashboard changed.
+
+        Called by every write the automation dashboard reflects (tasks,
+        configs, subscriptions, sessions) so ``/dashboard`` can answer
+        ``If-None-Match`` without rebuilding its payload. ``None`` bumps
+        every user. Writes from other processes are not seen here; callers
+        combine the version with a short time bucket for those.
+        """
+        with self._user_versions_lock:
+            self._user_versions[user_id] = self._user_versions.get(user_id, 0) + 1
+
+    def user_version(self, user_id: str) -> int:
+        with self._user_versions_lock:
+            return self._user_versions.get(user_id, 0) + self._user_versions.get(None, 0)
+
+    def _dialect_insert(self):
+        """``insert`` with ``on_conflict_do_update`` for this engine, or None."""
+        dialect = self.engine.dialect.name
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        elif dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            return None
+        return dialect_insert
+
+    @staticmethod
+    def _config_cache_max() -> int:
+        raw = (os.getenv("CONFIG_CACHE_MAX") or "").strip()
+        try:
+            return max(0, int(raw)) if raw else 512
+        except ValueError:
+            return 512
+
+    def _config_cache_shared(self) -> bool:
+        """Revalidate cache hits against ``config_versions`` (other processes' writes).
+
+        ``CONFIG_CACHE_SHARED=1/0`` forces it; by default it is on for Postgres
+        (several web workers) and off for the single-process SQLite sidecar.
+        """
+        raw = (os.getenv("CONFIG_CACHE_SHARED") or "").strip().lower()
+        if raw in ("1", "true", "yes"):
+            return True
+        if raw in ("0", "false", "no"):
+            return False
+        return self.db_url.startswith("postgresql")
+
+    def _bump_config_version(self, session, user_id: str) -> None:
+        """Increment ``user_id``'s config version inside the caller's transaction."""
+        dialect_insert = self._dialect_insert()
+        if dialect_insert is not None:
+            stmt = dialect_insert(ConfigVersion).values(user_id=user_id, version=1)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[ConfigVersion.user_id],
+                set_={"version": ConfigVersion.version + 1},
+            )
+            session.execute(stmt)
+            return
+        row = session.get(ConfigVersion, user_id)
+        if row is None:
+            session.add(ConfigVersion(user_id=user_id, version=1))
+        else:
+            row.version = (row.version or 0) + 1
+
+    def invalidate_config_cache(self, user_id: str | None = None) -> None:
+        """Drop cached categories for ``user_id`` (everything when None)."""
+        with self._config_cache_lock:
+            self._config_cache_generation += 1
+            if user_id is None:
+                self._config_cache.clear()
+                return
+            for cache_key in [k for k in self._config_cache if k[0] == user_id]:
+                del self._config_cache[cache_key]
+
     def set_config(self, key, value, category, *, user_id: str):
         is_encrypted = 1 if _is_sensitive_key(key) else 0
         val_str = json.dumps(value)
@@ -332,7 +491,57 @@ class DatabaseManager:
             else:
                 config = Config(user_id=user_id, key=key, value=val_str, category=category, is_encrypted=is_encrypted)
                 session.add(config)
+            self._bump_config_version(session, user_id)
             session.commit()
+        self.invalidate_config_cache(user_id)
+        self.bump_user_version(user_id)
+
+    def set_configs_bulk(self, category, mapping, *, user_id: str):
+        """Upsert every ``key -> value`` of ``mapping`` in one transaction.
+
+        Same row format as :meth:`set_config` (JSON, sensitive keys
+        encrypted), but a single ``INSERT … ON CONFLICT DO UPDATE`` statement
+        and one commit instead of a session + commit per key.
+        """
+        rows = []
+        for key, value in mapping.items():
+            is_encrypted = 1 if _is_sensitive_key(key) else 0
+            val_str = json.dumps(value)
+            if is_encrypted:
+                val_str = encrypt_data(val_str)
+            rows.append(
+                {
+                    "user_id": user_id,
+                    "key": key,
+                    "value": val_str,
+                    "category": category,
+                    "is_encrypted": is_encrypted,
+                }
+            )
+        if not rows:
+            return 0
+
+        dialect_insert = self._dialect_insert()
+        with self.get_session() as session:
+            if dialect_insert is not None:
+                stmt = dialect_insert(Config)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[Config.user_id, Config.key],
+                    set_={
+                        "value": stmt.excluded.value,
+                        "category": stmt.excluded.category,
+                        "is_encrypted": stmt.excluded.is_encrypted,
+                    },
+                )
+                session.execute(stmt, rows)
+            else:
+                for row in rows:
+                    session.merge(Config(**row))
+            self._bump_config_version(session, user_id)
+            session.commit()
+        self.invalidate_config_cache(user_id)
+        self.bump_user_version(user_id)
+        return len(rows)
 
     def delete_config(self, key, category=None, *, user_id: str):
         """Remove a config row outright (no-op if it doesn't exist).
@@ -356,8 +565,11 @@ class DatabaseManager:
             if row is None:
                 return False
             session.delete(row)
+            self._bump_config_version(session, user_id)
             session.commit()
-            return True
+        self.invalidate_config_cache(user_id)
+        self.bump_user_version(user_id)
+        return True
 
     @staticmethod
     def _decode_config(config):
@@ -395,7 +607,28 @@ class DatabaseManager:
             return default
 
     def get_all_by_category(self, category, *, user_id: str):
+        """Decoded ``key -> value`` map of one category (cached per user/category).
+
+        Results are kept in an LRU of ``CONFIG_CACHE_MAX`` entries (0 disables)
+        and dropped by this process's config writes. With
+        ``CONFIG_CACHE_SHARED`` a hit is also checked against the user's
+        ``config_versions`` row, one primary-key read instead of re-reading
+        and decrypting the category. Callers get a copy they may mutate.
+        """
+        limit = self._config_cache_max()
+        cache_key = (user_id, category)
         with self.get_session() as session:
+            version = None
+            if limit and self._config_cache_shared():
+                version = session.scalar(
+                    select(ConfigVersion.version).where(ConfigVersion.user_id == user_id)
+                ) or 0
+            with self._config_cache_lock:
+                entry = self._config_cache.get(cache_key) if limit else None
+                if entry is not None and entry[1] == version:
+                    self._config_cache.move_to_end(cache_key)
+                    return copy.deepcopy(entry[0])
+                generation = self._config_cache_generation
             result = {}
             configs = session.query(Config).filter(
                 Config.category == category, Config.user_id == user_id
@@ -404,7 +637,15 @@ class DatabaseManager:
                 decoded = self._decode_config(config)
                 if decoded is not None:
                     result[config.key] = decoded
-            return result
+        if limit:
+            with self._config_cache_lock:
+                # Skip the fill if a write invalidated while we were reading.
+                if generation == self._config_cache_generation:
+                    self._config_cache[cache_key] = (copy.deepcopy(result), version)
+                    self._config_cache.move_to_end(cache_key)
+                    while len(self._config_cache) > limit:
+                        self._config_cache.popitem(last=False)
+        return result
 
     def list_config_user_ids(self, category: str, key: str) -> list[str]:
         """Distinct user_ids that have ``key`` stored under ``category``."""
@@ -427,6 +668,7 @@ class DatabaseManager:
                 sub = Subscription(user_id=user_id, **kwargs)
                 session.add(sub)
             session.commit()
+        self.bump_user_version(user_id)
 
     def get_user_subscription(self, user_id):
         with self.get_session() as session:
@@ -465,68 +707,252 @@ class DatabaseManager:
             ]
 
     def log_application(self, user_id, **kwargs):
-        if "timestamp" not in kwargs:
-            kwargs["timestamp"] = datetime.now(timezone.utc)
+        self.log_applications([{"user_id": user_id, **kwargs}])
+
+    def log_applications(self, rows):
+        """Insert application rows (dicts with ``user_id`` + columns) in one transaction.
+
+        Missing ``timestamp`` defaults to now. Unknown keys raise ``TypeError``
+        before anything is written.
+        """
+        now = datetime.now(timezone.utc)
+        apps = []
+        for row in rows:
+            row = dict(row)
+            if row.get("timestamp") is None:
+                row["timestamp"] = now
+            apps.append(Application(**row))
+        if not apps:
+            return 0
+        with self.get_session() as session:
+            session.add_all(apps)
+            session.flush()  # assigns ids for ``last_application_id``
+            self._bump_application_rollup(session, apps)
+            session.commit()
+        return len(apps)
+
+    @staticmethod
+    def _rollup_deltas(apps) -> dict[tuple[str, str, str], list]:
+        """``(user_id, day, status) -> [count, last_at, last_application_id]``."""
+        deltas: dict[tuple[str, str, str], list] = {}
+        for app in apps:
+            ts = _as_utc(app.timestamp)
+            key = (app.user_id, ts.date().isoformat(), app.status)
+            entry = deltas.get(key)
+            if entry is None:
+                deltas[key] = [1, ts, app.id]
+                continue
+            entry[0] += 1
+            if ts >= entry[1]:
+                entry[1], entry[2] = ts, app.id
+        return deltas
+
+    def _bump_application_rollup(self, session, apps) -> None:
+        """Add ``apps`` to ``application_daily_counts`` inside the caller's transaction."""
+        dialect_insert = self._dialect_insert()
+        for (user_id, day, status), (count, last_at, last_id) in self._rollup_deltas(apps).items():
+            if dialect_insert is not None:
+                stmt = dialect_insert(ApplicationDailyCount).values(
+                    user_id=user_id,
+                    day=day,
+                    status=status,
+                    count=count,
+                    last_at=last_at,
+                    last_application_id=last_id,
+                )
+                newer = or_(
+                    ApplicationDailyCount.last_at.is_(None),
+                    stmt.excluded.last_at >= ApplicationDailyCount.last_at,
+                )
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[
+                        ApplicationDailyCount.user_id,
+                        ApplicationDailyCount.day,
+                        ApplicationDailyCount.status,
+                    ],
+                    set_={
+                        "count": ApplicationDailyCount.count + stmt.excluded.count,
+                        "last_at": case((newer, stmt.excluded.last_at), else_=ApplicationDailyCount.last_at),
+                        "last_application_id": case(
+                            (newer, stmt.excluded.last_application_id),
+                            else_=ApplicationDailyCount.last_application_id,
+                        ),
+                    },
+                )
+                session.execute(stmt)
+                continue
+            row = session.get(ApplicationDailyCount, (user_id, day, status))
+            if row is None:
+                session.add(
+                    ApplicationDailyCount(
+                        user_id=user_id,
+                        day=day,
+                        status=status,
+                        count=count,
+                        last_at=last_at,
+                        last_application_id=last_id,
+                    )
+                )
+                continue
+            row.count = (row.count or 0) + count
+            if row.last_at is None or last_at >= _as_utc(row.last_at):
+                row.last_at, row.last_application_id = last_at, last_id
+
+    def rebuild_application_rollup(self, user_id: str | None = None) -> int:
+        """Recompute ``application_daily_counts`` from ``applications`` (one user or all).
+
+        Runs in one transaction. On SQLite the DELETE takes the write lock
+        first, so concurrent ``log_applications`` calls land before the
+        recount or after it; on Postgres run it while bot workers are idle.
+        Returns the number of rollup rows written.
+        """
         with self.get_session() as session:
-            app = Application(user_id=user_id, **kwargs)
-            session.add(app)
+            delete_q = session.query(ApplicationDailyCount)
+            apps_q = select(
+                Application.id, Application.user_id, Application.status, Application.timestamp
+            )
+            if user_id is not None:
+                delete_q = delete_q.filter(ApplicationDailyCount.user_id == user_id)
+                apps_q = apps_q.where(Application.user_id == user_id)
+            delete_q.delete(synchronize_session=False)
+            deltas = self._rollup_deltas(
+                row
+                for row in session.execute(apps_q.execution_options(yield_per=5000))
+                if row.timestamp is not None and row.status is not None
+            )
+            session.add_all(
+                ApplicationDailyCount(
+                    user_id=uid,
+                    day=day,
+                    status=status,
+                    count=count,
+                    last_at=last_at,
+                    last_application_id=last_id,
+                )
+                for (uid, day, status), (count, last_at, last_id) in deltas.items()
+            )
             session.commit()
+            return len(deltas)
 
     def get_monthly_application_count(self, user_id):
+        """Applies in the last 30 days: whole days from the rollup, the cutoff day exactly."""
         thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
+        cutoff_day = thirty_days_ago.date()
+        next_day = datetime.combine(cutoff_day + timedelta(days=1), datetime.min.time(), tzinfo=timezone.utc)
         with self.get_session() as session:
-            count = session.query(func.count(Application.id)).filter(
+            whole_days = session.query(func.sum(ApplicationDailyCount.count)).filter(
+                ApplicationDailyCount.user_id == user_id,
+                ApplicationDailyCount.status == 'applied',
+                ApplicationDailyCount.day > cutoff_day.isoformat(),
+            ).scalar()
+            partial_day = session.query(func.count(Application.id)).filter(
                 Application.user_id == user_id,
                 Application.status == 'applied',
-                Application.timestamp >= thirty_days_ago
+                Application.timestamp >= thirty_days_ago,
+                Application.timestamp < next_day,
             ).scalar()
-            return count or 0
+            return int(whole_days or 0) + (partial_day or 0)
 
     def get_application_stats(self, user_id):
         with self.get_session() as session:
-            stats = session.query(
-                func.count(Application.id).label('total'),
-                func.sum(case((Application.status == 'applied', 1), else_=0)).label('applied'),
-                func.sum(case((Application.status == 'skipped', 1), else_=0)).label('skipped'),
-                func.sum(case((Application.status == 'failed', 1), else_=0)).label('failed')
-            ).filter(Application.user_id == user_id).first()
-            
+            by_status = dict(
+                session.query(ApplicationDailyCount.status, func.sum(ApplicationDailyCount.count))
+                .filter(ApplicationDailyCount.user_id == user_id)
+                .group_by(ApplicationDailyCount.status)
+                .all()
+            )
             return {
-                "total": stats.total or 0,
-                "applied": int(stats.applied or 0),
-                "skipped": int(stats.skipped or 0),
-                "failed": int(stats.failed or 0)
+                "total": int(sum(v or 0 for v in by_status.values())),
+                "applied": int(by_status.get('applied') or 0),
+                "skipped": int(by_status.get('skipped') or 0),
+                "failed": int(by_status.get('failed') or 0)
             }
 
-    def get_recent_applications(self, user_id, limit=20):
+    def list_applications(
+        self,
+        user_id: str,
+        *,
+        limit: int = 50,
+        before_id: int | None = None,
+        statuses: list[str] | None = None,
+        company: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        include: tuple[str, ...] | list[str] = (),
+    ) -> list[dict]:
+        """Newest-first application history page with filters and a light projection.
+
+        Keyset pagination on ``(timestamp, id)``: pass the last id of the
+        previous page as ``before_id``. ``company`` is a case-insensitive
+        substring, ``since`` inclusive and ``until`` exclusive. Heavy text
+        columns are only selected when named in ``include``.
+        """
+        names = list(APPLICATION_LIST_COLUMNS) + [c for c in APPLICATION_HEAVY_COLUMNS if c in include]
+        columns = [getattr(Application, name) for name in names]
         with self.get_session() as session:
-            apps = session.query(Application).filter(
-                Application.user_id == user_id
-            ).order_by(Application.timestamp.desc()).limit(limit).all()
-
-            rows = []
-            for app in apps:
-                d = {c.name: getattr(app, c.name) for c in app.__table__.columns}
-                d["timestamp"] = _ts_to_utc_iso(d.get("timestamp"))
-                rows.append(d)
-            return rows
+            q = session.query(*columns).filter(Application.user_id == user_id)
+            if statuses:
+                q = q.filter(Application.status.in_(statuses))
+            if company:
+                pattern = company.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                q = q.filter(Application.company.ilike(f"%{pattern}%", escape="\\"))
+            if since is not None:
+                q = q.filter(Application.timestamp >= since)
+            if until is not None:
+                q = q.filter(Application.timestamp < until)
+            if before_id is not None:
+                anchor = (
+                    session.query(Application.timestamp)
+                    .filter(Application.id == before_id, Application.user_id == user_id)
+                    .scalar_subquery()
+                )
+                # The redundant ``<=`` lets the index seek to the anchor
+                # instead of walking (and discarding) every newer row.
+                q = q.filter(
+                    Application.timestamp <= anchor,
+                    or_(
+                        Application.timestamp < anchor,
+                        and_(Application.timestamp == anchor, Application.id < before_id),
+                    ),
+                )
+            rows = (
+                q.order_by(Application.timestamp.desc(), Application.id.desc())
+                .limit(limit)
+                .all()
+            )
+        out = []
+        for row in rows:
+            d = dict(zip(names, row))
+            d["timestamp"] = _ts_to_utc_iso(d.get("timestamp"))
+            out.append(d)
+        return out
 
     def get_last_activity_snapshot(self, user_id: str):
         """Latest successful apply and latest failure for the dashboard home story."""
-        with self.get_session() as session:
-            applied = (
-                session.query(Application)
-                .filter(Application.user_id == user_id, Application.status == "applied")
-                .order_by(Application.timestamp.desc())
+
+        def latest(session, status):
+            day = (
+                session.query(ApplicationDailyCount.last_application_id)
+                .filter(ApplicationDailyCount.user_id == user_id, ApplicationDailyCount.status == status)
+                .order_by(ApplicationDailyCount.day.desc())
                 .first()
             )
-            failed = (
+            if day is None:
+                return None
+            app = session.get(Application, day.last_application_id) if day.last_application_id else None
+            if app is not None:
+                return app
+            return (
                 session.query(Application)
-                .filter(Application.user_id == user_id, Application.status == "failed")
+                .filter(Application.user_id == user_id, Application.status == status)
                 .order_by(Application.timestamp.desc())
                 .first()
             )
 
+        with self.get_session() as session:
+            applied = latest(session, "applied")
+            failed = latest(session, "failed")
+
         def pack(app):
             if not app:
                 return None
@@ -541,6 +967,83 @@ class DatabaseManager:
 
         return {"last_applied": pack(applied), "last_failed": pack(failed)}
 
+    def get_cached_ai_answer(self, user_id, cache_key, *, max_age_days=None):
+        """Return a cached LLM answer (and bump its LRU stamp) or ``None``.
+
+        Rows older than ``max_age_days`` are treated as misses and deleted.
+        """
+        now = datetime.now(timezone.utc)
+        with self.get_session() as session:
+            row = session.get(AiAnswerCache, (user_id, cache_key))
+            if row is None:
+                return None
+            created = row.created_at
+            if created is not None and created.tzinfo is None:
+                created = created.replace(tzinfo=timezone.utc)
+            if (
+                max_age_days is not None
+                and created is not None
+                and created < now - timedelta(days=max_age_days)
+            ):
+                session.delete(row)
+                session.commit()
+                return None
+            row.hits = (row.hits or 0) + 1
+            row.last_used_at = now
+            answer = row.answer
+            session.commit()
+            return answer
+
+    def put_cached_ai_answer(
+        self,
+        user_id,
+        cache_key,
+        *,
+        question,
+        question_type,
+        answer,
+        max_entries=None,
+    ):
+        """Store an LLM answer; evicts least-recently-used rows beyond ``max_entries``."""
+        now = datetime.now(timezone.utc)
+        with self.get_session() as session:
+            row = session.get(AiAnswerCache, (user_id, cache_key))
+            if row:
+                row.answer = answer
+                row.question = question
+                row.question_type = question_type
+                row.created_at = now
+                row.last_used_at = now
+            else:
+                session.add(
+                    AiAnswerCache(
+                        user_id=user_id,
+                        cache_key=cache_key,
+                        question=question,
+                        question_type=question_type,
+                        answer=answer,
+                        hits=0,
+                        created_at=now,
+                        last_used_at=now,
+                    )
+                )
+            session.flush()
+            if max_entries is not None and max_entries > 0:
+                stale_keys = [
+                    r[0]
+                    for r in session.query(AiAnswerCache.cache_key)
+                    .filter(AiAnswerCache.user_id == user_id)
+                    .order_by(AiAnswerCache.last_used_at.desc())
+                    .offset(max_entries)
+                    .all()
+                ]
+                if stale_keys:
+                    session.query(AiAnswerCache).filter(
+                        AiAnswerCache.user_id == user_id,
+                        AiAnswerCache.cache_key.in_(stale_keys),
+                    ).delete(synchronize_session=False)
+            session.commit()
+
     def set_user_session(self, user_id, cookies_dict):
         cookies_json = json.dumps(cookies_dict)
         encrypted_cookies = encrypt_data(cookies_json)
@@ -553,6 +1056,7 @@ class DatabaseManager:
                 sess = UserSession(user_id=user_id, cookies_blob=encrypted_cookies)
                 session.add(sess)
             session.commit()
+        self.bump_user_version(user_id)
 
     def get_user_session(self, user_id):
         with self.get_session() as session:
@@ -674,7 +1178,10 @@ class DatabaseManager:
                 )
             )
             session.commit()
-            return int(result.rowcount or 0)
+            changed = int(result.rowcount or 0)
+        if changed:
+            self.bump_user_version(None)
+        return changed
 
     def create_automation_task(
         self,
@@ -698,6 +1205,7 @@ class DatabaseManager:
             )
             session.add(row)
             session.commit()
+        self.bump_user_version(user_id)
 
     def finalize_automation_task(self, task_id, exit_code, status=None):
         """Record exit code / status when the subprocess ends or is stopped."""
@@ -711,7 +1219,9 @@ class DatabaseManager:
                 row.status = status
             else:
                 row.status = "completed" if exit_code == 0 else "failed"
+            user_id = row.user_id
             session.commit()
+        self.bump_user_version(user_id)
 
     def get_automation_task(self, task_id):
         with self.get_session() as session:
@@ -846,6 +1356,287 @@ class DatabaseManager:
             "account_username": row.account_username,
         }
 
+    # ------------------------------------------------------------------
+    # Connect campaigns (saved search presets + per-run history)
+    # ------------------------------------------------------------------
+
+    _CONNECT_CAMPAIGN_FIELDS = (
+        "name",
+        "query",
+        "max_connects",
+        "note",
+        "schedule_enabled",
+        "schedule_time",
+        "daily_max",
+        "enabled",
+        "created_at",
+        "updated_at",
+    )
+
+    @staticmethod
+    def _connect_run_to_dict(row: ConnectCampaignRun) -> dict:
+        return {
+            "task_id": row.task_id,
+            "started_at": row.started_at,
+            "ended_at": row.ended_at,
+            "status": row.status,
+            "exit_code": row.exit_code,
+            "sent": int(row.sent or 0),
+            "skipped": int(row.skipped or 0),
+            "source": row.source,
+        }
+
+    @staticmethod
+    def _connect_campaign_to_dict(row: ConnectCampaign, runs: list[dict]) -> dict:
+        try:
+            bio_keywords = json.loads(row.bio_keywords_json) if row.bio_keywords_json else None
+        except json.JSONDecodeError:
+            bio_keywords = None
+        return {
+            "id": row.id,
+            "name": row.name,
+            "query": row.query,
+            "max_connects": row.max_connects,
+            "bio_keywords": bio_keywords,
+            "note": row.note,
+            "schedule_enabled": bool(row.schedule_enabled),
+            "schedule_time": row.schedule_time,
+            "daily_max": row.daily_max,
+            "enabled": bool(row.enabled),
+            "created_at": row.created_at,
+            "updated_at": row.updated_at,
+            "last_run_at": row.last_run_at,
+            "last_task_id": row.last_task_id,
+            "totals": {
+                "runs": int(row.runs_total or 0),
+                "sent": int(row.sent_total or 0),
+                "skipped": int(row.skipped_total or 0),
+            },
+            "runs": runs,
+        }
+
+    def _connect_runs_by_campaign(self, session, campaign_ids: list[str], limit: int) -> dict[str, list[dict]]:
+        """Newest ``limit`` runs per campaign, one query for all of them."""
+        out: dict[str, list[dict]] = {cid: [] for cid in campaign_ids}
+        if not campaign_ids or limit <= 0:
+            return out
+        rows = (
+            session.query(ConnectCampaignRun)
+            .filter(ConnectCampaignRun.campaign_id.in_(campaign_ids))
+            .order_by(ConnectCampaignRun.started_at.desc(), ConnectCampaignRun.id.desc())
+            .all()
+        )
+        for row in rows:
+            runs = out[row.campaign_id]
+            if len(runs) < limit:
+                runs.append(self._connect_run_to_dict(row))
+        return out
+
+    def list_connect_campaigns(self, user_id: str, *, run_limit: int = 50) -> list[dict]:
+        """A user's campaigns, most recently updated first, with recent runs."""
+        with self.get_session() as session:
+            rows = (
+                session.query(ConnectCampaign)
+                .filter(ConnectCampaign.user_id == user_id)
+                .order_by(ConnectCampaign.updated_at.desc())
+                .all()
+            )
+            runs = self._connect_runs_by_campaign(session, [r.id for r in rows], run_limit)
+            return [self._connect_campaign_to_dict(r, runs[r.id]) for r in rows]
+
+    def get_connect_campaign(self, user_id: str, campaign_id: str, *, run_limit: int = 50) -> dict | None:
+        with self.get_session() as session:
+            row = session.get(ConnectCampaign, campaign_id)
+            if row is None or row.user_id != user_id:
+                return None
+            runs = self._connect_runs_by_campaign(session, [row.id], run_limit)
+            return self._connect_campaign_to_dict(row, runs[row.id])
+
+    def save_connect_campaign(self, user_id: str, campaign: dict) -> None:
+        """Insert or update a campaign's definition (run history/totals untouched)."""
+        with self.get_session() as session:
+            row = session.get(ConnectCampaign, campaign["id"])
+            if row is None:
+                row = ConnectCampaign(id=campaign["id"], user_id=user_id)
+                session.add(row)
+            elif row.user_id != user_id:
+                raise KeyError(campaign["id"])
+            for field in self._CONNECT_CAMPAIGN_FIELDS:
+                setattr(row, field, campaign.get(field))
+            bio_keywords = campaign.get("bio_keywords")
+            row.bio_keywords_json = json.dumps(bio_keywords) if bio_keywords else None
+            session.commit()
+        self.bump_user_version(user_id)
+
+    def import_connect_campaign(self, user_id: str, campaign: dict) -> bool:
+        """Copy a legacy (config-blob) campaign, its totals and runs; False if it exists."""
+        with self.get_session() as session:
+            if session.get(ConnectCampaign, campaign["id"]) is not None:
+                return False
+            totals = campaign.get("totals") or {}
+            bio_keywords = campaign.get("bio_keywords")
+            row = ConnectCampaign(
+                id=campaign["id"],
+                user_id=user_id,
+                bio_keywords_json=json.dumps(bio_keywords) if bio_keywords else None,
+                last_run_at=campaign.get("last_run_at"),
+                last_task_id=campaign.get("last_task_id"),
+                runs_total=int(totals.get("runs") or 0),
+                sent_total=int(totals.get("sent") or 0),
+                skipped_total=int(totals.get("skipped") or 0),
+                **{f: campaign.get(f) for f in self._CONNECT_CAMPAIGN_FIELDS},
+            )
+            session.add(row)
+            for run in campaign.get("runs") or []:
+                if not isinstance(run, dict) or not run.get("task_id"):
+                    continue
+                session.add(
+                    ConnectCampaignRun(
+                        campaign_id=row.id,
+                        user_id=user_id,
+                        task_id=run["task_id"],
+                        source=run.get("source") or "manual",
+                        status=run.get("status") or "running",
+                        exit_code=run.get("exit_code"),
+                        sent=int(run.get("sent") or 0),
+                        skipped=int(run.get("skipped") or 0),
+                        started_at=run.get("started_at"),
+                        ended_at=run.get("ended_at"),
+                    )
+                )
+            session.commit()
+        self.bump_user_version(user_id)
+        return True
+
+    def delete_connect_campaign(self, user_id: str, campaign_id: str) -> bool:
+        with self.get_session() as session:
+            deleted = (
+                session.query(ConnectCampaign)
+                .filter(ConnectCampaign.id == campaign_id, ConnectCampaign.user_id == user_id)
+                .delete(synchronize_session=False)
+            )
+            if not deleted:
+                return False
+            session.query(ConnectCampaignRun).filter(
+                ConnectCampaignRun.campaign_id == campaign_id
+            ).delete(synchronize_session=False)
+            session.commit()
+        self.bump_user_version(user_id)
+        return True
+
+    def start_connect_campaign_run(
+        self,
+        user_id: str,
+        campaign_id: str,
+        task_id: str,
+        *,
+        started_at: str,
+        source: str = "manual",
+        keep_runs: int = 50,
+    ) -> bool:
+        """Append a running run, bump ``totals.runs`` and trim history to ``keep_runs``."""
+        with self.get_session() as session:
+            updated = session.execute(
+                update(ConnectCampaign)
+                .where(ConnectCampaign.id == campaign_id, ConnectCampaign.user_id == user_id)
+                .values(
+                    last_run_at=started_at,
+                    last_task_id=task_id,
+                    updated_at=started_at,
+                    runs_total=func.coalesce(ConnectCampaign.runs_total, 0) + 1,
+                )
+            ).rowcount
+            if not updated:
+                return False
+            session.add(
+                ConnectCampaignRun(
+                    campaign_id=campaign_id,
+                    user_id=user_id,
+                    task_id=task_id,
+                    source=source,
+                    status="running",
+                    started_at=started_at,
+                )
+            )
+            session.flush()
+            stale_ids = [
+                r[0]
+                for r in session.query(ConnectCampaignRun.id)
+                .filter(ConnectCampaignRun.campaign_id == campaign_id)
+                .order_by(ConnectCampaignRun.started_at.desc(), ConnectCampaignRun.id.desc())
+                .offset(keep_runs)
+                .all()
+            ]
+            if stale_ids:
+                session.query(ConnectCampaignRun).filter(
+                    ConnectCampaignRun.id.in_(stale_ids)
+                ).delete(synchronize_session=False)
+            session.commit()
+        self.bump_user_version(user_id)
+        return True
+
+    def finish_connect_campaign_run(
+        self,
+        task_id: str,
+        *,
+        user_id: str,
+        ended_at: str,
+        status: str | None,
+        exit_code: int | None,
+        sent: int,
+        skipped: int,
+    ) -> bool:
+        """Close the open run for ``task_id`` and add its counts to the campaign totals.
+
+        Returns False when there is no open run (not a campaign task, or
+        already finished), so repeated finish calls don't double count.
+        """
+        with self.get_session() as session:
+            run = (
+                session.query(ConnectCampaignRun)
+                .filter(
+                    ConnectCampaignRun.task_id == task_id,
+                    ConnectCampaignRun.user_id == user_id,
+                    ConnectCampaignRun.ended_at.is_(None),
+                )
+                .first()
+            )
+            if run is None:
+                return False
+            run.ended_at = ended_at
+            run.status = status or run.status or "completed"
+            run.exit_code = exit_code
+            run.sent = sent
+            run.skipped = skipped
+            session.execute(
+                update(ConnectCampaign)
+                .where(ConnectCampaign.id == run.campaign_id)
+                .values(
+                    sent_total=func.coalesce(ConnectCampaign.sent_total, 0) + sent,
+                    skipped_total=func.coalesce(ConnectCampaign.skipped_total, 0) + skipped,
+                    updated_at=ended_at,
+                )
+            )
+            session.commit()
+        self.bump_user_version(user_id)
+        return True
+
+    def list_scheduled_connect_campaigns(self, schedule_time: str | None = None) -> list[tuple[str, dict]]:
+        """``(user_id, campaign)`` for enabled campaigns with a daily schedule.
+
+        Served by ``ix_connect_campaigns_schedule`` (optionally narrowed to one
+        ``HH:MM``); run history is not loaded, the scheduler only needs
+        ``last_run_at``.
+        """
+        with self.get_session() as session:
+            q = session.query(ConnectCampaign).filter(
+                ConnectCampaign.schedule_enabled.is_(True),
+                ConnectCampaign.enabled.is_(True),
+            )
+            if schedule_time is not None:
+                q = q.filter(ConnectCampaign.schedule_time == schedule_time)
+            return [(r.user_id, self._connect_campaign_to_dict(r, [])) for r in q.all()]
+
     def create_feedback(
         self,
         *,
@@ -932,29 +1723,52 @@ class DatabaseManager:
             "replies": replies,
         }
 
-    def list_community_posts(self, *, limit: int = 50) -> list[dict]:
+    def list_community_posts(
+        self, *, limit: int = 50, before_id: int | None = None
+    ) -> list[dict]:
+        """Newest-first threads with their replies (two queries total).
+
+        Keyset pagination on ``(created_at, id)``: pass the last post id of the
+        previous page as ``before_id`` to get the next page without OFFSET.
+        """
         with self.SessionLocal() as session:
+            q = session.query(CommunityPost)
+            if before_id is not None:
+                anchor = (
+                    session.query(CommunityPost.created_at)
+                    .filter(CommunityPost.id == before_id)
+                    .scalar_subquery()
+                )
+                q = q.filter(
+                    or_(
+                        CommunityPost.created_at < anchor,
+                        and_(
+                            CommunityPost.created_at == anchor,
+                            CommunityPost.id < before_id,
+                        ),
+                    )
+                )
             posts = (
-                session.query(CommunityPost)
-                .order_by(CommunityPost.created_at.desc())
+                q.order_by(CommunityPost.created_at.desc(), CommunityPost.id.desc())
                 .limit(limit)
                 .all()
             )
-            result = []
-            for post in posts:
+            replies_by_post: dict[int, list[dict]] = {post.id: [] for post in posts}
+            if replies_by_post:
                 replies = (
                     session.query(CommunityReply)
-                    .filter(CommunityReply.post_id == post.id)
-                    .order_by(CommunityReply.created_at.asc())
+                    .filter(CommunityReply.post_id.in_(list(replies_by_post)))
+                    .order_by(CommunityReply.created_at.asc(), CommunityReply.id.asc())
                     .all()
                 )
-                result.append(
-                    self._community_post_to_dict(
-                        post,
-                        [self._community_reply_to_dict(r) for r in replies],
+                for reply in replies:
+                    replies_by_post[reply.post_id].append(
+                        self._community_reply_to_dict(reply)
                     )
-                )
-            return result
+            return [
+                self._community_post_to_dict(post, replies_by_post[post.id])
+                for post in posts
+            ]
 
     def get_community_post(self, post_id: int) -> dict | None:
         with self.SessionLocal() as session:
@@ -1,4 +1,9 @@
-"""PyInstaller entrypoint for the LinkdApply Tauri desktop sidecar."""
+"""PyInstaller entrypoint for the LinkdApply Tauri desktop sidecar.
+
+Every mode imports only what it runs: bot workers, the supervisor and
+automation subprocesses never load uvicorn, ``server`` or its routers
+(``tests/test_backend_entry_imports.py`` guards the worker cold start).
+"""
 
 import os
 import sys
@@ -38,9 +43,15 @@ def _bootstrap_automation_logging() -> None:
 if getattr(sys, "frozen", False):
     os.chdir(get_runtime_writable_root())
 
-import uvicorn  # noqa: E402
 
-from server import app  # noqa: E402
+def _run_api_server() -> None:
+    import uvicorn
+
+    from server import app
+
+    host = os.getenv("LINKDAPPLY_API_HOST", "127.0.0.1")
+    port = int(os.getenv("LINKDAPPLY_API_PORT", "8000"))
+    uvicorn.run(app, host=host, port=port, log_level="info")
 
 
 def main() -> None:
@@ -64,9 +75,7 @@ def main() -> None:
         sys.exit(automation_main())
         return
 
-    host = os.getenv("LINKDAPPLY_API_HOST", "127.0.0.1")
-    port = int(os.getenv("LINKDAPPLY_API_PORT", "8000"))
-    uvicorn.run(app, host=host, port=port, log_level="info")
+    _run_api_server()
 
 
 if __name__ == "__main__":
@@ -42,6 +42,28 @@ def setup_logging(debug: bool = False) -> None:
     )
 
 
+def write_result(command: str, results: dict, exit_code: int) -> None:
+    """Write the command's result dict to ``LINKDAPPLY_AUTOMATION_RESULT``.
+
+    The backend sets that env var to a JSON sidecar next to the task log and
+    reads it when the task ends instead of parsing the log. Written to a temp
+    file and renamed, so a reader never sees a partial document.
+    """
+    import os
+
+    path = os.getenv("LINKDAPPLY_AUTOMATION_RESULT", "").strip()
+    if not path:
+        return
+    payload = {"command": command, "exit_code": exit_code, "results": results}
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh, default=str)
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        logging.warning("Could not write result file %s: %s", path, exc)
+
+
 def main() -> int:
     """Main entry point for the LinkedIn bot."""
     try:
@@ -63,6 +85,7 @@ def main() -> int:
             config.HEADLESS = True
 
         exit_code = 0
+        results = None
 
         if args.command == "post":
             if args.post_text:
@@ -134,6 +157,9 @@ def main() -> int:
             if results.get("errors"):
                 exit_code = 1
 
+        if results is not None:
+            write_result(args.command, results, exit_code)
+
         bot.close()
         if exit_code:
             logging.info("LinkedIn Bot finished with exit code %s", exit_code)
@@ -205,7 +205,7 @@ def _setup_scan_opportunities_parser(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--output",
         default="opportunities.json",
-        help="JSON file to write results to",
+        help="JSON file to write results to (a .jsonl name streams one line per find)",
     )
     parser.add_argument(
         "--require-contact",
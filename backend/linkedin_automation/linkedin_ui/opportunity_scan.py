@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import re
 import time
 from datetime import datetime, timezone
@@ -12,6 +13,7 @@ from typing import Any, Dict, List, Optional, Set
 from selenium.webdriver.common.by import By
 
 from .. import config
+from ..scan_output import is_stream_output, progress_path_for
 from .engage_dom import EngageDomMixin
 from .engage_utils import pause_between
 
@@ -95,6 +97,10 @@ _URL_PRIORITY_FRAGMENTS = (
     "application",
 )
 
+# Streaming mode (``--output *.jsonl``): rewrite the progress header at most
+# this often; every opportunity is still appended and flushed immediately.
+_PROGRESS_INTERVAL_SECONDS = 5.0
+
 
 class OpportunityScanMixin(EngageDomMixin):
     """Scroll the home feed and collect job / intern opportunities from posts."""
@@ -112,6 +118,10 @@ class OpportunityScanMixin(EngageDomMixin):
         By default, posts that match hiring keywords are saved even when no
         email or apply URL is found (``has_contact=false`` on the entry).
         Pass ``require_contact=True`` to keep only posts with emails or URLs.
+
+        A ``.jsonl`` ``output_file`` streams: each opportunity is appended as
+        one line and the counters go to ``progress_path_for(output_file)``.
+        Any other name gets the full JSON snapshot rewritten after each find.
         """
         results: Dict[str, Any] = {
             "posts_scanned": 0,
@@ -139,14 +149,22 @@ class OpportunityScanMixin(EngageDomMixin):
         stalled = 0
         stall_budget = 10
         started_at = datetime.now(timezone.utc).isoformat()
+        stream = is_stream_output(output_file)
+        progress_written = time.monotonic()
 
-        self._persist_opportunities(
-            output_file,
-            opportunities,
-            posts_scanned=0,
-            started_at=started_at,
-            in_progress=True,
-        )
+        if stream:
+            open(output_file, "w", encoding="utf-8").close()
+            self._write_opportunity_progress(
+                output_file, found=0, posts_scanned=0, started_at=started_at, in_progress=True
+            )
+        else:
+            self._persist_opportunities(
+                output_file,
+                opportunities,
+                posts_scanned=0,
+                started_at=started_at,
+                in_progress=True,
+            )
 
         while results["posts_scanned"] < max_posts and stalled < stall_budget:
             posts = self._find_visible_posts(limit=12)
@@ -215,13 +233,25 @@ class OpportunityScanMixin(EngageDomMixin):
                     urls,
                 )
                 try:
-                    self._persist_opportunities(
-                        output_file,
-                        opportunities,
-                        posts_scanned=results["posts_scanned"],
-                        started_at=started_at,
-                        in_progress=True,
-                    )
+                    if not stream:
+                        self._persist_opportunities(
+                            output_file,
+                            opportunities,
+                            posts_scanned=results["posts_scanned"],
+                            started_at=started_at,
+                            in_progress=True,
+                        )
+                    else:
+                        self._append_opportunity(output_file, entry)
+                        if time.monotonic() - progress_written >= _PROGRESS_INTERVAL_SECONDS:
+                            self._write_opportunity_progress(
+                                output_file,
+                                found=len(opportunities),
+                                posts_scanned=results["posts_scanned"],
+                                started_at=started_at,
+                                in_progress=True,
+                            )
+                            progress_written = time.monotonic()
                 except OSError as exc:
                     results["errors"].append(
                         f"Could not write {output_file}: {exc}"
@@ -243,13 +273,22 @@ class OpportunityScanMixin(EngageDomMixin):
         results["success"] = True
 
         try:
-            self._persist_opportunities(
-                output_file,
-                opportunities,
-                posts_scanned=results["posts_scanned"],
-                started_at=started_at,
-                in_progress=False,
-            )
+            if stream:
+                self._write_opportunity_progress(
+                    output_file,
+                    found=len(opportunities),
+                    posts_scanned=results["posts_scanned"],
+                    started_at=started_at,
+                    in_progress=False,
+                )
+            else:
+                self._persist_opportunities(
+                    output_file,
+                    opportunities,
+                    posts_scanned=results["posts_scanned"],
+                    started_at=started_at,
+                    in_progress=False,
+                )
             logging.info(
                 "OPPORTUNITY saved count=%d file=%s", results["found"], output_file
             )
@@ -293,6 +332,39 @@ class OpportunityScanMixin(EngageDomMixin):
                 output_file,
             )
 
+    def _append_opportunity(self, output_file: str, entry: Dict[str, Any]) -> None:
+        """Append one opportunity as a JSON line (streaming mode)."""
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with open(output_file, "a", encoding="utf-8") as fh:
+            fh.write(line)
+            fh.flush()
+
+    def _write_opportunity_progress(
+        self,
+        output_file: str,
+        *,
+        found: int,
+        posts_scanned: int,
+        started_at: str,
+        in_progress: bool,
+    ) -> None:
+        """Atomically rewrite the small header next to a ``.jsonl`` output."""
+        now = datetime.now(timezone.utc).isoformat()
+        payload = {
+            "output_file": os.path.basename(output_file),
+            "format": "jsonl",
+            "started_at": started_at,
+            "updated_at": now,
+            "posts_scanned": posts_scanned,
+            "found": found,
+            "in_progress": in_progress,
+        }
+        path = progress_path_for(output_file)
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh, ensure_ascii=False)
+        os.replace(tmp, path)
+
     def _navigate_opportunity_feed(self) -> None:
         try:
             self.driver.get(config.LINKEDIN_FEED_URL)
@@ -0,0 +1,21 @@
+"""File naming shared by the opportunity scanner and the artifact endpoint.
+
+The scanner (``linkedin_ui.opportunity_scan``) writes these files and the API
+(``routes.linkedin_automation``) reads them back; both import the rules from
+here so they cannot drift apart. Standard library only, so the API server does
+not pull in Selenium to use it.
+"""
+
+from __future__ import annotations
+
+import os
+
+
+def is_stream_output(output_file: str) -> bool:
+    """True when ``output_file`` selects the append-only JSON Lines format."""
+    return output_file.lower().endswith(".jsonl")
+
+
+def progress_path_for(output_file: str) -> str:
+    """Header / progress file written next to a ``.jsonl`` scan output."""
+    return os.path.splitext(output_file)[0] + ".progress.json"
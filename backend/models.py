@@ -13,6 +13,12 @@ class Config(Base):
     category = Column(String)
     is_encrypted = Column(Integer, default=0)
 
+class ConfigVersion(Base):
+    """Per-user config write counter; lets other processes revalidate cached configs."""
+    __tablename__ = "config_versions"
+    user_id = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
 class Subscription(Base):
     __tablename__ = "subscriptions"
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -59,16 +65,59 @@ class Application(Base):
     answer_generated = Column(Text)
     timestamp = Column(DateTime(timezone=True), server_default=func.now())
 
-    # `(user_id, timestamp)` covers `get_recent_applications` and the
-    # `get_application_stats` user filter.
-    # `(user_id, status, timestamp)` covers `get_monthly_application_count`
-    # (user + applied + 30d window) and `get_last_activity_snapshot` (user +
-    # status ORDER BY timestamp).
+    # `(user_id, timestamp)` covers the `list_applications` keyset page.
+    # `(user_id, status, timestamp)` covers status-filtered history pages, the
+    # cutoff day of `get_monthly_application_count` and the
+    # `get_last_activity_snapshot` fallback (user + status ORDER BY timestamp).
     __table_args__ = (
         Index("ix_applications_user_timestamp", "user_id", "timestamp"),
         Index("ix_applications_user_status_ts", "user_id", "status", "timestamp"),
     )
 
+class ApplicationDailyCount(Base):
+    """Rollup of ``applications``: row count per user, UTC day and status.
+
+    Maintained by ``log_applications`` in the insert transaction and rebuilt
+    by ``rebuild_application_rollup`` (``backfill_application_rollup.py``), so
+    dashboard stats read O(days) rows instead of the full history.
+    ``last_application_id`` is the newest row of that day and status.
+    """
+    __tablename__ = "application_daily_counts"
+    user_id = Column(String, primary_key=True)
+    day = Column(String, primary_key=True)  # YYYY-MM-DD, UTC
+    status = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+    last_at = Column(DateTime(timezone=True))
+    last_application_id = Column(Integer)
+
+    # The primary key serves per-user totals and the 30-day window; `(user_id,
+    # status, day)` finds the latest day with an apply / failure.
+    __table_args__ = (
+        Index("ix_application_daily_counts_user_status_day", "user_id", "status", "day"),
+    )
+
+class AiAnswerCache(Base):
+    """LLM answers to Easy Apply screening questions, reused across postings.
+
+    ``cache_key`` is a hash of the normalised question label and question
+    type (see ``services.ai_answer_cache``), so the same question asked by
+    different employers maps to one row per user.
+    """
+    __tablename__ = "ai_answer_cache"
+    user_id = Column(String, primary_key=True)
+    cache_key = Column(String, primary_key=True)
+    question = Column(Text)
+    question_type = Column(String)
+    answer = Column(Text, nullable=False)
+    hits = Column(Integer, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_used_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # `(user_id, last_used_at)` drives LRU eviction once a user's cache is full.
+    __table_args__ = (
+        Index("ix_ai_answer_cache_user_used", "user_id", "last_used_at"),
+    )
+
 class UserSession(Base):
     __tablename__ = "user_sessions"
     user_id = Column(String, primary_key=True)
@@ -160,3 +209,56 @@ class CommunityReply(Base):
     __table_args__ = (
         Index("ix_community_replies_post", "post_id", "created_at"),
     )
+
+
+class ConnectCampaign(Base):
+    """Saved LinkedIn Connect search preset (``services.connect_campaigns``).
+
+    Timestamps are ISO-8601 strings, exactly as the API returns them.
+    """
+    __tablename__ = "connect_campaigns"
+    id = Column(String, primary_key=True)
+    user_id = Column(String, nullable=False)
+    name = Column(String, nullable=False)
+    query = Column(Text, nullable=False)
+    max_connects = Column(Integer, default=10)
+    bio_keywords_json = Column(Text)
+    note = Column(Text)
+    schedule_enabled = Column(Boolean, default=False)
+    schedule_time = Column(String)  # HH:MM, UTC
+    daily_max = Column(Integer)
+    enabled = Column(Boolean, default=True)
+    created_at = Column(String)
+    updated_at = Column(String)
+    last_run_at = Column(String)
+    last_task_id = Column(String)
+    runs_total = Column(Integer, default=0)
+    sent_total = Column(Integer, default=0)
+    skipped_total = Column(Integer, default=0)
+
+    # `(user_id, updated_at)` → list_connect_campaigns (newest first).
+    # `(schedule_enabled, schedule_time)` → the scheduler's due-campaign query.
+    __table_args__ = (
+        Index("ix_connect_campaigns_user_updated", "user_id", "updated_at"),
+        Index("ix_connect_campaigns_schedule", "schedule_enabled", "schedule_time"),
+    )
+
+
+class ConnectCampaignRun(Base):
+    __tablename__ = "connect_campaign_runs"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    campaign_id = Column(String, nullable=False)
+    user_id = Column(String, nullable=False)
+    task_id = Column(String, nullable=False)
+    source = Column(String, default="manual")  # manual | schedule
+    status = Column(String, default="running")
+    exit_code = Column(Integer)
+    sent = Column(Integer, default=0)
+    skipped = Column(Integer, default=0)
+    started_at = Column(String)
+    ended_at = Column(String)
+
+    __table_args__ = (
+        Index("ix_connect_campaign_runs_campaign", "campaign_id", "started_at"),
+        Index("ix_connect_campaign_runs_task", "task_id"),
+    )
@@ -13,7 +13,12 @@ from pprint import pprint
 
 from app_paths import get_logs_dir
 from config.config_bridge import *
-from utils.debug_logs import LEGACY_BOT_LOG, bot_log_path, log_file_path
+from utils.debug_logs import (
+    LEGACY_BOT_LOG,
+    bot_log_path,
+    buffered_log_sink,
+    log_file_path,
+)
 from utils.logger import logger as cloud_logger
 
 
@@ -103,22 +108,34 @@ def critical_error_log(possible_reason: str, stack_trace: Exception) -> None:
     print_lg(possible_reason, stack_trace, datetime.now(), from_critical=True)
 
 
+_log_path_cache: dict[tuple[str, str, str], str] = {}
+
+
 def get_log_path():
     """
     Log files live under get_logs_dir() (backend/logs in dev), not cwd.
     When BOT_ID is set (supervisor-spawned worker), logs go to bot-<id>.txt per profile.
+    * Resolved once per (BOT_ID, BOT_RUN_ID, LINKDAPPLY_USER_DATA) instead of on every message
     """
+    bid = os.getenv("BOT_ID", "").strip()
+    cache_key = (
+        bid,
+        os.getenv("BOT_RUN_ID", "").strip(),
+        os.getenv("LINKDAPPLY_USER_DATA", "").strip(),
+    )
+    cached = _log_path_cache.get(cache_key)
+    if cached:
+        return cached
     try:
-        bid = os.getenv("BOT_ID", "").strip()
-        if bid:
-            return bot_log_path(bid)
-        return log_file_path(LEGACY_BOT_LOG)
+        path = bot_log_path(bid) if bid else log_file_path(LEGACY_BOT_LOG)
     except Exception as e:
         critical_error_log(
             "Failed getting log path! So assigning fallback under app logs dir.",
             e,
         )
         return log_file_path(LEGACY_BOT_LOG)
+    _log_path_cache[cache_key] = path
+    return path
 
 
 def print_lg(
@@ -131,6 +148,8 @@ def print_lg(
     """
     Function to log and print. 
     Now integrates with Google Cloud Logging.
+    * File writes go through a shared buffered sink (one open handle, flushed on size / time / exit)
+    * `flush=True` or `from_critical=True` writes the buffer out immediately
     """
     try:
         combined_msg = " ".join([str(m) for m in msgs])
@@ -142,8 +161,10 @@ def print_lg(
             cloud_logger.info(combined_msg)
 
         # Still keep local file logging for redundancy/dev
-        with open(get_log_path(), "a+", encoding="utf-8") as file:
-            file.write(combined_msg + end)
+        sink = buffered_log_sink()
+        sink.write(get_log_path(), combined_msg + end)
+        if flush or from_critical:
+            sink.flush()
             
     except Exception as e:
         print(f"Logging error: {e}")
@@ -410,52 +431,40 @@ def get_chrome_version() -> int | None:
 def check_deal_breakers(description_text: str) -> tuple[bool, str]:
     """
     Scans the job description for deal-breaker phrases using Regex.
+    * Each list is compiled once (see `services.phrase_matcher`) so this is one pass per list
     Returns: (bool, str) -> (Should_Skip, Reason)
     """
-    import re
-    from config.config_bridge import (
-        visa_deal_breakers,
-        location_blacklists,
-        tech_blacklists,
-        education_blacklists,
-    )
+    from services.bot_config_cache import get_phrase_matchers
 
     try:
         from config.config_bridge import require_visa
     except ImportError:
         require_visa = False
 
-    text_lower = description_text.lower()
+    matchers = get_phrase_matchers()
 
     # 1. Check Visa/Citizenship (Only if you need a visa)
     if require_visa:
         # We only care about "US Citizen" requirements if we actually need a visa.
         # If require_visa is True, it means we DO need sponsorship, so we must skip "Citizenship Only" jobs.
-        for phrase in visa_deal_breakers:
-            # Check if it's a raw string regex or just text
-            if phrase.startswith(r"\\") or "\\" in phrase or "[" in phrase:
-                pattern = phrase  # It's already a regex
-            else:
-                # \b ensures we match whole words (e.g., avoids matching "reuse" when looking for "us")
-                pattern = r"\b" + re.escape(phrase) + r"\b"
-
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                return True, f"Visa Deal Breaker: Found '{phrase}'"
+        # Phrases containing a backslash or "[" are used as raw regex, others match whole words only.
+        phrase = matchers["visa_deal_breakers"].search(description_text)
+        if phrase:
+            return True, f"Visa Deal Breaker: Found '{phrase}'"
 
     # 2. Check Tech Stack Blacklist
-    for phrase in tech_blacklists:
-        pattern = r"\b" + re.escape(phrase) + r"\b"
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            return True, f"Tech Stack Deal Breaker: Found '{phrase}'"
+    phrase = matchers["tech_blacklists"].search(description_text)
+    if phrase:
+        return True, f"Tech Stack Deal Breaker: Found '{phrase}'"
 
     # 3. Check Location Strictness
-    for phrase in location_blacklists:
-        if phrase in text_lower:
-            return True, f"Location Deal Breaker: Found '{phrase}'"
+    phrase = matchers["location_blacklists"].search(description_text)
+    if phrase:
+        return True, f"Location Deal Breaker: Found '{phrase}'"
 
     # 4. Check Education Strictness
-    for phrase in education_blacklists:
-        if phrase in text_lower:
-            return True, f"Education Deal Breaker: Found '{phrase}'"
+    phrase = matchers["education_blacklists"].search(description_text)
+    if phrase:
+        return True, f"Education Deal Breaker: Found '{phrase}'"
 
     return False, "Safe"
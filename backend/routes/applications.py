@@ -1,6 +1,9 @@
-from fastapi import APIRouter, Request
+from datetime import datetime, time, timedelta, timezone
 
-from db_manager import db
+from fastapi import APIRouter, HTTPException, Request
+
+from db_manager import APPLICATION_HEAVY_COLUMNS, db
+from utils.offload import run_blocking
 from utils.user_resolution import resolve_user_id
 
 router = APIRouter(tags=["applications"])
@@ -10,23 +13,80 @@ router = APIRouter(tags=["applications"])
 async def get_stats(request: Request, user_id: str | None = None):
     """Returns summary stats for a user's applications."""
     uid = await resolve_user_id(request, user_id)
+    return await run_blocking(_stats_with_monthly_count, uid)
+
+
+def _stats_with_monthly_count(uid: str) -> dict:
     stats = db.get_application_stats(uid)
     # Add monthly count
     stats["monthly_count"] = db.get_monthly_application_count(uid)
     return stats
 
 
+def _csv(value: str | None) -> list[str]:
+    return [part.strip() for part in (value or "").split(",") if part.strip()]
+
+
+def _parse_bound(name: str, value: str | None, *, end: bool) -> datetime | None:
+    """ISO datetime or ``YYYY-MM-DD`` (a date ``until`` covers that whole day)."""
+    if not value:
+        return None
+    try:
+        if len(value) == 10:
+            day = datetime.fromisoformat(value).date() + timedelta(days=1 if end else 0)
+            return datetime.combine(day, time.min, tzinfo=timezone.utc)
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {name!r}: expected ISO date or datetime")
+    # Timestamps are stored as naive UTC, so offsets must be converted, not kept.
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
 @router.get("/history")
-async def get_history(request: Request, user_id: str | None = None, limit: int = 50):
-    """Returns the most recent application attempts."""
+async def get_history(
+    request: Request,
+    user_id: str | None = None,
+    limit: int = 50,
+    cursor: int | None = None,
+    status: str | None = None,
+    company: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    include: str | None = None,
+):
+    """Application attempts, newest first, one page at a time.
+
+    Pass ``next_cursor`` back as ``cursor`` for the next page. Filters:
+    ``status`` (comma list), ``company`` (substring), ``since`` / ``until``
+    (ISO date or datetime). ``include=reason,answer_generated`` adds the heavy
+    text columns, which are left out by default.
+    """
     uid = await resolve_user_id(request, user_id)
-    history = db.get_recent_applications(uid, limit)
-    return {"history": history}
+    limit = max(1, min(limit, 200))
+    extra = _csv(include)
+    unknown = [c for c in extra if c not in APPLICATION_HEAVY_COLUMNS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown include column(s): {', '.join(unknown)}")
+    history = await run_blocking(
+        db.list_applications,
+        uid,
+        limit=limit,
+        before_id=cursor,
+        statuses=_csv(status) or None,
+        company=(company or "").strip() or None,
+        since=_parse_bound("since", since, end=False),
+        until=_parse_bound("until", until, end=True),
+        include=tuple(extra),
+    )
+    next_cursor = history[-1]["id"] if len(history) == limit else None
+    return {"history": history, "next_cursor": next_cursor}
 
 
 @router.get("/monthly-count")
 async def get_monthly_count(request: Request, user_id: str | None = None):
     """Returns only the monthly application count."""
     uid = await resolve_user_id(request, user_id)
-    count = db.get_monthly_application_count(uid)
+    count = await run_blocking(db.get_monthly_application_count, uid)
     return {"count": count}
@@ -9,6 +9,7 @@ from db_manager import db
 from services.admin import admin_subscription, is_admin
 from utils.user_resolution import resolve_user_id
 from services.plan_limits import PLAN_LIMITS
+from services.cloud_billing import invalidate_subscription_cache
 from services import payu as payu_service
 from services import billing_emails
 
@@ -360,6 +361,7 @@ def handle_checkout_completed(session):
                 status='active',
                 payment_provider='stripe',
             )
+            invalidate_subscription_cache(user_id)
             billing_emails.notify_stripe_checkout(session=session)
         else:
             print("WARNING: No user_id found in checkout session metadata. Skip DB update.")
@@ -399,6 +401,7 @@ def handle_subscription_updated(subscription):
                 cancel_at_period_end=1 if cancel_at_period_end else 0,
                 payment_provider='stripe',
             )
+            invalidate_subscription_cache(user_id)
     except Exception as e:
         print(f"ERROR in handle_subscription_updated: {e}")
         raise e
@@ -417,6 +420,7 @@ def handle_subscription_deleted(subscription):
             user_id=user_id,
             status='canceled'
         )
+        invalidate_subscription_cache(user_id)
         billing_emails.notify_subscription_cancelled(email=user_id, plan=plan)
 
 
@@ -4,21 +4,30 @@ import subprocess
 import sys
 
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
 from app_paths import get_runtime_writable_root, subprocess_env
 from db_manager import db
 from services.linkedin_env import apply_dashboard_linkedin_credentials
 from services.admin import effective_plan
-from services.plan_limits import PLAN_LIMITS, assert_can_start_bot
+from services.plan_limits import (
+    PLAN_LIMITS,
+    assert_can_start_bot,
+    prefetch_gating_subscription,
+)
 from services import supervisor_state as sv
+from services import log_stream
 from services.bot_supervisor import stop_supervisor, supervisor_popen_kwargs
 from utils.debug_logs import (
     SUPERVISOR_CONSOLE_LOG,
     append_session_marker,
     collect_bot_logs_payload,
+    latest_run_logs_dir,
     run_has_logs,
+    run_logs_dir,
     scoped_log_path,
 )
+from utils.offload import run_blocking
 from utils.user_resolution import _claimed_user_id, resolve_user_id
 
 router = APIRouter(prefix="/api/bot", tags=["bot"])
@@ -29,7 +38,8 @@ async def start_bot(request: Request, user_id: str | None = None):
     claimed = await _claimed_user_id(request, user_id)
     user_id = await resolve_user_id(request, claimed)
 
-    assert_can_start_bot(user_id)
+    await prefetch_gating_subscription(user_id)
+    await run_blocking(assert_can_start_bot, user_id)
 
     if sv.supervisor_process and sv.supervisor_process.poll() is None:
         return {"status": "already_running"}
@@ -82,9 +92,9 @@ async def stop_bot(request: Request, user_id: str | None = None):
     claimed = await _claimed_user_id(request, user_id)
     await resolve_user_id(request, claimed)
     try:
-        was_running = stop_supervisor(reason="dashboard")
+        was_running = await run_blocking(stop_supervisor, reason="dashboard")
         if sv.current_run_id:
-            db.end_bot_run(sv.current_run_id, 0)
+            await run_blocking(db.end_bot_run, sv.current_run_id, 0)
             sv.current_run_id = None
         return {"status": "stopped" if was_running else "not_running"}
     except Exception as e:
@@ -98,6 +108,10 @@ async def stop_bot(request: Request, user_id: str | None = None):
 @router.get("/status")
 async def get_bot_status(request: Request, user_id: str | None = None):
     user_id = await resolve_user_id(request, user_id)
+    return await run_blocking(_bot_status, user_id)
+
+
+def _bot_status(user_id: str) -> dict:
     subscription = db.get_user_subscription(user_id)
     plan = subscription.get("plan", "free_trial") if subscription else "free_trial"
 
@@ -133,19 +147,65 @@ async def get_bot_logs(
     resolved_run = run_id
     if resolved_run is None and sv.current_run_id:
         resolved_run = sv.current_run_id
-    return collect_bot_logs_payload(lines=lines, run_id=resolved_run)
+    return await run_blocking(
+        collect_bot_logs_payload, lines=lines, run_id=resolved_run
+    )
+
+
+@router.get("/logs/stream")
+async def stream_bot_logs(
+    request: Request,
+    lines: int = 120,
+    user_id: str | None = None,
+    run_id: int | None = None,
+    offsets: str | None = None,
+):
+    """Server-Sent Events for ``logs/runs/<run_id>/``: only appended bytes are pushed.
+
+    Resume with the last event id (sent automatically by ``EventSource`` as
+    ``Last-Event-ID``) or an explicit ``offsets`` value of the same form.
+    """
+    await resolve_user_id(request, user_id)
+    resolved_run = run_id
+    if resolved_run is None and sv.current_run_id:
+        resolved_run = sv.current_run_id
+    if resolved_run is not None:
+        directory = run_logs_dir(resolved_run)
+    else:
+        directory = latest_run_logs_dir()
+        if directory is None:
+            raise HTTPException(status_code=404, detail="No run logs yet")
+    resume = log_stream.decode_offsets(
+        offsets or request.headers.get("last-event-id")
+    )
+    events = log_stream.stream_log_events(
+        f"run:{os.path.abspath(directory)}",
+        log_stream.directory_files(directory),
+        offsets=resume,
+        lines=max(1, min(lines, 1000)),
+        is_disconnected=request.is_disconnected,
+    )
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/runs")
 async def get_bot_runs(request: Request, user_id: str | None = None, limit: int = 10):
     user_id = await resolve_user_id(request, user_id)
+    return {"runs": await run_blocking(_runs_with_log_flags, user_id, limit)}
+
+
+def _runs_with_log_flags(user_id: str, limit: int) -> list[dict]:
     runs = db.get_recent_bot_runs(limit, user_id=user_id)
     enriched = []
     for row in runs:
         item = dict(row)
         item["has_logs"] = run_has_logs(row["id"])
         enriched.append(item)
-    return {"runs": enriched}
+    return enriched
 
 
 @router.get("/active")
@@ -164,6 +224,10 @@ async def get_active_bot_count(request: Request, user_id: str | None = None):
     frontend can render ``active / limit`` and optionally break it down.
     """
     user_id = await resolve_user_id(request, user_id)
+    return await run_blocking(_active_bot_count, user_id)
+
+
+def _active_bot_count(user_id: str) -> dict:
     automation = int(
         db.get_automation_task_stats(user_id=user_id).get("running", 0)
     )
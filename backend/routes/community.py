@@ -7,6 +7,7 @@ from pydantic import BaseModel, Field
 
 from db_manager import db
 from services.email import send_community_notification
+from utils.offload import run_blocking
 
 router = APIRouter(prefix="/api/community", tags=["community"])
 
@@ -23,17 +24,19 @@ class ReplyCreate(BaseModel):
 
 
 @router.get("/posts")
-async def list_posts(limit: int = 50) -> dict[str, Any]:
+async def list_posts(limit: int = 50, cursor: int | None = None) -> dict[str, Any]:
+    """Newest threads first; pass ``next_cursor`` back as ``cursor`` for the next page."""
     limit = max(1, min(limit, 100))
-    db.ensure_community_seeded()
-    posts = db.list_community_posts(limit=limit)
-    return {"posts": posts}
+    await run_blocking(db.ensure_community_seeded)
+    posts = await run_blocking(db.list_community_posts, limit=limit, before_id=cursor)
+    next_cursor = posts[-1]["id"] if len(posts) == limit else None
+    return {"posts": posts, "next_cursor": next_cursor}
 
 
 @router.get("/posts/{post_id}")
 async def get_post(post_id: int) -> dict[str, Any]:
-    db.ensure_community_seeded()
-    post = db.get_community_post(post_id)
+    await run_blocking(db.ensure_community_seeded)
+    post = await run_blocking(db.get_community_post, post_id)
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
     return post
@@ -41,13 +44,15 @@ async def get_post(post_id: int) -> dict[str, Any]:
 
 @router.post("/posts")
 async def create_post(payload: PostCreate) -> dict[str, Any]:
-    post = db.create_community_post(
+    post = await run_blocking(
+        db.create_community_post,
         author_name=payload.author_name.strip(),
         body=payload.body.strip(),
     )
 
     try:
-        send_community_notification(
+        await run_blocking(
+            send_community_notification,
             name=post["author_name"],
             message=post["body"],
         )
@@ -59,11 +64,12 @@ async def create_post(payload: PostCreate) -> dict[str, Any]:
 
 @router.post("/posts/{post_id}/replies")
 async def create_reply(post_id: int, payload: ReplyCreate) -> dict[str, Any]:
-    if not db.get_community_post(post_id):
+    if not await run_blocking(db.get_community_post, post_id):
         raise HTTPException(status_code=404, detail="Post not found")
 
     try:
-        reply = db.create_community_reply(
+        reply = await run_blocking(
+            db.create_community_reply,
             post_id=post_id,
             author_name=payload.author_name.strip(),
             body=payload.body.strip(),
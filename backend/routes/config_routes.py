@@ -9,6 +9,7 @@ from routes.config_parse import (
     parse_config_value,
 )
 from services.linkedin_env import migrate_canonical_linkedin_to_legacy
+from utils.offload import run_blocking
 from utils.user_resolution import resolve_user_id
 
 router = APIRouter(prefix="/api", tags=["config"])
@@ -27,6 +28,10 @@ async def read_config(category: str, request: Request, user_id: str | None = Non
         raise HTTPException(status_code=400, detail="Invalid config category")
 
     uid = await resolve_user_id(request, user_id)
+    return {"content": await run_blocking(_read_config_content, category, uid)}
+
+
+def _read_config_content(category: str, uid: str) -> str:
     if category == "secrets":
         migrate_canonical_linkedin_to_legacy(user_id=uid)
     config_data = db.get_all_by_category(category, user_id=uid)
@@ -34,10 +39,7 @@ async def read_config(category: str, request: Request, user_id: str | None = Non
         config_data = {
             k: normalize_stored_value(k, v) for k, v in config_data.items()
         }
-
-    content = format_config_content(category, config_data)
-
-    return {"content": content}
+    return format_config_content(category, config_data)
 
 
 @router.post("/config/{category}")
@@ -52,13 +54,15 @@ async def write_config(
 
     uid = await resolve_user_id(request, user_id)
 
-    parsed = parse_config_content(data.content)
-    for key, value in parsed.items():
-        if category == "search":
-            value = normalize_stored_value(key, value)
-        db.set_config(key, value, category, user_id=uid)
+    await run_blocking(_write_config_content, category, data.content, uid)
+    return {"status": "success"}
+
+
+def _write_config_content(category: str, content: str, uid: str) -> None:
+    parsed = parse_config_content(content)
+    if category == "search":
+        parsed = {key: normalize_stored_value(key, value) for key, value in parsed.items()}
+    db.set_configs_bulk(category, parsed, user_id=uid)
 
     if category == "secrets":
         migrate_canonical_linkedin_to_legacy(user_id=uid)
-
-    return {"status": "success"}
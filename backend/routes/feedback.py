@@ -9,6 +9,7 @@ from pydantic import BaseModel, Field, field_validator
 
 from db_manager import db
 from services.email import send_feedback_email
+from utils.offload import run_blocking
 
 router = APIRouter(prefix="/api", tags=["feedback"])
 
@@ -32,7 +33,8 @@ class FeedbackCreate(BaseModel):
 
 @router.post("/feedback")
 async def submit_feedback(payload: FeedbackCreate) -> dict[str, Any]:
-    record = db.create_feedback(
+    record = await run_blocking(
+        db.create_feedback,
         name=payload.name.strip(),
         email=str(payload.email).strip().lower(),
         message=payload.message.strip(),
@@ -41,7 +43,8 @@ async def submit_feedback(payload: FeedbackCreate) -> dict[str, Any]:
 
     email_sent = False
     try:
-        email_sent = send_feedback_email(
+        email_sent = await run_blocking(
+            send_feedback_email,
             name=record["name"],
             email=record["email"],
             message=record["message"],
@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
 from app_version import get_app_version
+from utils.user_resolution import get_session_cache_stats
 
 router = APIRouter(prefix="/api", tags=["health"])
 
@@ -17,3 +18,9 @@ async def health_check():
 @router.get("/version")
 async def get_version():
     return {"version": get_app_version()}
+
+
+@router.get("/health/auth")
+async def auth_metrics():
+    """Session-verification cache hit rate and NextAuth latency."""
+    return {"session_cache": get_session_cache_stats()}
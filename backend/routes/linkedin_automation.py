@@ -11,15 +11,21 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+import time
+import uuid
 from typing import Any, Optional
 
 from fastapi import APIRouter, Body, Header, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from db_manager import db
+from linkedin_automation.scan_output import is_stream_output, progress_path_for
 from services.admin import is_admin
+from utils.offload import run_blocking
 from utils.user_resolution import resolve_user_id
 from services import linkedin_automation as la
+from services import log_stream
 from services import connect_campaigns as cc
 from services.linkedin_env import (
     AUTOMATION_KEY_TO_ENV,
@@ -30,6 +36,7 @@ from services.linkedin_env import (
 from services.plan_limits import (
     AUTOMATION_DAILY_LIMITS,
     assert_can_run_automation,
+    prefetch_gating_subscription,
 )
 
 
@@ -86,54 +93,29 @@ def _health_snapshot(user_id: str) -> dict[str, Any]:
     }
 
 
-def _compute_etag(
-    tasks: list[dict[str, Any]],
-    stats: dict[str, Any],
-    health: dict[str, Any],
-    form_defaults: dict[str, Any],
-    connect_campaigns: list[dict[str, Any]] | None = None,
-) -> str:
-    """Strong ETag derived from the parts of the payload that can actually change.
+def _dashboard_max_age() -> float:
+    raw = (os.getenv("DASHBOARD_ETAG_MAX_AGE") or "").strip()
+    try:
+        return max(1.0, float(raw)) if raw else 30.0
+    except ValueError:
+        return 30.0
+
+
+# Changes per process so counters restarting at 0 never revive an old tag.
+_ETAG_EPOCH = uuid.uuid4().hex
+
 
-    Excludes ``log_path`` and absolute filesystem paths in ``health`` so the
-    hash is stable across restarts that pick a different temp dir, and so
-    benign cosmetic changes don't bust the cache.
+def _dashboard_etag(uid: str, limit: int) -> str:
+    """Cheap ETag from the user's change version (no payload is built).
+
+    Every DB write the dashboard reflects bumps ``db.user_version``,
+    including task finalisation by the reaper thread. Writes from other
+    processes and time-based fields (``last_24h``, health checks on disk) are
+    covered by a ``DASHBOARD_ETAG_MAX_AGE`` time bucket (default 30s).
     """
-    fingerprint = {
-        "tasks": [
-            (
-                t.get("id"),
-                t.get("status"),
-                t.get("running"),
-                t.get("started_at"),
-                t.get("ended_at"),
-                t.get("exit_code"),
-                t.get("account_username"),
-            )
-            for t in tasks
-        ],
-        "stats": stats,
-        "health": {
-            "framework_available": health.get("framework_available"),
-            "main_py_exists": health.get("main_py_exists"),
-            "session_in_db": health.get("session_in_db"),
-            "chrome_profile_ready": health.get("chrome_profile_ready"),
-        },
-        "form_defaults": form_defaults,
-        "connect_campaigns": [
-            (
-                c.get("id"),
-                c.get("updated_at"),
-                c.get("last_run_at"),
-                c.get("last_task_id"),
-                c.get("totals"),
-                len(c.get("runs") or []),
-            )
-            for c in (connect_campaigns or [])
-        ],
-    }
-    canonical = json.dumps(fingerprint, sort_keys=True, separators=(",", ":"))
-    return '"' + hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16] + '"'
+    bucket = int(time.time() // _dashboard_max_age())
+    raw = f"{_ETAG_EPOCH}:{uid}:{limit}:{db.user_version(uid)}:{bucket}"
+    return '"' + hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16] + '"'
 
 
 # ---------------------------------------------------------------------------
@@ -233,16 +215,17 @@ class CalendarRequest(_CommonOpts):
 async def _start(action: str, params: dict[str, Any], request: Request) -> dict[str, Any]:
     claimed = params.pop("user_id", None)
     user_id = await resolve_user_id(request, claimed)
-    assert_can_run_automation(user_id)
+    await prefetch_gating_subscription(user_id)
+    await run_blocking(assert_can_run_automation, user_id)
     try:
-        task = la.start_task(action, params, user_id=user_id)
+        task = await run_blocking(la.start_task, action, params, user_id=user_id)
     except FileNotFoundError as exc:
         raise HTTPException(status_code=503, detail=str(exc))
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Failed to start task: {exc}")
-    return la.task_to_dict(task, include_log=False)
+    return await run_blocking(la.task_to_dict, task, include_log=False)
 
 
 # ---------------------------------------------------------------------------
@@ -277,8 +260,10 @@ async def connect_people(req: ConnectRequest, request: Request):
     if campaign_id:
         uid = await resolve_user_id(request, req.user_id)
         task_id = result.get("id")
-        if task_id and cc.get_campaign(uid, campaign_id):
-            cc.record_connect_task_start(uid, campaign_id, task_id, source="manual")
+        if task_id and await run_blocking(cc.get_campaign, uid, campaign_id):
+            await run_blocking(
+                cc.record_connect_task_start, uid, campaign_id, task_id, source="manual"
+            )
         result["campaign_id"] = campaign_id
     return result
 
@@ -304,7 +289,8 @@ async def generate_calendar(req: CalendarRequest, request: Request):
 async def list_tasks(request: Request, limit: int = 50, user_id: Optional[str] = None):
     """List automation tasks: live in-memory tasks + persisted DB history."""
     uid = await resolve_user_id(request, user_id)
-    return {"tasks": la.merged_task_history(limit=limit, user_id=uid)}
+    tasks = await run_blocking(la.merged_task_history, limit=limit, user_id=uid)
+    return {"tasks": tasks}
 
 
 def _assert_task_owner(request_user: str, task_user: str | None):
@@ -320,13 +306,27 @@ async def get_task(
     request: Request,
     task_id: str,
     log_lines: int = 200,
+    log_offset: Optional[int] = None,
     user_id: Optional[str] = None,
 ):
+    """Task status plus its log tail.
+
+    Pass the returned ``log_offset`` back to receive only lines appended
+    since the previous poll instead of re-reading the tail.
+    """
     uid = await resolve_user_id(request, user_id)
+    return await run_blocking(_task_detail, uid, task_id, log_lines, log_offset)
+
+
+def _task_detail(
+    uid: str, task_id: str, log_lines: int, log_offset: Optional[int]
+) -> dict[str, Any]:
     task = la.get_task(task_id)
     if task is not None:
         _assert_task_owner(uid, task.user_id)
-        return la.task_to_dict(task, include_log=True, log_lines=log_lines)
+        return la.task_to_dict(
+            task, include_log=True, log_lines=log_lines, log_offset=log_offset
+        )
     # Fall back to persisted history when the process is no longer in memory.
     row = db.get_automation_task(task_id)
     if not row:
@@ -335,28 +335,63 @@ async def get_task(
     row["running"] = False
     log_path = row.get("log_path")
     if log_path:
-        try:
-            import os as _os
-
-            if _os.path.isfile(log_path):
-                with open(log_path, "r", encoding="utf-8", errors="replace") as f:
-                    buf = f.readlines()
-                row["log"] = "".join(buf[-max(20, min(int(log_lines), 1000)) :])
-            else:
-                row["log"] = f"(log file not found: {log_path})"
-        except Exception as exc:
-            row["log"] = f"(log read error: {exc})"
+        row["log"], row["log_offset"] = la.read_task_log(
+            log_path, int(log_lines), log_offset
+        )
     else:
         row["log"] = "(no log path recorded for this task)"
+        row["log_offset"] = None
     return row
 
 
-def _read_framework_file(rel_or_abs_path: str, max_bytes: int) -> dict[str, Any]:
-    """Resolve a path against the framework dir, read it safely, return a dict.
+@router.get("/tasks/{task_id}/log/stream")
+async def stream_task_log(
+    request: Request,
+    task_id: str,
+    log_lines: int = 200,
+    offsets: Optional[str] = None,
+    user_id: Optional[str] = None,
+):
+    """Server-Sent Events for one task log; ends with an ``end`` event once the task exits."""
+    uid = await resolve_user_id(request, user_id)
+    task = la.get_task(task_id)
+    if task is not None:
+        _assert_task_owner(uid, task.user_id)
+        log_path = task.log_path
+    else:
+        row = await run_blocking(db.get_automation_task, task_id)
+        if not row:
+            raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
+        _assert_task_owner(uid, row.get("user_id"))
+        log_path = row.get("log_path")
+        if not log_path:
+            raise HTTPException(status_code=404, detail="No log path recorded for this task")
+
+    def _finished() -> bool:
+        live = la.get_task(task_id)
+        return live is None or not live.is_running()
+
+    events = log_stream.stream_log_events(
+        f"file:{os.path.abspath(log_path)}",
+        log_stream.single_file(log_path),
+        offsets=log_stream.decode_offsets(
+            offsets or request.headers.get("last-event-id")
+        ),
+        lines=max(20, min(log_lines, 1000)),
+        is_disconnected=request.is_disconnected,
+        is_finished=_finished,
+    )
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
-    Centralizes the path-traversal guard, size cap, and metadata shape used
-    by both ``/tasks/{id}/artifact`` and ``/calendar``. Raises ``HTTPException``
-    on guard / read failures so the callers can stay terse.
+
+def _resolve_framework_file(rel_or_abs_path: str) -> tuple[str, str]:
+    """``(resolved_path, framework_dir)`` for an existing file inside the framework dir.
+
+    Raises ``HTTPException`` (403 outside the dir, 404 missing).
     """
     framework_dir = os.path.abspath(la.get_framework_dir())
     raw = (
@@ -382,7 +417,17 @@ def _read_framework_file(rel_or_abs_path: str, max_bytes: int) -> dict[str, Any]
             status_code=404,
             detail=f"File not found at {os.path.relpath(resolved, framework_dir)!r}",
         )
+    return resolved, framework_dir
+
 
+def _read_framework_file(rel_or_abs_path: str, max_bytes: int) -> dict[str, Any]:
+    """Resolve a path against the framework dir, read it safely, return a dict.
+
+    Centralizes the path-traversal guard, size cap, and metadata shape used
+    by both ``/tasks/{id}/artifact`` and ``/calendar``. Raises ``HTTPException``
+    on guard / read failures so the callers can stay terse.
+    """
+    resolved, framework_dir = _resolve_framework_file(rel_or_abs_path)
     try:
         size = os.path.getsize(resolved)
         mtime = os.path.getmtime(resolved)
@@ -404,16 +449,98 @@ def _read_framework_file(rel_or_abs_path: str, max_bytes: int) -> dict[str, Any]
     }
 
 
+def _read_framework_jsonl(
+    rel_or_abs_path: str, offset: int, limit: int, max_bytes: int
+) -> dict[str, Any]:
+    """Page through a JSON Lines artifact by byte offset.
+
+    Returns up to ``limit`` complete lines starting at ``offset`` (read at most
+    ``max_bytes`` past it) and ``next_offset`` to resume from. A trailing line
+    the scanner is still writing is left for the next page. The scanner's
+    ``<name>.progress.json`` header, when present, comes back as ``progress``.
+    """
+    resolved, framework_dir = _resolve_framework_file(rel_or_abs_path)
+    cap = max(1024, min(int(max_bytes), 2_000_000))
+    limit = max(1, min(int(limit), 1000))
+    items: list[Any] = []
+    try:
+        size = os.path.getsize(resolved)
+        mtime = os.path.getmtime(resolved)
+        start = max(0, min(int(offset), size))
+        with open(resolved, "rb") as fh:
+            fh.seek(start)
+            chunk = fh.read(cap)
+    except OSError as exc:
+        raise HTTPException(status_code=500, detail=f"Failed to read artifact: {exc}")
+
+    pos = 0
+    while len(items) < limit:
+        end = chunk.find(b"\n", pos)
+        if end < 0:
+            break
+        line = chunk[pos:end].strip()
+        pos = end + 1
+        if not line:
+            continue
+        try:
+            items.append(json.loads(line))
+        except ValueError:
+            continue  # torn or hand-edited line; skip rather than fail the page
+    if not items and pos == 0 and len(chunk) >= cap:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Artifact line at offset {start} exceeds max_bytes={cap}.",
+        )
+    next_offset = start + pos
+
+    progress = None
+    progress_path = progress_path_for(resolved)
+    try:
+        with open(progress_path, "r", encoding="utf-8") as fh:
+            progress = json.load(fh)
+    except (OSError, ValueError):
+        pass
+
+    return {
+        "filename": os.path.basename(resolved),
+        "path": os.path.relpath(resolved, framework_dir),
+        "absolute_path": resolved,
+        "size_bytes": size,
+        "mtime": mtime,
+        "format": "jsonl",
+        "offset": start,
+        "next_offset": next_offset,
+        "eof": next_offset >= size,
+        "items": items,
+        "progress": progress,
+    }
+
+
 @router.get("/tasks/{task_id}/artifact")
-async def get_task_artifact(request: Request, task_id: str, max_bytes: int = 200_000):
+async def get_task_artifact(
+    request: Request,
+    task_id: str,
+    max_bytes: int = 200_000,
+    offset: int = 0,
+    limit: int = 200,
+):
     """Return the file produced by a task (calendar or opportunity scan).
 
     Generation tasks write a topics file to the framework cwd. Opportunity
     scans write ``opportunities.json``. The dashboard calls this endpoint to
     surface that file inline. Restricted to supported actions and paths inside
     the framework directory.
+
+    Streaming scans (``--output *.jsonl``) are paged instead: pass the
+    previous response's ``next_offset`` as ``offset`` to fetch only new lines.
     """
     uid = await resolve_user_id(request)
+    return await run_blocking(_task_artifact, uid, task_id, max_bytes, offset, limit)
+
+
+def _task_artifact(
+    uid: str, task_id: str, max_bytes: int, offset: int = 0, limit: int = 200
+) -> dict[str, Any]:
     task = la.get_task(task_id)
     if task is not None:
         _assert_task_owner(uid, task.user_id)
@@ -446,7 +573,10 @@ async def get_task_artifact(request: Request, task_id: str, max_bytes: int = 200
             output = token.split("=", 1)[1]
             break
 
-    payload = _read_framework_file(output, max_bytes)
+    if is_stream_output(output):
+        payload = _read_framework_jsonl(output, offset, limit, max_bytes)
+    else:
+        payload = _read_framework_file(output, max_bytes)
     payload["task_id"] = task_id
     payload["action"] = action
     return payload
@@ -466,7 +596,7 @@ async def get_calendar_file(
     """
     await resolve_user_id(request)
     safe = (file or "").strip() or "content_calendar.txt"
-    payload = _read_framework_file(safe, max_bytes)
+    payload = await run_blocking(_read_framework_file, safe, max_bytes)
     payload["action"] = "generate-calendar"
     return payload
 
@@ -478,10 +608,10 @@ async def stop_task(request: Request, task_id: str, user_id: Optional[str] = Non
     if not task:
         raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
     _assert_task_owner(uid, task.user_id)
-    stopped = la.stop_task(task_id)
+    stopped = await run_blocking(la.stop_task, task_id)
     return {
         "stopped": stopped,
-        "task": la.task_to_dict(task, include_log=False),
+        "task": await run_blocking(la.task_to_dict, task, include_log=False),
     }
 
 
@@ -494,7 +624,7 @@ async def stop_task(request: Request, task_id: str, user_id: Optional[str] = Non
 async def health(request: Request, user_id: Optional[str] = None):
     """Report whether the framework is reachable and a DB session exists."""
     uid = await resolve_user_id(request, user_id)
-    return _health_snapshot(user_id=uid)
+    return await run_blocking(_health_snapshot, user_id=uid)
 
 
 # ---------------------------------------------------------------------------
@@ -506,7 +636,7 @@ async def health(request: Request, user_id: Optional[str] = None):
 async def stats(request: Request, user_id: Optional[str] = None):
     """Aggregate counts of automation tasks for the dashboard summary panel."""
     uid = await resolve_user_id(request, user_id)
-    return _stats_with_plan(uid)
+    return await run_blocking(_stats_with_plan, uid)
 
 
 # ---------------------------------------------------------------------------
@@ -514,6 +644,17 @@ async def stats(request: Request, user_id: Optional[str] = None):
 # ---------------------------------------------------------------------------
 
 
+def _dashboard_parts(uid: str, limit: int) -> tuple:
+    """All blocking reads behind ``/dashboard`` (one offload per request)."""
+    return (
+        la.merged_task_history(limit=limit, user_id=uid),
+        _stats_with_plan(uid),
+        _health_snapshot(user_id=uid),
+        _form_defaults_snapshot(user_id=uid),
+        cc.list_campaigns(uid),
+    )
+
+
 @router.get("/dashboard")
 async def dashboard(
     request: Request,
@@ -525,25 +666,16 @@ async def dashboard(
     """Combined dashboard payload: ``tasks + stats + health`` in one request.
 
     The frontend polls this every few seconds; ``ETag`` / ``If-None-Match``
-    turn unchanged ticks into ``304 Not Modified`` responses (~empty body).
+    turn unchanged ticks into ``304 Not Modified`` responses (~empty body)
+    answered from a per-user change version before any payload is built.
 
     Keeping ``/tasks``, ``/stats``, and ``/health`` as separate endpoints
     too — they're still useful for one-off refreshes and integration callers.
     """
     uid = await resolve_user_id(request, user_id)
-    tasks = la.merged_task_history(limit=limit, user_id=uid)
-    stats_payload = _stats_with_plan(uid)
-    health_payload = _health_snapshot(user_id=uid)
-    form_defaults_payload = _form_defaults_snapshot(user_id=uid)
-    connect_campaigns_payload = cc.list_campaigns(uid)
-
-    etag = _compute_etag(
-        tasks,
-        stats_payload,
-        health_payload,
-        form_defaults_payload,
-        connect_campaigns_payload,
-    )
+    # Tag before reading so a write landing mid-build yields a new tag next poll
+    # (a dict read under a lock, cheap enough to stay on the event loop).
+    etag = _dashboard_etag(uid, limit)
     response.headers["ETag"] = etag
     response.headers["Cache-Control"] = "no-cache"
 
@@ -556,6 +688,14 @@ async def dashboard(
                 headers={"ETag": etag, "Cache-Control": "no-cache"},
             )
 
+    (
+        tasks,
+        stats_payload,
+        health_payload,
+        form_defaults_payload,
+        connect_campaigns_payload,
+    ) = await run_blocking(_dashboard_parts, uid, limit)
+
     return {
         "tasks": tasks,
         "stats": stats_payload,
@@ -587,7 +727,7 @@ def _accounts_snapshot(user_id: str) -> dict[str, Any]:
 async def accounts(request: Request, user_id: Optional[str] = None):
     """List LinkedIn accounts available to run automations as (passwords not echoed)."""
     uid = await resolve_user_id(request, user_id)
-    return _accounts_snapshot(user_id=uid)
+    return await run_blocking(_accounts_snapshot, user_id=uid)
 
 
 # ---------------------------------------------------------------------------
@@ -672,7 +812,7 @@ def _form_defaults_snapshot(user_id: str) -> dict[str, Any]:
 async def get_form_defaults(request: Request, user_id: Optional[str] = None):
     """Return the persisted dashboard form values (empty dict when nothing saved)."""
     uid = await resolve_user_id(request, user_id)
-    return _form_defaults_snapshot(user_id=uid)
+    return await run_blocking(_form_defaults_snapshot, user_id=uid)
 
 
 @router.put("/form-defaults")
@@ -701,6 +841,11 @@ async def put_form_defaults(
         )
 
     uid = await resolve_user_id(request, user_id)
+    defaults = await run_blocking(_merge_form_defaults, uid, payload)
+    return {"status": "saved", "defaults": defaults}
+
+
+def _merge_form_defaults(uid: str, payload: dict[str, Any]) -> dict[str, Any]:
     for k, v in payload.items():
         if v is None:
             # Treat ``None`` as "forget this key" so the listing endpoint
@@ -708,8 +853,7 @@ async def put_form_defaults(
             db.delete_config(k, FORM_DEFAULTS_CATEGORY, user_id=uid)
         else:
             db.set_config(k, v, FORM_DEFAULTS_CATEGORY, user_id=uid)
-
-    return {"status": "saved", "defaults": _form_defaults_snapshot(user_id=uid)}
+    return _form_defaults_snapshot(user_id=uid)
 
 
 @router.delete("/form-defaults")
@@ -721,13 +865,18 @@ async def clear_form_defaults(request: Request, prefix: Optional[str] = None, us
     wiping the others.
     """
     uid = await resolve_user_id(request, user_id)
+    keys_to_clear = await run_blocking(_clear_form_defaults, uid, prefix)
+    return {"status": "cleared", "removed": keys_to_clear}
+
+
+def _clear_form_defaults(uid: str, prefix: Optional[str]) -> list[str]:
     cfg = _form_defaults_snapshot(user_id=uid)
     keys_to_clear = (
         [k for k in cfg if k.startswith(prefix)] if prefix else list(cfg.keys())
     )
     for k in keys_to_clear:
         db.delete_config(k, FORM_DEFAULTS_CATEGORY, user_id=uid)
-    return {"status": "cleared", "removed": keys_to_clear}
+    return keys_to_clear
 
 
 # ---------------------------------------------------------------------------
@@ -738,7 +887,7 @@ async def clear_form_defaults(request: Request, prefix: Optional[str] = None, us
 @router.get("/connect-campaigns")
 async def list_connect_campaigns(request: Request, user_id: Optional[str] = None):
     uid = await resolve_user_id(request, user_id)
-    return {"campaigns": cc.list_campaigns(uid)}
+    return {"campaigns": await run_blocking(cc.list_campaigns, uid)}
 
 
 @router.post("/connect-campaigns")
@@ -747,7 +896,9 @@ async def create_connect_campaign(
 ):
     uid = await resolve_user_id(request, user_id)
     try:
-        campaign = cc.create_campaign(uid, body.model_dump(exclude_none=True))
+        campaign = await run_blocking(
+            cc.create_campaign, uid, body.model_dump(exclude_none=True)
+        )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
     return {"campaign": campaign}
@@ -762,8 +913,8 @@ async def update_connect_campaign(
 ):
     uid = await resolve_user_id(request, user_id)
     try:
-        campaign = cc.update_campaign(
-            uid, campaign_id, body.model_dump(exclude_none=True)
+        campaign = await run_blocking(
+            cc.update_campaign, uid, campaign_id, body.model_dump(exclude_none=True)
         )
     except KeyError:
         raise HTTPException(status_code=404, detail="Campaign not found")
@@ -777,7 +928,7 @@ async def delete_connect_campaign(
     campaign_id: str, request: Request, user_id: Optional[str] = None
 ):
     uid = await resolve_user_id(request, user_id)
-    if not cc.delete_campaign(uid, campaign_id):
+    if not await run_blocking(cc.delete_campaign, uid, campaign_id):
         raise HTTPException(status_code=404, detail="Campaign not found")
     return {"status": "deleted", "id": campaign_id}
 
@@ -792,8 +943,10 @@ async def run_connect_campaign(
     no_ai: bool = False,
 ):
     uid = await resolve_user_id(request, user_id)
+    await prefetch_gating_subscription(uid)
     try:
-        return cc.run_campaign(
+        return await run_blocking(
+            cc.run_campaign,
             uid,
             campaign_id,
             source="manual",
@@ -801,6 +954,8 @@ async def run_connect_campaign(
             headless=headless,
             no_ai=no_ai,
         )
+    except HTTPException:
+        raise
     except KeyError:
         raise HTTPException(status_code=404, detail="Campaign not found")
     except ValueError as exc:
@@ -817,7 +972,7 @@ async def connect_campaign_history(
 ):
     uid = await resolve_user_id(request, user_id)
     try:
-        return {"runs": cc.campaign_history(uid, campaign_id)}
+        return {"runs": await run_blocking(cc.campaign_history, uid, campaign_id)}
     except KeyError:
         raise HTTPException(status_code=404, detail="Campaign not found")
 
@@ -859,7 +1014,7 @@ _SENTINEL_PRESERVE = {"set", "***", "********"}
 async def read_settings(request: Request, user_id: Optional[str] = None):
     """Return the dashboard-managed framework settings (API keys masked)."""
     uid = await resolve_user_id(request, user_id)
-    return get_automation_settings(mask_sensitive=True, user_id=uid)
+    return await run_blocking(get_automation_settings, mask_sensitive=True, user_id=uid)
 
 
 @router.post("/config")
@@ -870,6 +1025,13 @@ async def write_settings(payload: AutomationSettings, request: Request, user_id:
     if not incoming:
         raise HTTPException(status_code=400, detail="No settings provided.")
 
+    return {
+        "status": "ok",
+        "settings": await run_blocking(_save_automation_settings, uid, incoming),
+    }
+
+
+def _save_automation_settings(uid: str, incoming: dict[str, Any]) -> dict[str, Any]:
     for key, value in incoming.items():
         if key not in AUTOMATION_KEY_TO_ENV:
             continue
@@ -884,8 +1046,4 @@ async def write_settings(payload: AutomationSettings, request: Request, user_id:
         if isinstance(value, str):
             value = value.strip()
         db.set_config(key, value, category="linkedin_automation", user_id=uid)
-
-    return {
-        "status": "ok",
-        "settings": get_automation_settings(mask_sensitive=True, user_id=uid),
-    }
+    return get_automation_settings(mask_sensitive=True, user_id=uid)
@@ -2,6 +2,7 @@ from fastapi import APIRouter, File, HTTPException, Request, UploadFile
 
 from db_manager import db
 from services.storage import storage_service
+from utils.offload import run_blocking
 from utils.user_resolution import resolve_user_id
 
 router = APIRouter(prefix="/api", tags=["uploads"])
@@ -19,12 +20,17 @@ async def upload_resume(
     try:
         content = await file.read()
 
-        storage_path = storage_service.upload_file(content, file.filename, uid)
-
-        db.upsert_resume_metadata(uid, file.filename, storage_path, is_default=True)
-
-        db.set_config("default_resume_path", storage_path, "questions", user_id=uid)
+        storage_path = await run_blocking(
+            _store_default_resume, uid, file.filename, content
+        )
 
         return {"status": "success", "filename": file.filename, "storage_path": storage_path}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+def _store_default_resume(uid: str, filename: str, content: bytes) -> str:
+    storage_path = storage_service.upload_file(content, filename, uid)
+    db.upsert_resume_metadata(uid, filename, storage_path, is_default=True)
+    db.set_config("default_resume_path", storage_path, "questions", user_id=uid)
+    return storage_path
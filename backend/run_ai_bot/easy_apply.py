@@ -9,9 +9,11 @@ from run_ai_bot.form_answer_helpers import (
 from run_ai_bot.session import log_to_db
 from run_ai_bot.state import *
 
+from services.ai_answer_cache import cached_ai_answer
 from services.bot_config_cache import (
     get_cached_default_resume_asset,
     get_cached_user_resumes,
+    get_custom_qa,
 )
 
 from modules.human_actions import human_move_and_click, human_type_text
@@ -66,6 +68,45 @@ def answer_common_questions(label: str, answer: str) -> str:
     return answer
 
 
+# Function to ask the configured AI provider a form question
+def ask_ai_question(
+    label_org: str, question_type: str, job_description: str | None
+) -> str | None:
+    """
+    Function to ask the configured AI provider to answer a form question.
+    * Returns `None` when the provider is not supported
+    """
+    if ai_provider.lower() in ("openai", "openclaw"):
+        return ai_answer_question(
+            aiClient,
+            label_org,
+            question_type=question_type,
+            job_description=job_description,
+            user_information_all=user_information_all,
+        )
+    if ai_provider.lower() == "deepseek":
+        return deepseek_answer_question(
+            aiClient,
+            label_org,
+            options=None,
+            question_type=question_type,
+            job_description=job_description,
+            about_company=None,
+            user_information_all=user_information_all,
+        )
+    if ai_provider.lower() == "gemini":
+        return gemini_answer_question(
+            aiClient,
+            label_org,
+            options=None,
+            question_type=question_type,
+            job_description=job_description,
+            about_company=None,
+            user_information_all=user_information_all,
+        )
+    return None
+
+
 # Function to answer the questions for Easy Apply
 def answer_questions(
     modal: WebElement,
@@ -73,14 +114,7 @@ def answer_questions(
     work_location: str,
     job_description: str | None = None,
 ) -> set:
-    custom_qa = {}
-    custom_qa_path = "config/custom_qa.json"
-    if os.path.exists(custom_qa_path):
-        try:
-            with open(custom_qa_path, "r", encoding="utf-8") as f:
-                custom_qa = json.load(f)
-        except:
-            pass
+    custom_qa = get_custom_qa()
     # Get all questions from the page
 
     all_questions = modal.find_elements(By.XPATH, ".//div[@data-test-form-element]")
@@ -305,7 +339,8 @@ def answer_questions(
                 label = label.find_element(By.CLASS_NAME, "visually-hidden")
             except:
                 pass
-            label_org = label.text if label else "Unknown"
+            question_label = label.text if label else ""
+            label_org = question_label or "Unknown"
             answer = ""  # years_of_experience
             label = label_org.lower()
 
@@ -395,37 +430,14 @@ def answer_questions(
                 if answer == "":
                     if use_AI and aiClient:
                         try:
-                            if ai_provider.lower() in ("openai", "openclaw"):
-                                answer = ai_answer_question(
-                                    aiClient,
-                                    label_org,
-                                    question_type="text",
-                                    job_description=job_description,
-                                    user_information_all=user_information_all,
-                                )
-                            elif ai_provider.lower() == "deepseek":
-                                answer = deepseek_answer_question(
-                                    aiClient,
-                                    label_org,
-                                    options=None,
-                                    question_type="text",
-                                    job_description=job_description,
-                                    about_company=None,
-                                    user_information_all=user_information_all,
-                                )
-                            elif ai_provider.lower() == "gemini":
-                                answer = gemini_answer_question(
-                                    aiClient,
-                                    label_org,
-                                    options=None,
-                                    question_type="text",
-                                    job_description=job_description,
-                                    about_company=None,
-                                    user_information_all=user_information_all,
-                                )
-                            else:
-                                randomly_answered_questions.add((label_org, "text"))
-                                answer = years_of_experience
+                            answer = cached_ai_answer(
+                                user_id=user_id,
+                                label=question_label,
+                                question_type="text",
+                                produce=lambda: ask_ai_question(
+                                    label_org, "text", job_description
+                                ),
+                            )
                             if answer and isinstance(answer, str) and len(answer) > 0:
                                 print_lg(
                                     f'AI Answered received for question "{label_org}" \nhere is answer: "{answer}"'
@@ -456,7 +468,8 @@ def answer_questions(
         text_area = try_xp(Question, ".//textarea", False)
         if text_area:
             label = try_xp(Question, ".//label[@for]", False)
-            label_org = label.text if label else "Unknown"
+            question_label = label.text if label else ""
+            label_org = question_label or "Unknown"
             label = label_org.lower()
             answer = ""
             prev_answer = text_area.get_attribute("value")
@@ -471,37 +484,14 @@ def answer_questions(
                     ##> ------ Yang Li : MARKYangL - Feature ------
                     if use_AI and aiClient:
                         try:
-                            if ai_provider.lower() in ("openai", "openclaw"):
-                                answer = ai_answer_question(
-                                    aiClient,
-                                    label_org,
-                                    question_type="textarea",
-                                    job_description=job_description,
-                                    user_information_all=user_information_all,
-                                )
-                            elif ai_provider.lower() == "deepseek":
-                                answer = deepseek_answer_question(
-                                    aiClient,
-                                    label_org,
-                                    options=None,
-                                    question_type="textarea",
-                                    job_description=job_description,
-                                    about_company=None,
-                                    user_information_all=user_information_all,
-                                )
-                            elif ai_provider.lower() == "gemini":
-                                answer = gemini_answer_question(
-                                    aiClient,
-                                    label_org,
-                                    options=None,
-                                    question_type="textarea",
-                                    job_description=job_description,
-                                    about_company=None,
-                                    user_information_all=user_information_all,
-                                )
-                            else:
-                                randomly_answered_questions.add((label_org, "textarea"))
-                                answer = ""
+                            answer = cached_ai_answer(
+                                user_id=user_id,
+                                label=question_label,
+                                question_type="textarea",
+                                produce=lambda: ask_ai_question(
+                                    label_org, "textarea", job_description
+                                ),
+                            )
                             if answer and isinstance(answer, str) and len(answer) > 0:
                                 print_lg(
                                     f'AI Answered received for question "{label_org}" \nhere is answer: "{answer}"'
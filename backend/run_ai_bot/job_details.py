@@ -8,12 +8,84 @@ from run_ai_bot.session import log_to_db
 from run_ai_bot.reporting import discard_job
 from run_ai_bot.state import *
 
+from services.bot_config_cache import get_phrase_matchers
+
+
+# One round trip for every visible card in the search results list. Returns
+# plain values plus the card/anchor WebElements (needed for scrolling and
+# clicking). Pass a single card element as arguments[0] to re-read just that
+# card, e.g. after scrolling an occluded placeholder into view.
+_JOB_CARDS_JS = """
+const cards = arguments[0]
+  ? [arguments[0]]
+  : Array.from(document.querySelectorAll("li[data-occludable-job-id]"));
+const text = (el) => (el ? (el.innerText || el.textContent || "").trim() : "");
+return cards.map((card) => {
+  const link = card.querySelector("a");
+  const title = text(link);
+  const state = text(card.querySelector(".job-card-container__footer-job-state"));
+  return {
+    job_id: card.getAttribute("data-occludable-job-id"),
+    title: title.split("\\n")[0],
+    subtitle: text(card.querySelector(".artdeco-entity-lockup__subtitle")),
+    applied: state === "Applied",
+    card: card,
+    link: link,
+  };
+});
+"""
+
+
+def _split_job_subtitle(other_details: str) -> tuple[str, str, str]:
+    """Splits "Company · City, Country (Remote)" into (company, work_location, work_style)."""
+    index = other_details.find(" · ")
+    company = other_details[:index]
+    work_location = other_details[index + 3 :]
+    work_style = work_location[work_location.rfind("(") + 1 : work_location.rfind(")")]
+    work_location = work_location[: work_location.rfind("(")].strip()
+    return company, work_location, work_style
+
+
+def extract_job_cards(card: WebElement | None = None) -> list[dict]:
+    """
+    Function to read job cards from the search results list in a single `execute_script` call.
+    Returns a list of dicts with job_id, title, company, work_location, work_style, applied, card, link
+    * Pass `card` to re-read only that card
+    """
+    raw_cards = driver.execute_script(_JOB_CARDS_JS, card) or []
+    job_cards = []
+    for raw in raw_cards:
+        company, work_location, work_style = _split_job_subtitle(raw.get("subtitle") or "")
+        job_cards.append(
+            {
+                "job_id": raw.get("job_id"),
+                "title": raw.get("title") or "",
+                "company": company,
+                "work_location": work_location,
+                "work_style": work_style,
+                "applied": bool(raw.get("applied")),
+                "card": raw.get("card"),
+                "link": raw.get("link"),
+            }
+        )
+    return job_cards
+
+
+def refresh_job_cards(job_cards: list[dict]) -> list[dict]:
+    """
+    Function to re-read `job_cards` (one round trip) after the list re-rendered, keeping their order.
+    Cards that are no longer in the list are kept as they were.
+    """
+    fresh = {c["job_id"]: c for c in extract_job_cards()}
+    return [fresh.get(c["job_id"], c) for c in job_cards]
+
 
 def get_job_main_details(
-    job: WebElement, blacklisted_companies: set, rejected_jobs: set
+    job: dict, blacklisted_companies: set, rejected_jobs: set
 ) -> tuple[str, str, str, str, str, bool]:
     """
     # Function to get job main details.
+    Takes a job card from `extract_job_cards()`.
     Returns a tuple of (job_id, title, company, work_location, work_style, skip)
     * job_id: Job ID
     * title: Job title
@@ -22,23 +94,19 @@ def get_job_main_details(
     * work_style: Work style of this job (Remote, On-site, Hybrid)
     * skip: A boolean flag to skip this job
     """
-    job_details_button = job.find_element(
-        By.TAG_NAME, "a"
-    )  # job.find_element(By.CLASS_NAME, "job-card-list__title")  # Problem in India
+    if job["link"] is None or not job["title"]:
+        # LinkedIn occludes off-screen cards; scroll it in and read it again.
+        scroll_to_view(driver, job["card"], True)
+        job = extract_job_cards(job["card"])[0]
+        if job["link"] is None:
+            raise NoSuchElementException(f"No job link in card {job['job_id']}")
+    job_details_button = job["link"]
     scroll_to_view(driver, job_details_button, True)
-    job_id = job.get_dom_attribute("data-occludable-job-id")
-    title = job_details_button.text
-    title = title[: title.find("\n")]
-    # company = job.find_element(By.CLASS_NAME, "job-card-container__primary-description").text
-    # work_location = job.find_element(By.CLASS_NAME, "job-card-container__metadata-item").text
-    other_details = job.find_element(
-        By.CLASS_NAME, "artdeco-entity-lockup__subtitle"
-    ).text
-    index = other_details.find(" · ")
-    company = other_details[:index]
-    work_location = other_details[index + 3 :]
-    work_style = work_location[work_location.rfind("(") + 1 : work_location.rfind(")")]
-    work_location = work_location[: work_location.rfind("(")].strip()
+    job_id = job["job_id"]
+    title = job["title"]
+    company = job["company"]
+    work_location = job["work_location"]
+    work_style = job["work_style"]
 
     # Skip if previously rejected due to blacklist or already applied
     skip = False
@@ -53,15 +121,9 @@ def get_job_main_details(
             f'Skipping previously rejected "{title} | {company}" job. Job ID: {job_id}!'
         )
         skip = True
-    try:
-        if (
-            job.find_element(By.CLASS_NAME, "job-card-container__footer-job-state").text
-            == "Applied"
-        ):
-            skip = True
-            print_lg(f'Already applied to "{title} | {company}" job. Job ID: {job_id}!')
-    except:
-        pass
+    if job["applied"]:
+        skip = True
+        print_lg(f'Already applied to "{title} | {company}" job. Job ID: {job_id}!')
     try:
         if not skip:
             # job_details_button.click()
@@ -93,21 +155,16 @@ def check_blacklist(
     about_company_org = find_by_class(driver, "jobs-company__box")
     scroll_to_view(driver, about_company_org)
     about_company_org = about_company_org.text
-    about_company = about_company_org.lower()
-    skip_checking = False
-    for word in about_company_good_words:
-        if word.lower() in about_company:
-            print_lg(
-                f'Found the word "{word}". So, skipped checking for blacklist words.'
-            )
-            skip_checking = True
-            break
-    if not skip_checking:
-        for word in about_company_bad_words:
-            if word.lower() in about_company:
-                rejected_jobs.add(job_id)
-                blacklisted_companies.add(company)
-                raise ValueError(f'\n"{about_company_org}"\n\nContains "{word}".')
+    matchers = get_phrase_matchers()
+    word = matchers["about_company_good_words"].search(about_company_org)
+    if word:
+        print_lg(f'Found the word "{word}". So, skipped checking for blacklist words.')
+    else:
+        word = matchers["about_company_bad_words"].search(about_company_org)
+        if word:
+            rejected_jobs.add(job_id)
+            blacklisted_companies.add(company)
+            raise ValueError(f'\n"{about_company_org}"\n\nContains "{word}".')
     buffer(click_gap)
     scroll_to_view(driver, jobs_top_card)
     return rejected_jobs, blacklisted_companies, jobs_top_card
@@ -149,12 +206,11 @@ def get_job_description() -> (
         skip = False
         skipReason = None
         skipMessage = None
-        for word in bad_words:
-            if word.lower() in jobDescriptionLow:
-                skipMessage = f'\n{jobDescription}\n\nContains bad word "{word}". Skipping this job!\n'
-                skipReason = "Found a Bad Word in About Job"
-                skip = True
-                break
+        word = get_phrase_matchers()["bad_words"].search(jobDescription)
+        if word:
+            skipMessage = f'\n{jobDescription}\n\nContains bad word "{word}". Skipping this job!\n'
+            skipReason = "Found a Bad Word in About Job"
+            skip = True
         if (
             not skip
             and security_clearance == False
@@ -9,10 +9,12 @@ from run_ai_bot.bootstrap_env import *
 from run_ai_bot.login import is_logged_in_LN, login_LN
 from run_ai_bot.pipeline import run
 from run_ai_bot.state import *
+from services import application_log_writer
 from services.bot_config_cache import warm_bot_config_cache, get_cached_user_resumes
 
 
 def main() -> None:
+    application_log_writer.install_signal_handlers()
     try:
         warm_bot_config_cache()
         global linkedIn_tab, tabs_count, useNewResume, aiClient
@@ -161,6 +163,7 @@ def main() -> None:
         pyautogui.alert(str(e), alert_title)
         sys.exit(1)
     finally:
+        application_log_writer.close_application_writer()
         # --- Statistics & Cleanup ---
         print_lg("\n\nTotal runs:                     {}".format(total_runs))
         print_lg("Jobs Easy Applied:              {}".format(easy_applied_count))
@@ -8,8 +8,10 @@ from run_ai_bot.external_apply import external_apply, follow_company
 from run_ai_bot.humanize import human_click
 from run_ai_bot.job_details import (
     check_blacklist,
+    extract_job_cards,
     get_job_description,
     get_job_main_details,
+    refresh_job_cards,
 )
 from run_ai_bot.reporting import (
     discard_job,
@@ -24,11 +26,13 @@ from run_ai_bot.search_filters import (
 )
 from run_ai_bot.state import *
 
+from services.ai_answer_cache import get_answer_cache_stats
 from services.bot_config_cache import get_cached_user_resumes, get_rate_settings
 from services.smart_rate_limit import (
     effective_daily_limit,
     sleep_random_delay,
 )
+from services.stale_job_cards import read_card_with_retry
 from modules.human_actions import human_move_and_click
 
 _rate_settings = None
@@ -42,6 +46,12 @@ def _get_rate_settings():
     return _rate_settings
 
 
+def _reset_after_stale_card() -> None:
+    print_lg("Stale job listing after UI update; closing modal and re-reading job cards.")
+    discard_job()
+    buffer(1)
+
+
 def _get_account_daily_cap() -> int:
     global _account_daily_cap
     if _account_daily_cap is None:
@@ -76,6 +86,12 @@ def run(total_runs: int) -> int:
     )
     apply_to_jobs(search_terms)
     _get_account_daily_cap()
+    if use_AI:
+        cache_stats = get_answer_cache_stats()
+        print_lg(
+            f"AI answer cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+            f"(hit rate {cache_stats['hit_rate']:.0%})"
+        )
     print_lg(
         "########################################################################################################################\n"
     )
@@ -183,13 +199,11 @@ def apply_to_jobs(search_terms: list[str]) -> None:
 
                 pagination_element, current_page = get_page_info()
 
-                # Find all job listings in current page
+                # Find all job listings in current page (one round trip for every card)
                 random_sleep(2, 4)
-                job_listings = driver.find_elements(
-                    By.XPATH, "//li[@data-occludable-job-id]"
-                )
+                job_listings = extract_job_cards()
 
-                for job_index, _ in enumerate(job_listings):
+                for job_index in range(len(job_listings)):
                     if keep_screen_awake:
                         pyautogui.press("shiftright")
                     if current_count >= switch_number:
@@ -198,23 +212,19 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                     print_lg("\n-@-\n")
 
                     try:
-                        fresh_listings = driver.find_elements(
-                            By.XPATH, "//li[@data-occludable-job-id]"
-                        )
-                        if job_index >= len(fresh_listings):
-                            break
-                        job = fresh_listings[job_index]
                         job_id, title, company, work_location, work_style, skip = (
-                            get_job_main_details(
-                                job, blacklisted_companies, rejected_jobs
+                            read_card_with_retry(
+                                job_listings,
+                                job_index,
+                                lambda card: get_job_main_details(
+                                    card, blacklisted_companies, rejected_jobs
+                                ),
+                                refresh_job_cards,
+                                on_stale=_reset_after_stale_card,
                             )
                         )
                     except StaleElementReferenceException:
-                        print_lg(
-                            "Stale job listing after UI update; closing modal and retrying."
-                        )
-                        discard_job()
-                        buffer(1)
+                        print_lg("Job card still stale after re-reading job cards; skipping it.")
                         continue
 
                     if skip:
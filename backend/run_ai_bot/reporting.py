@@ -8,6 +8,7 @@ from app_paths import get_logs_dir
 from run_ai_bot.bootstrap_env import *
 from run_ai_bot.session import log_to_db
 from run_ai_bot.state import *
+from services.applied_jobs_ledger import get_applied_jobs_ledger
 
 def failed_job(
     job_id: str,
@@ -156,7 +157,8 @@ def submitted_jobs(
                     "Connect Request": truncate_for_csv(connect_request),
                 }
             )
-        
+        get_applied_jobs_ledger(user_id, file_name).add(job_id)
+
         # Log to DB
         log_to_db(
             status="applied",
@@ -4,22 +4,18 @@ from run_ai_bot.bootstrap_env import *
 from run_ai_bot.state import *
 
 from modules.human_actions import human_move_and_click
+from services.applied_jobs_ledger import AppliedJobsLedger, get_applied_jobs_ledger
 
 
-def get_applied_job_ids() -> set[str]:
+def get_applied_job_ids() -> AppliedJobsLedger:
     """
-    Function to get a `set` of applied job's Job IDs
-    * Returns a set of Job IDs from existing applied jobs history csv file
+    Function to get the applied job's Job IDs
+    * Returns the per-user ledger (set-like: ``in`` / ``add``) indexed beside the applied jobs history csv file
+    * The legacy csv is only parsed once, the first time the ledger is created
     """
-    job_ids: set[str] = set()
-    try:
-        with open(file_name, "r", encoding="utf-8") as file:
-            reader = csv.reader(file)
-            for row in reader:
-                job_ids.add(row[0])
-    except FileNotFoundError:
-        print_lg(f"The CSV file '{file_name}' does not exist.")
-    return job_ids
+    ledger = get_applied_jobs_ledger(user_id, file_name)
+    ledger.refresh()
+    return ledger
 
 
 def set_search_location() -> None:
@@ -6,11 +6,12 @@ LinkedIn login sessions are persisted in per-account Chrome profiles
 
 from run_ai_bot.bootstrap_env import *
 from run_ai_bot.state import *
+from services import application_log_writer
 
 
 def log_to_db(status, **kwargs):
-    """Helper to log application events to the database."""
+    """Queue an application event for the DB (write-behind, never blocks on it)."""
     try:
-        db.log_application(user_id, status=status, **kwargs)
+        application_log_writer.log_application(user_id, status=status, **kwargs)
     except Exception as e:
         print_lg(f"Failed to log to DB: {e}")
@@ -72,32 +72,37 @@ async def _app_lifespan(app: FastAPI):
     except Exception:
         log.exception("Stale automation task reconcile failed")
 
-    scheduler_stop = asyncio.Event()
+    try:
+        from services.connect_campaigns import migrate_legacy_campaigns
 
-    async def _connect_campaign_scheduler() -> None:
-        from services.connect_campaigns import tick_scheduled_campaigns
+        n = migrate_legacy_campaigns()
+        if n:
+            log.info("Moved %s connect campaign(s) from configs into their own table.", n)
+    except Exception:
+        log.exception("Connect campaign migration failed")
 
-        while not scheduler_stop.is_set():
-            try:
-                tick_scheduled_campaigns()
-            except Exception:
-                log.exception("Connect campaign scheduler tick failed")
-            try:
-                await asyncio.wait_for(scheduler_stop.wait(), timeout=60.0)
-                break
-            except asyncio.TimeoutError:
-                continue
+    from services.campaign_scheduler import scheduler as campaign_scheduler
 
-    scheduler_task = asyncio.create_task(_connect_campaign_scheduler())
+    scheduler_task = asyncio.create_task(campaign_scheduler.run())
 
     yield
 
-    scheduler_stop.set()
+    campaign_scheduler.stop()
     scheduler_task.cancel()
     try:
         await scheduler_task
     except asyncio.CancelledError:
         pass
+    except Exception:
+        log.exception("Connect campaign scheduler failed")
+
+    from services.cloud_billing import close_cloud_billing_clients
+    from utils.offload import shutdown_blocking_executor
+    from utils.user_resolution import close_session_http_client
+
+    await close_session_http_client()
+    await close_cloud_billing_clients()
+    shutdown_blocking_executor()
 
     if stop_supervisor(reason="backend_shutdown"):
         log.info("Stopped job-applier supervisor on backend shutdown")
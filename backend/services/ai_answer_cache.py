@@ -0,0 +1,135 @@
+"""Persistent per-user cache of LLM answers to Easy Apply screening questions.
+
+The same questions ("How many years of experience with Python?", "Are you
+authorized to work…") repeat across hundreds of postings. Answers to
+free-text questions are keyed on the normalised label + question type and
+stored in the ``ai_answer_cache`` table so every worker for a user shares them.
+
+Env:
+  AI_ANSWER_CACHE_TTL_DAYS     — entries older than this are re-asked (default 30)
+  AI_ANSWER_CACHE_MAX_ENTRIES  — per-user LRU bound (default 2000)
+  AI_ANSWER_CACHE              — set to 0/false/off to bypass the cache
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import threading
+from typing import Callable
+
+# Only single-line text questions are answered by the LLM and reused: free-form
+# textareas ("Why do you want to join us?") usually reference the specific
+# company or posting, and select / radio questions never reach the LLM.
+CACHEABLE_QUESTION_TYPES = ("text",)
+
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+# What the form filler shows for a question without a label; every unlabelled
+# question would otherwise share one cache entry.
+_PLACEHOLDER_LABELS = frozenset({"", "unknown"})
+
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "stores": 0}
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = (os.getenv(name) or "").strip()
+    try:
+        return int(raw) if raw else default
+    except ValueError:
+        return default
+
+
+def cache_enabled() -> bool:
+    return (os.getenv("AI_ANSWER_CACHE") or "1").strip().lower() not in (
+        "0",
+        "false",
+        "no",
+        "off",
+    )
+
+
+def normalize_question(label: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace."""
+    return _NON_WORD.sub(" ", str(label or "").lower()).strip()
+
+
+def answer_cache_key(label: str, question_type: str) -> str:
+    raw = "\x1f".join((question_type or "", normalize_question(label)))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _bump(counter: str) -> None:
+    with _stats_lock:
+        _stats[counter] += 1
+
+
+def get_answer_cache_stats() -> dict:
+    """Hit/miss/store counters for this process."""
+    with _stats_lock:
+        stats = dict(_stats)
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+    return stats
+
+
+def reset_answer_cache_stats() -> None:
+    with _stats_lock:
+        for key in _stats:
+            _stats[key] = 0
+
+
+def cached_ai_answer(
+    *,
+    user_id: str,
+    label: str | None,
+    question_type: str,
+    produce: Callable[[], str | None],
+) -> str | None:
+    """Return a cached answer, or call ``produce`` (the LLM) and store its result.
+
+    Unlabelled questions (``label`` empty or the "Unknown" placeholder) and
+    empty / non-string answers are never cached. DB errors degrade to a plain
+    ``produce()`` call so the cache can never block an application.
+    """
+    if (
+        not user_id
+        or question_type not in CACHEABLE_QUESTION_TYPES
+        or normalize_question(label) in _PLACEHOLDER_LABELS
+        or not cache_enabled()
+    ):
+        return produce()
+
+    from db_manager import db
+
+    key = answer_cache_key(label, question_type)
+    try:
+        cached = db.get_cached_ai_answer(
+            user_id,
+            key,
+            max_age_days=_env_int("AI_ANSWER_CACHE_TTL_DAYS", 30),
+        )
+    except Exception:
+        cached = None
+    if cached:
+        _bump("hits")
+        return cached
+
+    _bump("misses")
+    answer = produce()
+    if answer and isinstance(answer, str) and answer.strip():
+        try:
+            db.put_cached_ai_answer(
+                user_id,
+                key,
+                question=str(label),
+                question_type=question_type,
+                answer=answer,
+                max_entries=_env_int("AI_ANSWER_CACHE_MAX_ENTRIES", 2000),
+            )
+            _bump("stores")
+        except Exception:
+            pass
+    return answer
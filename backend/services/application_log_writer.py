@@ -0,0 +1,342 @@
+"""Write-behind queue for the job-applier's ``applications`` rows.
+
+Bot workers log every applied / failed / skipped job (including each
+blacklisted-company skip). Committing each one synchronously stalls the
+Selenium loop on the DB, and fails outright while the DB is locked or down.
+``submit`` only enqueues; one daemon thread per worker process inserts
+batches through ``db.log_applications``:
+
+  * a batch is written every ``APPLICATION_LOG_BATCH`` rows (default 25) or
+    ``APPLICATION_LOG_FLUSH_SECONDS`` (default 2.0), whichever comes first;
+  * the queue holds ``APPLICATION_LOG_QUEUE_MAX`` rows (default 2000); when it
+    is full, or a batch insert fails, rows are appended to a JSONL spill file
+    under ``APPLICATION_LOG_SPILL_DIR`` (default ``<runtime root>/logs/
+    application_spill``) and replayed once the DB accepts writes again.
+    Another worker's spill file is claimed (atomic rename) and replayed by
+    the next writer that starts once it has been idle for 5 minutes;
+  * ``close()`` drains the queue; it runs from ``atexit`` and from the
+    SIGTERM handler installed by ``install_signal_handlers``.
+
+``APPLICATION_LOG_WRITE_BEHIND=0`` writes synchronously instead.
+"""
+
+from __future__ import annotations
+
+import atexit
+import glob
+import json
+import logging
+import os
+import queue
+import signal
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+from app_paths import get_runtime_writable_root
+from db_manager import db
+from models import Application
+
+_STOP = object()
+_COLUMNS = frozenset(Application.__table__.columns.keys())
+
+# Leave other workers' spill files alone while they may still append to them.
+_FOREIGN_SPILL_IDLE_SECONDS = 300.0
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = (os.getenv(name) or "").strip()
+    try:
+        return max(1, int(raw)) if raw else default
+    except ValueError:
+        return default
+
+
+def _env_seconds(name: str, default: float) -> float:
+    raw = (os.getenv(name) or "").strip()
+    try:
+        return max(0.0, float(raw)) if raw else default
+    except ValueError:
+        return default
+
+
+def default_spill_dir() -> str:
+    return (os.getenv("APPLICATION_LOG_SPILL_DIR") or "").strip() or os.path.join(
+        get_runtime_writable_root(), "logs", "application_spill"
+    )
+
+
+def _to_json(row: dict[str, Any]) -> str:
+    out = dict(row)
+    ts = out.get("timestamp")
+    if isinstance(ts, datetime):
+        out["timestamp"] = ts.isoformat()
+    return json.dumps(out, ensure_ascii=False, default=str)
+
+
+def _from_json(line: str) -> dict[str, Any]:
+    row = json.loads(line)
+    ts = row.get("timestamp")
+    if isinstance(ts, str):
+        row["timestamp"] = datetime.fromisoformat(ts)
+    return row
+
+
+class ApplicationLogWriter:
+    """Batches ``applications`` inserts on a background thread."""
+
+    def __init__(
+        self,
+        *,
+        batch_size: int | None = None,
+        flush_seconds: float | None = None,
+        max_queue: int | None = None,
+        spill_dir: str | None = None,
+        sink=None,
+    ) -> None:
+        self.batch_size = batch_size or _env_int("APPLICATION_LOG_BATCH", 25)
+        self.flush_seconds = (
+            flush_seconds
+            if flush_seconds is not None
+            else _env_seconds("APPLICATION_LOG_FLUSH_SECONDS", 2.0)
+        )
+        self.spill_dir = spill_dir or default_spill_dir()
+        self.spill_path = os.path.join(
+            self.spill_dir, f"{os.getpid()}-{int(time.time() * 1000)}.jsonl"
+        )
+        self._sink = sink or db.log_applications
+        self._queue: queue.Queue = queue.Queue(
+            maxsize=max_queue or _env_int("APPLICATION_LOG_QUEUE_MAX", 2000)
+        )
+        self._spill_lock = threading.Lock()
+        self._spill_pending = bool(glob.glob(os.path.join(self.spill_dir, "*.jsonl")))
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+
+    # -- producer side (bot thread; never blocks on the DB) ------------
+
+    def submit(self, user_id: str, **fields: Any) -> None:
+        """Queue one row; the timestamp is taken now, not at insert time.
+
+        Unknown column names raise ``TypeError`` here, so a bad row can never
+        wedge the queue or a spill file.
+        """
+        unknown = set(fields) - _COLUMNS
+        if unknown:
+            raise TypeError(f"unknown applications columns: {sorted(unknown)}")
+        row = {"user_id": user_id, **fields}
+        if row.get("timestamp") is None:
+            row["timestamp"] = datetime.now(timezone.utc)
+        if self._closed:
+            self._write_now([row])
+            return
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self._spill([row])
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="application-log-writer", daemon=True
+                )
+                self._thread.start()
+
+    # -- writer thread ---------------------------------------------------
+
+    def _run(self) -> None:
+        batch: list[dict[str, Any]] = []
+        deadline = None
+        stopping = False
+        while not stopping:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                stopping = True
+            elif item is not None:
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_seconds
+            if batch and (
+                stopping or len(batch) >= self.batch_size or time.monotonic() >= deadline
+            ):
+                self._flush(batch)
+                batch, deadline = [], None
+        # Rows submitted after the stop marker (racing close()).
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                batch.append(item)
+        if batch:
+            self._flush(batch)
+        elif self._spill_pending:
+            self.replay_spill()
+
+    def _flush(self, batch: list[dict[str, Any]]) -> None:
+        if self._spill_pending and not self.replay_spill():
+            self._spill(batch)  # DB still down: keep the order, skip the insert
+            return
+        try:
+            self._sink(batch)
+        except Exception as exc:
+            logging.warning("application log: batch of %d spilled to disk: %s", len(batch), exc)
+            self._spill(batch)
+
+    def _write_now(self, rows: list[dict[str, Any]]) -> None:
+        try:
+            self._sink(rows)
+        except Exception as exc:
+            logging.warning("application log: write failed, spilled to disk: %s", exc)
+            self._spill(rows)
+
+    # -- spill files -------------------------------------------------------
+
+    def _spill(self, rows: list[dict[str, Any]]) -> None:
+        with self._spill_lock:
+            try:
+                os.makedirs(self.spill_dir, exist_ok=True)
+                with open(self.spill_path, "a", encoding="utf-8") as fh:
+                    for row in rows:
+                        fh.write(_to_json(row) + "\n")
+                self._spill_pending = True
+            except OSError as exc:
+                logging.error("application log: dropped %d rows (spill failed: %s)", len(rows), exc)
+
+    def _claim_spill_files(self) -> list[tuple[str, str]]:
+        """Rename replayable spill files out of the way: ``[(path, claimed)]``."""
+        claims = []
+        with self._spill_lock:
+            self._spill_pending = False
+            for path in sorted(glob.glob(os.path.join(self.spill_dir, "*.jsonl"))):
+                if path != self.spill_path:
+                    try:
+                        idle = time.time() - os.path.getmtime(path)
+                    except OSError:
+                        continue
+                    if idle < _FOREIGN_SPILL_IDLE_SECONDS:
+                        continue
+                claimed = f"{path}.{os.getpid()}.replay"
+                try:
+                    os.replace(path, claimed)  # another worker may claim it first
+                except OSError:
+                    continue
+                claims.append((path, claimed))
+        return claims
+
+    def _unclaim(self, path: str, claimed: str) -> None:
+        """Put a claimed file back, ahead of anything spilled since the claim."""
+        with self._spill_lock:
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as src, open(
+                    claimed, "a", encoding="utf-8"
+                ) as dst:
+                    dst.write(src.read())
+            os.replace(claimed, path)
+            self._spill_pending = True
+
+    def replay_spill(self) -> bool:
+        """Insert spilled rows (own file + idle foreign ones); False if the DB refused.
+
+        The spill lock is only held to claim / restore files, never across the
+        insert, so ``submit`` can keep spilling while the DB is slow.
+        """
+        claims = self._claim_spill_files()
+        for i, (path, claimed) in enumerate(claims):
+            rows = []
+            try:
+                with open(claimed, "r", encoding="utf-8") as fh:
+                    for line in fh:
+                        try:
+                            rows.append(_from_json(line))
+                        except ValueError:
+                            if line.strip():  # torn write from a killed worker
+                                logging.warning("application log: bad spill line skipped")
+                self._sink(rows)
+            except Exception as exc:
+                logging.warning("application log: spill replay deferred: %s", exc)
+                for pending in claims[i:]:
+                    self._unclaim(*pending)
+                return False
+            os.remove(claimed)
+            if rows:
+                logging.info("application log: replayed %d spilled rows", len(rows))
+        return True
+
+    # -- shutdown ------------------------------------------------------------
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Flush queued rows and stop the writer thread (idempotent)."""
+        if self._closed:
+            return
+        self._closed = True
+        thread = self._thread
+        if thread is None:
+            if self._spill_pending:
+                self.replay_spill()
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            pass
+        thread.join(timeout)
+
+
+_writer: ApplicationLogWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def write_behind_enabled() -> bool:
+    raw = (os.getenv("APPLICATION_LOG_WRITE_BEHIND") or "").strip().lower()
+    return raw not in ("0", "false", "no")
+
+
+def get_application_writer() -> ApplicationLogWriter:
+    """Process-wide writer (created on first use, flushed at exit)."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = ApplicationLogWriter()
+            atexit.register(_writer.close)
+        return _writer
+
+
+def log_application(user_id: str, **fields: Any) -> None:
+    """Record one application row, write-behind unless disabled."""
+    if write_behind_enabled():
+        get_application_writer().submit(user_id, **fields)
+    else:
+        db.log_application(user_id, **fields)
+
+
+def close_application_writer() -> None:
+    with _writer_lock:
+        writer = _writer
+    if writer is not None:
+        writer.close()
+
+
+def install_signal_handlers() -> None:
+    """Flush on SIGTERM (supervisor stop) before the default exit path runs."""
+    if threading.current_thread() is not threading.main_thread():
+        return
+    previous = signal.getsignal(signal.SIGTERM)
+
+    def _on_term(signum, frame):
+        close_application_writer()
+        if callable(previous):
+            previous(signum, frame)
+        raise SystemExit(128 + signum)
+
+    signal.signal(signal.SIGTERM, _on_term)
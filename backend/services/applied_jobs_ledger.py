@@ -0,0 +1,144 @@
+"""Per-user index of applied LinkedIn job IDs (sidecar to the applied-jobs CSV).
+
+The applied-jobs CSV keeps full rows (including multi-KB "About Job" cells),
+so re-parsing it at every ``apply_to_jobs`` cycle gets slower as history
+grows. The ledger stores one job ID per line next to that CSV:
+
+  all excels/applied_job_ids/<user>.txt
+
+Membership checks hit an in-memory set; new IDs are appended to the file.
+``refresh()`` only reads bytes appended since the last read, so sibling
+workers for the same user pick up each other's applies cheaply. The first
+time a user's ledger is opened it is seeded from the legacy CSV.
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+import threading
+
+LEDGER_SUBDIR = "applied_job_ids"
+
+_ledgers: dict[str, "AppliedJobsLedger"] = {}
+_ledgers_lock = threading.Lock()
+
+
+def _safe_user_tag(user_id: str) -> str:
+    return "".join(c if c.isalnum() or c in "-_.@" else "_" for c in str(user_id))[:120]
+
+
+def ledger_path_for(user_id: str, csv_path: str) -> str:
+    """Sidecar path for ``user_id`` beside the applied-jobs CSV."""
+    base = os.path.dirname(csv_path) or "."
+    return os.path.join(base, LEDGER_SUBDIR, f"{_safe_user_tag(user_id)}.txt")
+
+
+def import_legacy_csv(csv_path: str, ledger_path: str) -> int:
+    """One-time import of job IDs (first column) from a legacy applied-jobs CSV.
+
+    Writes the ledger atomically so a crash mid-import never leaves a partial
+    index that would hide the rest of the history. Returns the number of IDs
+    written (0 when the CSV does not exist).
+    """
+    job_ids: list[str] = []
+    seen: set[str] = set()
+    try:
+        with open(csv_path, "r", encoding="utf-8", newline="") as fh:
+            reader = csv.reader(fh)
+            for row in reader:
+                if not row:
+                    continue
+                job_id = row[0].strip()
+                if not job_id or job_id == "Job ID" or job_id in seen:
+                    continue
+                seen.add(job_id)
+                job_ids.append(job_id)
+    except FileNotFoundError:
+        pass
+
+    os.makedirs(os.path.dirname(ledger_path) or ".", exist_ok=True)
+    tmp_path = f"{ledger_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        for job_id in job_ids:
+            fh.write(job_id + "\n")
+    os.replace(tmp_path, ledger_path)
+    return len(job_ids)
+
+
+class AppliedJobsLedger:
+    """Set-like view of applied job IDs backed by an append-only file."""
+
+    def __init__(self, path: str, *, legacy_csv: str | None = None):
+        self.path = path
+        self._ids: set[str] = set()
+        self._offset = 0
+        self._lock = threading.Lock()
+        if not os.path.exists(path):
+            if legacy_csv:
+                import_legacy_csv(legacy_csv, path)
+            else:
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                open(path, "a", encoding="utf-8").close()
+        self.refresh()
+
+    def __contains__(self, job_id: object) -> bool:
+        return str(job_id).strip() in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self):
+        return iter(set(self._ids))
+
+    def refresh(self) -> int:
+        """Read IDs appended since the last refresh (by this or another process)."""
+        with self._lock:
+            try:
+                with open(self.path, "rb") as fh:
+                    fh.seek(self._offset)
+                    chunk = fh.read()
+            except FileNotFoundError:
+                return 0
+            # Only consume complete lines; a concurrent writer may be mid-append.
+            end = chunk.rfind(b"\n")
+            if end < 0:
+                return 0
+            added = 0
+            for raw in chunk[: end + 1].splitlines():
+                job_id = raw.decode("utf-8", errors="replace").strip()
+                if job_id and job_id not in self._ids:
+                    self._ids.add(job_id)
+                    added += 1
+            self._offset += end + 1
+            return added
+
+    def add(self, job_id: str) -> bool:
+        """Record ``job_id``; returns False when it was already present."""
+        job_id = str(job_id).strip()
+        if not job_id:
+            return False
+        with self._lock:
+            if job_id in self._ids:
+                return False
+            self._ids.add(job_id)
+            with open(self.path, "a", encoding="utf-8") as fh:
+                fh.write(job_id + "\n")
+            return True
+
+
+def get_applied_jobs_ledger(user_id: str, csv_path: str) -> AppliedJobsLedger:
+    """Process-wide ledger for ``user_id`` (opened once, refreshed incrementally)."""
+    path = ledger_path_for(user_id, csv_path)
+    with _ledgers_lock:
+        ledger = _ledgers.get(path)
+        if ledger is None:
+            ledger = AppliedJobsLedger(path, legacy_csv=csv_path)
+            _ledgers[path] = ledger
+    return ledger
+
+
+def clear_applied_jobs_ledgers() -> None:
+    """Forget opened ledgers (tests)."""
+    with _ledgers_lock:
+        _ledgers.clear()
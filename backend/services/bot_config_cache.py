@@ -5,16 +5,25 @@ Load once at startup; job execution reads from memory instead of SQLite.
 
 from __future__ import annotations
 
+import difflib
+import json
 import os
 from typing import Any
 
+from services.ai_answer_cache import normalize_question
+from services.phrase_matcher import PhraseMatcher, compile_phrase_matchers
 from services.smart_rate_limit import RateLimitSettings, settings_from_mapping
 
+CUSTOM_QA_PATH = "config/custom_qa.json"
+
 _config: dict[str, Any] | None = None
 _rate_settings: RateLimitSettings | None = None
 _user_resumes: list[dict] | None = None
 _default_resume_asset: dict | None = None
+_phrase_matchers: dict[str, PhraseMatcher] | None = None
 _warmed: bool = False
+_custom_qa: "CustomQAIndex | None" = None
+_custom_qa_stamp: tuple[str, float | None] | None = None
 
 
 def is_warmed() -> bool:
@@ -24,16 +33,21 @@ def is_warmed() -> bool:
 def clear_bot_config_cache() -> None:
     """Drop cached config (tests and forced reload)."""
     global _config, _rate_settings, _user_resumes, _default_resume_asset, _warmed
+    global _phrase_matchers, _custom_qa, _custom_qa_stamp
     _config = None
     _rate_settings = None
     _user_resumes = None
     _default_resume_asset = None
+    _phrase_matchers = None
     _warmed = False
+    _custom_qa = None
+    _custom_qa_stamp = None
 
 
 def warm_bot_config_cache(*, force: bool = False) -> dict[str, Any]:
     """Load dashboard config + resume metadata from DB once into memory."""
     global _config, _rate_settings, _user_resumes, _default_resume_asset, _warmed
+    global _phrase_matchers
     if _warmed and not force:
         return _config  # type: ignore[return-value]
 
@@ -58,6 +72,7 @@ def warm_bot_config_cache(*, force: bool = False) -> dict[str, Any]:
 
     _config = config
     _rate_settings = settings_from_mapping(config)
+    _phrase_matchers = compile_phrase_matchers(config)
     _user_resumes = resumes
     _default_resume_asset = default_asset
     _warmed = True
@@ -82,6 +97,13 @@ def get_rate_settings() -> RateLimitSettings:
     return _rate_settings  # type: ignore[return-value]
 
 
+def get_phrase_matchers() -> dict[str, PhraseMatcher]:
+    """Bad-word / blacklist / deal-breaker matchers compiled at warm time."""
+    if not _warmed:
+        warm_bot_config_cache()
+    return _phrase_matchers  # type: ignore[return-value]
+
+
 def get_cached_user_resumes() -> list[dict]:
     if not _warmed:
         warm_bot_config_cache()
@@ -92,3 +114,73 @@ def get_cached_default_resume_asset() -> dict | None:
     if not _warmed:
         warm_bot_config_cache()
     return _default_resume_asset
+
+
+class CustomQAIndex:
+    """Curated Easy Apply answers indexed by exact and normalised label.
+
+    Supports ``key in index`` / ``index[key]`` like the raw dict, but also
+    matches labels that differ only in case, punctuation or spacing.
+    """
+
+    def __init__(self, entries: dict[str, Any] | None = None):
+        self._exact: dict[str, Any] = dict(entries or {})
+        self._normalized: dict[str, Any] = {}
+        for key, answer in self._exact.items():
+            self._normalized.setdefault(normalize_question(key), answer)
+        self._fuzzy_memo: dict[tuple[str, float], str | None] = {}
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def __contains__(self, label: object) -> bool:
+        return self.lookup(str(label)) is not None
+
+    def __getitem__(self, label: str) -> Any:
+        answer = self.lookup(label)
+        if answer is None:
+            raise KeyError(label)
+        return answer
+
+    def lookup(self, label: str, *, fuzzy: bool = False, cutoff: float = 0.95) -> Any:
+        """Exact, then normalised, then (opt-in) closest normalised label."""
+        if label in self._exact:
+            return self._exact[label]
+        norm = normalize_question(label)
+        if norm in self._normalized:
+            return self._normalized[norm]
+        if not fuzzy or not norm:
+            return None
+        memo_key = (norm, cutoff)
+        if memo_key not in self._fuzzy_memo:
+            matches = difflib.get_close_matches(
+                norm, self._normalized.keys(), n=1, cutoff=cutoff
+            )
+            self._fuzzy_memo[memo_key] = matches[0] if matches else None
+        match = self._fuzzy_memo[memo_key]
+        return self._normalized[match] if match is not None else None
+
+
+def get_custom_qa(path: str = CUSTOM_QA_PATH) -> CustomQAIndex:
+    """Load ``custom_qa.json`` once; reload only when its mtime changes."""
+    global _custom_qa, _custom_qa_stamp
+    try:
+        mtime: float | None = os.stat(path).st_mtime
+    except OSError:
+        mtime = None
+    stamp = (path, mtime)
+    if _custom_qa is not None and _custom_qa_stamp == stamp:
+        return _custom_qa
+
+    entries: dict[str, Any] = {}
+    if mtime is not None:
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                loaded = json.load(fh)
+            if isinstance(loaded, dict):
+                entries = loaded
+        except (OSError, ValueError):
+            entries = {}
+    _custom_qa = CustomQAIndex(entries)
+    _custom_qa_stamp = stamp
+    return _custom_qa
@@ -0,0 +1,222 @@
+"""Event-driven scheduler for connect campaigns (replaces the 60s full scan).
+
+Every scheduled campaign has one entry in a min-heap keyed on its next fire
+time. The loop sleeps until the earliest entry is due (or until woken by a
+create / update / delete), then launches it and pushes its next slot.
+
+  * The heap is rebuilt from ``connect_campaigns`` on startup and every
+    ``CONNECT_SCHEDULE_RESYNC`` seconds (default 600), which also picks up
+    edits made by other workers.
+  * A slot missed by up to ``CONNECT_SCHEDULE_GRACE`` seconds (default 900),
+    e.g. a restart or a busy account, still fires; a failed launch is
+    retried every ``CONNECT_SCHEDULE_RETRY`` seconds (default 60) inside that
+    window, then the campaign moves on to the next day.
+
+Superseded heap entries are skipped lazily (each campaign's current entry
+carries a sequence number), so updates never rewrite the heap.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from db_manager import db
+from services import connect_campaigns as cc
+from utils.offload import run_blocking
+
+
+def _env_seconds(name: str, default: float) -> float:
+    raw = (os.getenv(name) or "").strip()
+    try:
+        return max(0.0, float(raw)) if raw else default
+    except ValueError:
+        return default
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class CampaignScheduler:
+    """Min-heap of ``(fire_at, seq, campaign_id)`` plus the loop that drains it."""
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int, str]] = []
+        self._entries: dict[str, tuple[float, int, str]] = {}  # id -> (fire_at, seq, user_id)
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+        self._stopped = False
+
+    @property
+    def grace_seconds(self) -> float:
+        return _env_seconds("CONNECT_SCHEDULE_GRACE", 900.0)
+
+    # -- heap maintenance (any thread) ---------------------------------
+
+    def _push(self, campaign_id: str, user_id: str, fire_at: datetime | None) -> None:
+        if fire_at is None:
+            self._entries.pop(campaign_id, None)
+            return
+        ts = fire_at.timestamp()
+        seq = next(self._seq)
+        self._entries[campaign_id] = (ts, seq, user_id)
+        heapq.heappush(self._heap, (ts, seq, campaign_id))
+
+    def _notify(self) -> None:
+        loop, wake = self._loop, self._wake
+        if loop is None or wake is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(wake.set)
+        except RuntimeError:
+            pass  # loop shutting down
+
+    def rebuild(self) -> int:
+        """Reload every scheduled campaign from the DB. Returns the entry count."""
+        now = _utcnow()
+        scheduled = db.list_scheduled_connect_campaigns()
+        with self._lock:
+            self._heap = []
+            self._entries = {}
+            for user_id, campaign in scheduled:
+                self._push(
+                    campaign["id"],
+                    user_id,
+                    cc.next_fire_at(campaign, now, grace_seconds=self.grace_seconds),
+                )
+            count = len(self._entries)
+        self._notify()
+        return count
+
+    def update(self, user_id: str, campaign: dict[str, Any]) -> None:
+        """(Re)schedule after a create/update; unscheduled campaigns are dropped."""
+        fire_at = cc.next_fire_at(campaign, _utcnow(), grace_seconds=self.grace_seconds)
+        with self._lock:
+            self._push(campaign["id"], user_id, fire_at)
+        self._notify()
+
+    def remove(self, campaign_id: str) -> None:
+        with self._lock:
+            self._entries.pop(campaign_id, None)
+        self._notify()
+
+    def next_fire_at(self, campaign_id: str) -> datetime | None:
+        with self._lock:
+            entry = self._entries.get(campaign_id)
+        return datetime.fromtimestamp(entry[0], timezone.utc) if entry else None
+
+    def pop_due(self, now: datetime) -> list[tuple[str, str]]:
+        """``(campaign_id, user_id)`` whose fire time has passed (entries removed)."""
+        due: list[tuple[str, str]] = []
+        cutoff = now.timestamp()
+        with self._lock:
+            while self._heap and self._heap[0][0] <= cutoff:
+                _, seq, campaign_id = heapq.heappop(self._heap)
+                entry = self._entries.get(campaign_id)
+                if entry is None or entry[1] != seq:
+                    continue  # superseded or removed
+                del self._entries[campaign_id]
+                due.append((campaign_id, entry[2]))
+        return due
+
+    def seconds_until_next(self, now: datetime) -> float | None:
+        with self._lock:
+            while self._heap:
+                _, seq, campaign_id = self._heap[0]
+                entry = self._entries.get(campaign_id)
+                if entry is not None and entry[1] == seq:
+                    return max(0.0, entry[0] - now.timestamp())
+                heapq.heappop(self._heap)
+        return None
+
+    # -- firing (blocking; runs on the offload pool) -------------------
+
+    def fire(self, campaign_id: str, user_id: str) -> bool:
+        """Launch a due campaign and schedule its next slot. True if launched."""
+        now = _utcnow()
+        grace = self.grace_seconds
+        campaign = cc.get_campaign(user_id, campaign_id)
+        if campaign is None:
+            return False
+        if not cc._schedule_due(campaign, now, grace_seconds=grace):
+            # Ran manually today, schedule changed, or too late: next slot.
+            self.update(user_id, campaign)
+            return False
+        try:
+            cc.run_campaign(user_id, campaign_id, source="schedule")
+        except Exception as exc:
+            logging.info(
+                "connect_campaigns: skip scheduled run user=%s campaign=%s: %s",
+                user_id,
+                campaign.get("name"),
+                exc,
+            )
+            retry_at = now + timedelta(seconds=_env_seconds("CONNECT_SCHEDULE_RETRY", 60.0))
+            if cc._schedule_due(campaign, retry_at, grace_seconds=grace):
+                with self._lock:
+                    self._push(campaign_id, user_id, retry_at)
+            else:
+                self.update(user_id, campaign)
+            return False
+        logging.info(
+            "connect_campaigns: scheduled run user=%s campaign=%s",
+            user_id,
+            campaign.get("name"),
+        )
+        launched = cc.get_campaign(user_id, campaign_id) or campaign
+        self.update(user_id, launched)
+        return True
+
+    # -- loop ------------------------------------------------------------
+
+    async def run(self) -> None:
+        """Drain the heap until ``stop()``; started from the app lifespan."""
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._stopped = False
+        try:
+            await run_blocking(self.rebuild)
+        except Exception:
+            logging.exception("connect_campaigns: scheduler rebuild failed")
+        last_sync = time.monotonic()
+        while not self._stopped:
+            self._wake.clear()
+            for campaign_id, user_id in self.pop_due(_utcnow()):
+                try:
+                    await run_blocking(self.fire, campaign_id, user_id)
+                except Exception:
+                    logging.exception(
+                        "connect_campaigns: scheduled launch failed campaign=%s", campaign_id
+                    )
+            resync = _env_seconds("CONNECT_SCHEDULE_RESYNC", 600.0)
+            if resync and time.monotonic() - last_sync >= resync:
+                try:
+                    await run_blocking(self.rebuild)
+                except Exception:
+                    logging.exception("connect_campaigns: scheduler resync failed")
+                last_sync = time.monotonic()
+            delay = self.seconds_until_next(_utcnow())
+            if resync:
+                to_sync = max(0.0, resync - (time.monotonic() - last_sync))
+                delay = to_sync if delay is None else min(delay, to_sync)
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self) -> None:
+        self._stopped = True
+        self._notify()
+
+
+scheduler = CampaignScheduler()
@@ -1,14 +1,41 @@
-"""Fetch subscription state from the cloud API (desktop sidecar + local SQLite)."""
+"""Fetch subscription state from the cloud API (desktop sidecar + local SQLite).
+
+Cloud lookups are cached per user so bot / automation gating does not pay a
+round trip to the cloud API on every start:
+
+  * fresh for ``SUBSCRIPTION_CACHE_TTL`` seconds (default 60);
+  * after that, served stale for up to ``SUBSCRIPTION_CACHE_STALE`` seconds
+    (default 600) while one background refresh runs, and also served when the
+    cloud API is slow or failing;
+  * dropped by ``invalidate_subscription_cache`` (billing webhooks handled in
+    this process). Other processes rely on the TTL.
+
+Async routes call ``fetch_subscription_for_gating`` (pooled ``AsyncClient``,
+never blocks the event loop) before the sync plan checks, which then hit the
+cache. ``get_subscription_for_gating`` stays sync for scheduler threads.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import os
+import threading
+import time
 
 import httpx
 from fastapi import HTTPException
 
 from db_manager import db
 
+_cache: dict[str, tuple[dict | None, float]] = {}  # user_id -> (subscription, fetched_at)
+_cache_lock = threading.Lock()
+_refreshing: set[str] = set()
+_background_tasks: set[asyncio.Task] = set()
+
+_sync_client: httpx.Client | None = None
+_async_client: httpx.AsyncClient | None = None
+_async_client_loop: asyncio.AbstractEventLoop | None = None
+
 
 def _cloud_api_base() -> str:
     return os.getenv("CLOUD_API_URL", "").strip().rstrip("/")
@@ -22,35 +49,177 @@ def uses_cloud_subscription() -> bool:
     return bool(_cloud_api_base() and _internal_key())
 
 
+def _env_seconds(name: str, default: float) -> float:
+    raw = (os.getenv(name) or "").strip()
+    try:
+        return max(0.0, float(raw)) if raw else default
+    except ValueError:
+        return default
+
+
+def _request_args(user_id: str) -> dict:
+    return {
+        "url": f"{_cloud_api_base()}/api/billing/subscription-internal",
+        "params": {"user_id": user_id},
+        "headers": {"X-LinkdApply-Key": _internal_key()},
+    }
+
+
+def _parse_response(resp: httpx.Response) -> dict | None:
+    if resp.status_code == 200:
+        data = resp.json()
+        if not data or data.get("status") == "inactive" and data.get("plan") == "free":
+            return None
+        return data
+    if resp.status_code == 404:
+        return None
+    raise HTTPException(
+        status_code=503,
+        detail="Could not verify subscription with cloud billing service.",
+    )
+
+
+def _cloud_client() -> httpx.Client:
+    global _sync_client
+    if _sync_client is None or _sync_client.is_closed:
+        _sync_client = httpx.Client(timeout=10.0)
+    return _sync_client
+
+
+def _cloud_async_client() -> httpx.AsyncClient:
+    global _async_client, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client.is_closed or _async_client_loop is not loop:
+        _async_client = httpx.AsyncClient(timeout=10.0)
+        _async_client_loop = loop
+    return _async_client
+
+
+async def close_cloud_billing_clients() -> None:
+    """Close pooled clients (app lifespan shutdown)."""
+    global _sync_client, _async_client, _async_client_loop
+    if _async_client is not None and not _async_client.is_closed:
+        await _async_client.aclose()
+    if _sync_client is not None and not _sync_client.is_closed:
+        _sync_client.close()
+    _sync_client = _async_client = _async_client_loop = None
+
+
+def invalidate_subscription_cache(user_id: str | None = None) -> None:
+    """Forget the cached subscription for ``user_id`` (all users when None)."""
+    with _cache_lock:
+        if user_id is None:
+            _cache.clear()
+        else:
+            _cache.pop(user_id, None)
+
+
+def _cached(user_id: str) -> tuple[bool, dict | None, bool]:
+    """(found, subscription, is_fresh) for a usable cache entry."""
+    with _cache_lock:
+        entry = _cache.get(user_id)
+    if entry is None:
+        return False, None, False
+    subscription, fetched_at = entry
+    age = time.monotonic() - fetched_at
+    ttl = _env_seconds("SUBSCRIPTION_CACHE_TTL", 60.0)
+    if age < ttl:
+        return True, subscription, True
+    if age < ttl + _env_seconds("SUBSCRIPTION_CACHE_STALE", 600.0):
+        return True, subscription, False
+    return False, None, False
+
+
+def _store(user_id: str, subscription: dict | None) -> dict | None:
+    with _cache_lock:
+        _cache[user_id] = (subscription, time.monotonic())
+    return subscription
+
+
+def _claim_refresh(user_id: str) -> bool:
+    with _cache_lock:
+        if user_id in _refreshing:
+            return False
+        _refreshing.add(user_id)
+        return True
+
+
+def _release_refresh(user_id: str) -> None:
+    with _cache_lock:
+        _refreshing.discard(user_id)
+
+
+def _fetch_cloud(user_id: str) -> dict | None:
+    try:
+        resp = _cloud_client().get(**_request_args(user_id))
+        return _store(user_id, _parse_response(resp))
+    except HTTPException:
+        raise
+    except Exception as exc:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Cloud subscription check failed: {exc}",
+        ) from exc
+
+
+async def _fetch_cloud_async(user_id: str) -> dict | None:
+    try:
+        resp = await _cloud_async_client().get(**_request_args(user_id))
+        return _store(user_id, _parse_response(resp))
+    except HTTPException:
+        raise
+    except Exception as exc:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Cloud subscription check failed: {exc}",
+        ) from exc
+
+
+def _refresh_in_background(user_id: str) -> None:
+    def _run() -> None:
+        try:
+            _fetch_cloud(user_id)
+        except Exception:
+            pass  # keep serving the stale entry; the next call retries
+        finally:
+            _release_refresh(user_id)
+
+    if _claim_refresh(user_id):
+        threading.Thread(target=_run, name="subscription-refresh", daemon=True).start()
+
+
+async def _refresh_async(user_id: str) -> None:
+    try:
+        await _fetch_cloud_async(user_id)
+    except Exception:
+        pass
+    finally:
+        _release_refresh(user_id)
+
+
 def get_subscription_for_gating(user_id: str) -> dict | None:
     """Subscription for plan limits: cloud Postgres when configured, else local DB."""
-    cloud = _cloud_api_base()
-    key = _internal_key()
-    if cloud and key:
-        try:
-            resp = httpx.get(
-                f"{cloud}/api/billing/subscription-internal",
-                params={"user_id": user_id},
-                headers={"X-LinkdApply-Key": key},
-                timeout=10.0,
-            )
-            if resp.status_code == 200:
-                data = resp.json()
-                if not data or data.get("status") == "inactive" and data.get("plan") == "free":
-                    return None
-                return data
-            if resp.status_code == 404:
-                return None
-            raise HTTPException(
-                status_code=503,
-                detail="Could not verify subscription with cloud billing service.",
-            )
-        except HTTPException:
-            raise
-        except Exception as exc:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Cloud subscription check failed: {exc}",
-            ) from exc
-
-    return db.get_user_subscription(user_id)
+    if not uses_cloud_subscription():
+        return db.get_user_subscription(user_id)
+
+    found, subscription, fresh = _cached(user_id)
+    if found:
+        if not fresh:
+            _refresh_in_background(user_id)
+        return subscription
+    return _fetch_cloud(user_id)
+
+
+async def fetch_subscription_for_gating(user_id: str) -> dict | None:
+    """Async variant for request handlers; warms the cache used by the sync checks."""
+    if not uses_cloud_subscription():
+        return db.get_user_subscription(user_id)
+
+    found, subscription, fresh = _cached(user_id)
+    if found:
+        if not fresh and _claim_refresh(user_id):
+            task = asyncio.create_task(_refresh_async(user_id))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
+        return subscription
+    return await _fetch_cloud_async(user_id)
@@ -1,4 +1,12 @@
-"""Saved Connect search presets with optional daily schedule and run history."""
+"""Saved Connect search presets with optional daily schedule and run history.
+
+Campaigns live in the ``connect_campaigns`` table and each launch in
+``connect_campaign_runs``; creates, runs and finishes are row-level updates.
+Scheduled launches are driven by ``services.campaign_scheduler``.
+Older installs kept every campaign of a user in one JSON config value
+(``CONNECT_CAMPAIGNS_CATEGORY`` / ``CAMPAIGNS_KEY``); ``migrate_legacy_campaigns``
+moves those into the tables once at startup.
+"""
 
 from __future__ import annotations
 
@@ -6,51 +14,79 @@ import json
 import logging
 import re
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
 from db_manager import db
 from services import linkedin_automation as la
 from services.plan_limits import assert_can_run_automation
+from utils.debug_logs import iter_lines_reverse
 
+# Legacy config-blob storage, read only by ``migrate_legacy_campaigns``.
 CONNECT_CAMPAIGNS_CATEGORY = "linkedin_connect_campaigns"
 CAMPAIGNS_KEY = "connect_campaigns"
 TASK_MAP_CATEGORY = "linkedin_connect_campaign_task_map"
 MAX_RUN_HISTORY = 50
 
+# Only this much of a log's tail is scanned when no result sidecar exists.
+CONNECT_LOG_SCAN_BYTES = 1024 * 1024
+
 _CONNECT_SUMMARY_RE = re.compile(
     r"Connect summary:\s*sent=(\d+)\s+skipped=(\d+)", re.IGNORECASE
 )
-_CONNECT_JSON_RE = re.compile(
-    r'"sent"\s*:\s*(\d+).*?"skipped"\s*:\s*(\d+)', re.DOTALL
-)
+# Lines of the indented ``Connect results`` JSON dump.
+_CONNECT_SENT_RE = re.compile(r'"sent"\s*:\s*(\d+)')
+_CONNECT_SKIPPED_RE = re.compile(r'"skipped"\s*:\s*(\d+)')
 
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _read_connect_result(log_path: str) -> tuple[int, int] | None:
+    """sent/skipped from the task's JSON result sidecar, if it wrote one."""
+    try:
+        with open(la.result_path_for(log_path), "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        results = data["results"]
+        return int(results.get("sent") or 0), int(results.get("skipped") or 0)
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        return None
+
+
 def _parse_connect_log(log_path: str | None) -> tuple[int, int]:
-    """Best-effort sent/skipped counts from a connect task log file."""
+    """Best-effort sent/skipped counts for a finished connect task.
+
+    Prefers the result sidecar; otherwise scans the log backwards from EOF
+    (the summary is among the last lines) and stops at the first match.
+    """
     if not log_path:
         return 0, 0
+    counts = _read_connect_result(log_path)
+    if counts is not None:
+        return counts
+
+    skipped: int | None = None
     try:
-        with open(log_path, "r", encoding="utf-8", errors="replace") as fh:
-            text = fh.read()
+        for line in iter_lines_reverse(log_path, max_bytes=CONNECT_LOG_SCAN_BYTES):
+            m = _CONNECT_SUMMARY_RE.search(line)
+            if m:
+                return int(m.group(1)), int(m.group(2))
+            # Reading upwards, the dump's "skipped" line comes before "sent".
+            if skipped is None:
+                m = _CONNECT_SKIPPED_RE.search(line)
+                if m:
+                    skipped = int(m.group(1))
+            else:
+                m = _CONNECT_SENT_RE.search(line)
+                if m:
+                    return int(m.group(1)), skipped
     except OSError:
         return 0, 0
-
-    m = _CONNECT_SUMMARY_RE.search(text)
-    if m:
-        return int(m.group(1)), int(m.group(2))
-
-    m = _CONNECT_JSON_RE.search(text)
-    if m:
-        return int(m.group(1)), int(m.group(2))
     return 0, 0
 
 
-def _load_campaigns_raw(user_id: str) -> list[dict[str, Any]]:
+def _load_legacy_campaigns(user_id: str) -> list[dict[str, Any]]:
     cfg = db.get_all_by_category(CONNECT_CAMPAIGNS_CATEGORY, user_id=user_id) or {}
     blob = cfg.get(CAMPAIGNS_KEY)
     if isinstance(blob, list):
@@ -58,8 +94,33 @@ def _load_campaigns_raw(user_id: str) -> list[dict[str, Any]]:
     return []
 
 
-def _save_campaigns_raw(user_id: str, campaigns: list[dict[str, Any]]) -> None:
-    db.set_config(CAMPAIGNS_KEY, campaigns, CONNECT_CAMPAIGNS_CATEGORY, user_id=user_id)
+def migrate_legacy_campaigns() -> int:
+    """Move config-blob campaigns into the campaign tables. Returns campaigns imported.
+
+    Idempotent: campaigns already in the table are skipped, and the blob and
+    the old task -> campaign map are deleted once copied. Open runs keep
+    their ``task_id``, so a task still running finishes into the new rows.
+    """
+    imported = 0
+    try:
+        user_ids = db.list_config_user_ids(CONNECT_CAMPAIGNS_CATEGORY, CAMPAIGNS_KEY)
+    except Exception as exc:
+        logging.warning("connect_campaigns: could not list legacy campaigns: %s", exc)
+        return 0
+    for user_id in user_ids:
+        try:
+            for campaign in _load_legacy_campaigns(user_id):
+                if db.import_connect_campaign(user_id, campaign):
+                    imported += 1
+            db.delete_config(CAMPAIGNS_KEY, CONNECT_CAMPAIGNS_CATEGORY, user_id=user_id)
+            task_map = db.get_all_by_category(TASK_MAP_CATEGORY, user_id=user_id) or {}
+            for task_id in task_map:
+                db.delete_config(task_id, TASK_MAP_CATEGORY, user_id=user_id)
+        except Exception as exc:
+            logging.warning(
+                "connect_campaigns: legacy migration failed user=%s: %s", user_id, exc
+            )
+    return imported
 
 
 def _normalize_campaign(payload: dict[str, Any], existing: dict[str, Any] | None = None) -> dict[str, Any]:
@@ -126,43 +187,34 @@ def _normalize_campaign(payload: dict[str, Any], existing: dict[str, Any] | None
 
 
 def list_campaigns(user_id: str) -> list[dict[str, Any]]:
-    campaigns = _load_campaigns_raw(user_id)
-    campaigns.sort(key=lambda c: c.get("updated_at") or "", reverse=True)
-    return campaigns
+    return db.list_connect_campaigns(user_id, run_limit=MAX_RUN_HISTORY)
 
 
 def get_campaign(user_id: str, campaign_id: str) -> dict[str, Any] | None:
-    for c in _load_campaigns_raw(user_id):
-        if c.get("id") == campaign_id:
-            return c
-    return None
+    return db.get_connect_campaign(user_id, campaign_id, run_limit=MAX_RUN_HISTORY)
 
 
 def create_campaign(user_id: str, payload: dict[str, Any]) -> dict[str, Any]:
     campaign = _normalize_campaign(payload)
-    campaigns = _load_campaigns_raw(user_id)
-    campaigns.append(campaign)
-    _save_campaigns_raw(user_id, campaigns)
+    db.save_connect_campaign(user_id, campaign)
+    _schedule_changed(user_id, campaign, campaign["id"])
     return campaign
 
 
 def update_campaign(user_id: str, campaign_id: str, payload: dict[str, Any]) -> dict[str, Any]:
-    campaigns = _load_campaigns_raw(user_id)
-    for i, existing in enumerate(campaigns):
-        if existing.get("id") == campaign_id:
-            updated = _normalize_campaign(payload, existing=existing)
-            campaigns[i] = updated
-            _save_campaigns_raw(user_id, campaigns)
-            return updated
-    raise KeyError(campaign_id)
+    existing = get_campaign(user_id, campaign_id)
+    if existing is None:
+        raise KeyError(campaign_id)
+    updated = _normalize_campaign(payload, existing=existing)
+    db.save_connect_campaign(user_id, updated)
+    _schedule_changed(user_id, updated, campaign_id)
+    return updated
 
 
 def delete_campaign(user_id: str, campaign_id: str) -> bool:
-    campaigns = _load_campaigns_raw(user_id)
-    next_list = [c for c in campaigns if c.get("id") != campaign_id]
-    if len(next_list) == len(campaigns):
+    if not db.delete_connect_campaign(user_id, campaign_id):
         return False
-    _save_campaigns_raw(user_id, next_list)
+    _schedule_changed(user_id, None, campaign_id)
     return True
 
 
@@ -197,39 +249,14 @@ def record_connect_task_start(
     user_id: str, campaign_id: str, task_id: str, *, source: str = "manual"
 ) -> None:
     """Link a launched connect task to a campaign and append run history."""
-    campaigns = _load_campaigns_raw(user_id)
-    now = _now_iso()
-    found = False
-    for i, c in enumerate(campaigns):
-        if c.get("id") != campaign_id:
-            continue
-        runs = list(c.get("runs") or [])
-        runs.insert(
-            0,
-            {
-                "task_id": task_id,
-                "started_at": now,
-                "ended_at": None,
-                "status": "running",
-                "exit_code": None,
-                "sent": 0,
-                "skipped": 0,
-                "source": source,
-            },
-        )
-        c["runs"] = runs[:MAX_RUN_HISTORY]
-        c["last_run_at"] = now
-        c["last_task_id"] = task_id
-        c["updated_at"] = now
-        totals = dict(c.get("totals") or {"runs": 0, "sent": 0, "skipped": 0})
-        totals["runs"] = int(totals.get("runs") or 0) + 1
-        c["totals"] = totals
-        campaigns[i] = c
-        found = True
-        break
-    if found:
-        _save_campaigns_raw(user_id, campaigns)
-        db.set_config(task_id, campaign_id, TASK_MAP_CATEGORY, user_id=user_id)
+    db.start_connect_campaign_run(
+        user_id,
+        campaign_id,
+        task_id,
+        started_at=_now_iso(),
+        source=source,
+        keep_runs=MAX_RUN_HISTORY,
+    )
 
 
 def run_campaign(
@@ -299,37 +326,16 @@ def on_connect_task_finished(
     if not user_id:
         return
 
-    cfg = db.get_all_by_category(TASK_MAP_CATEGORY, user_id=user_id) or {}
-    campaign_id = cfg.get(task_id)
-    if not campaign_id:
-        return
-
     sent, skipped = _parse_connect_log(log_path)
-    now = _now_iso()
-    campaigns = _load_campaigns_raw(user_id)
-    for i, c in enumerate(campaigns):
-        if c.get("id") != campaign_id:
-            continue
-        runs = list(c.get("runs") or [])
-        for j, run in enumerate(runs):
-            if run.get("task_id") == task_id:
-                run["ended_at"] = now
-                run["status"] = status or run.get("status") or "completed"
-                run["exit_code"] = exit_code
-                run["sent"] = sent
-                run["skipped"] = skipped
-                runs[j] = run
-                break
-        c["runs"] = runs
-        totals = dict(c.get("totals") or {"runs": 0, "sent": 0, "skipped": 0})
-        totals["sent"] = int(totals.get("sent") or 0) + sent
-        totals["skipped"] = int(totals.get("skipped") or 0) + skipped
-        c["totals"] = totals
-        c["updated_at"] = now
-        campaigns[i] = c
-        _save_campaigns_raw(user_id, campaigns)
-        db.delete_config(task_id, TASK_MAP_CATEGORY, user_id=user_id)
-        return
+    db.finish_connect_campaign_run(
+        task_id,
+        user_id=user_id,
+        ended_at=_now_iso(),
+        status=status,
+        exit_code=exit_code,
+        sent=sent,
+        skipped=skipped,
+    )
 
 
 def campaign_history(user_id: str, campaign_id: str) -> list[dict[str, Any]]:
@@ -339,63 +345,62 @@ def campaign_history(user_id: str, campaign_id: str) -> list[dict[str, Any]]:
     return list(campaign.get("runs") or [])
 
 
-def _schedule_due(campaign: dict[str, Any], now: datetime) -> bool:
+def _last_slot(campaign: dict[str, Any], now: datetime) -> datetime | None:
+    """Most recent scheduled time at or before ``now`` (UTC), or None if unscheduled."""
     if not campaign.get("enabled", True):
-        return False
+        return None
     if not campaign.get("schedule_enabled"):
-        return False
+        return None
     schedule_time = campaign.get("schedule_time")
     if not schedule_time or not re.fullmatch(r"\d{2}:\d{2}", str(schedule_time)):
+        return None
+    hour, minute = (int(x) for x in str(schedule_time).split(":"))
+    try:
+        slot = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    except ValueError:
+        return None
+    if slot > now:
+        slot -= timedelta(days=1)
+    return slot
+
+
+def _ran_on(campaign: dict[str, Any], day) -> bool:
+    last_run_at = campaign.get("last_run_at")
+    if not last_run_at:
         return False
+    try:
+        last_dt = datetime.fromisoformat(str(last_run_at).replace("Z", "+00:00"))
+    except ValueError:
+        return False
+    return last_dt.date() == day
 
-    hour, minute = (int(x) for x in str(schedule_time).split(":"))
-    # Fire once within the minute window after the scheduled time (UTC).
-    if now.hour != hour or now.minute != minute:
+
+def _schedule_due(campaign: dict[str, Any], now: datetime, *, grace_seconds: float = 60.0) -> bool:
+    """True if a slot passed less than ``grace_seconds`` ago and hasn't run that day."""
+    slot = _last_slot(campaign, now)
+    if slot is None:
         return False
+    if (now - slot).total_seconds() >= grace_seconds:
+        return False
+    return not _ran_on(campaign, slot.date())
 
-    last_run_at = campaign.get("last_run_at")
-    if last_run_at:
-        try:
-            last_dt = datetime.fromisoformat(str(last_run_at).replace("Z", "+00:00"))
-            if last_dt.date() == now.date():
-                return False
-        except ValueError:
-            pass
-    return True
 
+def next_fire_at(
+    campaign: dict[str, Any], now: datetime, *, grace_seconds: float = 60.0
+) -> datetime | None:
+    """When the scheduler should next launch ``campaign`` (may be ``now`` for catch-up)."""
+    slot = _last_slot(campaign, now)
+    if slot is None:
+        return None
+    if _schedule_due(campaign, now, grace_seconds=grace_seconds):
+        return slot
+    return slot + timedelta(days=1)
 
-def tick_scheduled_campaigns() -> int:
-    """Check all users' campaigns and launch any that are due. Returns launch count."""
-    launched = 0
-    try:
-        user_ids = db.list_config_user_ids(CONNECT_CAMPAIGNS_CATEGORY, CAMPAIGNS_KEY)
-    except Exception as exc:
-        logging.warning("connect_campaigns: could not list users: %s", exc)
-        return 0
 
-    now = datetime.now(timezone.utc)
-    for user_id in user_ids:
-        try:
-            for campaign in _load_campaigns_raw(user_id):
-                if not _schedule_due(campaign, now):
-                    continue
-                try:
-                    run_campaign(user_id, campaign["id"], source="schedule")
-                    launched += 1
-                    logging.info(
-                        "connect_campaigns: scheduled run user=%s campaign=%s",
-                        user_id,
-                        campaign.get("name"),
-                    )
-                except Exception as exc:
-                    logging.info(
-                        "connect_campaigns: skip scheduled run user=%s campaign=%s: %s",
-                        user_id,
-                        campaign.get("name"),
-                        exc,
-                    )
-        except Exception as exc:
-            logging.warning(
-                "connect_campaigns: tick failed user=%s: %s", user_id, exc
-            )
-    return launched
+def _schedule_changed(user_id: str, campaign: dict[str, Any] | None, campaign_id: str) -> None:
+    from services.campaign_scheduler import scheduler
+
+    if campaign is None:
+        scheduler.remove(campaign_id)
+    else:
+        scheduler.update(user_id, campaign)
@@ -25,6 +25,7 @@ from services.linkedin_env import (
     apply_dashboard_automation_settings,
 )
 from services.chrome_profiles import apply_automation_chrome_profile_env
+from utils.debug_logs import read_since, read_tail
 
 
 # ---------------------------------------------------------------------------
@@ -77,6 +78,8 @@ class AutomationTask:
     # LinkedIn account this subprocess authenticates as. Captured at launch
     # from the env that will actually be inherited by the child process.
     account_username: str | None = None
+    # Serialises finalisation between the waiter thread and stop_task().
+    reap_lock: Any = field(default_factory=threading.Lock, repr=False, compare=False)
 
     def is_running(self) -> bool:
         return self.process is not None and self.process.poll() is None
@@ -219,6 +222,11 @@ def _build_command(action: str, params: dict[str, Any]) -> list[str]:
     return cmd
 
 
+def result_path_for(log_path: str) -> str:
+    """JSON result sidecar a task writes next to its log (see ``write_result``)."""
+    return os.path.splitext(log_path)[0] + ".result.json"
+
+
 def start_task(
     action: str,
     params: dict[str, Any],
@@ -248,6 +256,7 @@ def start_task(
 
     log_handle = open(log_path, "a", encoding="utf-8", buffering=1)
     env["LINKDAPPLY_AUTOMATION_LOG"] = log_path
+    env["LINKDAPPLY_AUTOMATION_RESULT"] = result_path_for(log_path)
     env["PYTHONUNBUFFERED"] = "1"
     ts = _now_iso()
     log_handle.write(f"\n{'=' * 60}\n[{ts}] Task {task_id} started\n")
@@ -300,6 +309,11 @@ def start_task(
     except Exception as exc:
         logging.warning(f"Could not persist automation task {task_id}: {exc}")
 
+    # Started after the DB row exists so finalisation always finds it.
+    threading.Thread(
+        target=_wait_and_reap, args=(task,), name=f"reap-{task_id}", daemon=True
+    ).start()
+
     logging.info(
         f"LinkedIn automation task {task_id} started "
         f"(account={account_username}): {' '.join(cmd)}"
@@ -312,6 +326,21 @@ def start_task(
 # ---------------------------------------------------------------------------
 
 
+def _wait_and_reap(task: AutomationTask) -> None:
+    """Waiter thread body: block until the subprocess exits, then finalise it.
+
+    One daemon thread per task, so the process is reaped (no zombie), its
+    log handle closed and the DB / connect campaign updated as soon as it
+    exits rather than on the next dashboard poll.
+    """
+    try:
+        task.process.wait()
+    except Exception as exc:
+        logging.warning(f"Waiting on automation task {task.id} failed: {exc}")
+        return
+    _reap(task)
+
+
 def _reap(task: AutomationTask) -> None:
     """If the task has finished, capture exit code and close its log handle."""
     if task.process is None:
@@ -319,7 +348,9 @@ def _reap(task: AutomationTask) -> None:
     rc = task.process.poll()
     if rc is None:
         return
-    if task.exit_code is None:
+    with task.reap_lock:
+        if task.exit_code is not None:
+            return
         task.exit_code = rc
         task.ended_at = _now_iso()
         # `stopped` is set by stop_task() prior to reaping; otherwise rely on rc.
@@ -357,19 +388,18 @@ def _reap(task: AutomationTask) -> None:
                 )
 
 
+# Query helpers below only read in-memory state; exits are recorded by the
+# per-task waiter thread (``_wait_and_reap``).
+
+
 def get_task(task_id: str) -> AutomationTask | None:
     with _lock:
-        task = _tasks.get(task_id)
-    if task:
-        _reap(task)
-    return task
+        return _tasks.get(task_id)
 
 
 def list_tasks(limit: int = 50) -> list[AutomationTask]:
     with _lock:
         tasks = list(_tasks.values())
-    for t in tasks:
-        _reap(t)
     tasks.sort(key=lambda t: t.started_at, reverse=True)
     return tasks[:limit]
 
@@ -398,20 +428,35 @@ def stop_task(task_id: str) -> bool:
     return True
 
 
-def tail_log(task: AutomationTask, lines: int = 200) -> str:
-    if not os.path.isfile(task.log_path):
-        return f"(log file not found: {task.log_path})"
+def read_task_log(
+    log_path: str, lines: int = 200, offset: Optional[int] = None
+) -> tuple[str, Optional[int]]:
+    """Tail of a task log (or the lines after byte ``offset``) and the next offset.
+
+    The offset is ``None`` when the file cannot be read; otherwise clients
+    pass it back as ``log_offset`` to fetch only newly appended lines.
+    """
+    if not os.path.isfile(log_path):
+        return f"(log file not found: {log_path})", None
     try:
-        with open(task.log_path, "r", encoding="utf-8", errors="replace") as f:
-            buf = f.readlines()
-        text = "".join(buf[-max(20, min(lines, 1000)) :])
-        return text or "(log file is empty)"
+        if offset is not None:
+            return read_since(log_path, offset)
+        text, end = read_tail(log_path, max(20, min(lines, 1000)))
+        return text or "(log file is empty)", end
     except Exception as exc:
-        return f"(log read error: {exc})"
+        return f"(log read error: {exc})", None
 
 
-def task_to_dict(task: AutomationTask, include_log: bool = False, log_lines: int = 200) -> dict[str, Any]:
-    _reap(task)
+def tail_log(task: AutomationTask, lines: int = 200) -> str:
+    return read_task_log(task.log_path, lines)[0]
+
+
+def task_to_dict(
+    task: AutomationTask,
+    include_log: bool = False,
+    log_lines: int = 200,
+    log_offset: Optional[int] = None,
+) -> dict[str, Any]:
     data: dict[str, Any] = {
         "id": task.id,
         "action": task.action,
@@ -422,11 +467,11 @@ def task_to_dict(task: AutomationTask, include_log: bool = False, log_lines: int
         "ended_at": task.ended_at,
         "exit_code": task.exit_code,
         "status": task.status,
-        "running": task.is_running(),
+        "running": task.process is not None and task.exit_code is None,
         "account_username": task.account_username,
     }
     if include_log:
-        data["log"] = tail_log(task, log_lines)
+        data["log"], data["log_offset"] = read_task_log(task.log_path, log_lines, log_offset)
     return data
 
 
@@ -0,0 +1,278 @@
+"""Live log streaming (Server-Sent Events) for bot runs and automation tasks.
+
+One ``LogFollower`` per watched target (a run-scoped ``logs/runs/<run_id>/``
+directory or a single automation task log) polls file sizes and reads only
+the bytes appended since the last poll. Each chunk is broadcast to every
+subscriber, so N dashboard viewers cost one reader, not N.
+
+Subscribers track their own per-file byte offsets. A client that reconnects
+passes those offsets back (``Last-Event-ID`` or ``?offsets=``) and receives
+only what it missed; a subscriber that falls behind (full queue) catches up
+by reading the file directly from its offset.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import glob
+import json
+import os
+import threading
+import time
+from typing import AsyncIterator, Callable
+from urllib.parse import parse_qsl, urlencode
+
+from utils.debug_logs import read_since, read_tail
+
+POLL_INTERVAL = 0.5
+HEARTBEAT_INTERVAL = 15.0
+SUBSCRIBER_QUEUE_SIZE = 256
+
+_followers: dict[str, "LogFollower"] = {}
+_followers_lock = threading.Lock()
+
+
+def encode_offsets(offsets: dict[str, int]) -> str:
+    """Offsets as an SSE event id (``bot-main.txt=120&supervisor.txt=88``)."""
+    return urlencode(sorted(offsets.items()))
+
+
+def decode_offsets(raw: str | None) -> dict[str, int]:
+    out: dict[str, int] = {}
+    for name, value in parse_qsl(raw or "", keep_blank_values=False):
+        try:
+            out[name] = max(0, int(value))
+        except ValueError:
+            continue
+    return out
+
+
+def directory_files(directory: str, pattern: str = "*.txt") -> Callable[[], dict[str, str]]:
+    """File lister for a run-scoped log directory."""
+
+    def _list() -> dict[str, str]:
+        return {
+            os.path.basename(p): p
+            for p in sorted(glob.glob(os.path.join(directory, pattern)))
+        }
+
+    return _list
+
+
+def single_file(path: str) -> Callable[[], dict[str, str]]:
+    """File lister for one log file (e.g. an automation task log)."""
+
+    def _list() -> dict[str, str]:
+        return {os.path.basename(path): path} if os.path.isfile(path) else {}
+
+    return _list
+
+
+class LogFollower:
+    """Polls a set of log files and fans appended chunks out to subscribers."""
+
+    def __init__(self, key: str, list_files: Callable[[], dict[str, str]], *, poll_interval: float = POLL_INTERVAL):
+        self.key = key
+        self.list_files = list_files
+        self.poll_interval = poll_interval
+        self.offsets: dict[str, int] = {}
+        self.paths: dict[str, str] = {}
+        self.subscribers: set[asyncio.Queue] = set()
+        self._task: asyncio.Task | None = None
+        self._primed = False
+
+    def _prime(self) -> None:
+        # Start at EOF: history is served per subscriber from its own offsets.
+        self.paths = self.list_files()
+        for name, path in self.paths.items():
+            try:
+                self.offsets[name] = os.path.getsize(path)
+            except OSError:
+                self.offsets[name] = 0
+        self._primed = True
+
+    def poll_once(self) -> list[dict]:
+        """Read what was appended since the last poll (blocking; run in a thread)."""
+        if not self._primed:
+            self._prime()
+            return []
+        chunks: list[dict] = []
+        self.paths = self.list_files()
+        for name, path in self.paths.items():
+            start = self.offsets.get(name, 0)
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                continue
+            reset = size < start
+            if reset:
+                start = 0
+            if size == start and not reset:
+                continue
+            try:
+                text, end = read_since(path, start)
+            except OSError:
+                continue
+            self.offsets[name] = end
+            if text or reset:
+                chunks.append(
+                    {"file": name, "start": start, "offset": end, "text": text, "reset": reset}
+                )
+        return chunks
+
+    def publish(self, chunks: list[dict]) -> None:
+        for queue in list(self.subscribers):
+            for chunk in chunks:
+                try:
+                    queue.put_nowait(chunk)
+                except asyncio.QueueFull:
+                    # Slow viewer: it re-reads from its own offsets instead.
+                    queue.lagging = True  # type: ignore[attr-defined]
+                    break
+
+    async def _run(self) -> None:
+        while self.subscribers:
+            chunks = await asyncio.to_thread(self.poll_once)
+            if chunks:
+                self.publish(chunks)
+            await asyncio.sleep(self.poll_interval)
+
+    def add(self, queue: asyncio.Queue) -> None:
+        if not self._primed:
+            # Prime before the subscriber reads its backlog so nothing written
+            # in between can fall outside both the backlog and the broadcast.
+            self._prime()
+        self.subscribers.add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def remove(self, queue: asyncio.Queue) -> None:
+        self.subscribers.discard(queue)
+        if not self.subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+            self._primed = False
+
+
+def _acquire(key: str, list_files: Callable[[], dict[str, str]]) -> tuple[LogFollower, asyncio.Queue]:
+    queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+    queue.lagging = False  # type: ignore[attr-defined]
+    with _followers_lock:
+        follower = _followers.get(key)
+        if follower is None:
+            follower = LogFollower(key, list_files, poll_interval=POLL_INTERVAL)
+            _followers[key] = follower
+        follower.add(queue)
+    return follower, queue
+
+
+def _release(follower: LogFollower, queue: asyncio.Queue) -> None:
+    with _followers_lock:
+        follower.remove(queue)
+        if not follower.subscribers and _followers.get(follower.key) is follower:
+            _followers.pop(follower.key, None)
+
+
+def active_followers() -> dict[str, int]:
+    """Watched targets and their subscriber counts (diagnostics / tests)."""
+    return {key: len(f.subscribers) for key, f in _followers.items()}
+
+
+def _catch_up(list_files: Callable[[], dict[str, str]], offsets: dict[str, int], lines: int) -> list[dict]:
+    """Per-subscriber backlog: bytes after known offsets, or a tail for new files."""
+    chunks: list[dict] = []
+    for name, path in list_files().items():
+        try:
+            if name not in offsets:
+                text, end = read_tail(path, lines)
+                offsets[name] = end
+                if text:
+                    chunks.append({"file": name, "start": 0, "offset": end, "text": text, "reset": False})
+                continue
+            start = offsets[name]
+            if start > os.path.getsize(path):
+                start = 0
+            while True:
+                text, end = read_since(path, start)
+                offsets[name] = end
+                if not text:
+                    break
+                chunks.append({"file": name, "start": start, "offset": end, "text": text, "reset": False})
+                start = end
+        except OSError:
+            continue
+    return chunks
+
+
+def _sse(event: str, data: dict, offsets: dict[str, int] | None = None) -> str:
+    head = f"id: {encode_offsets(offsets)}\n" if offsets is not None else ""
+    return f"{head}event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def stream_log_events(
+    key: str,
+    list_files: Callable[[], dict[str, str]],
+    *,
+    offsets: dict[str, int] | None = None,
+    lines: int = 120,
+    is_disconnected: Callable[[], object] | None = None,
+    is_finished: Callable[[], bool] | None = None,
+    heartbeat: float = HEARTBEAT_INTERVAL,
+) -> AsyncIterator[str]:
+    """SSE frames for ``key``: backlog first, then appended chunks as they land.
+
+    ``offsets`` resumes from the given per-file byte positions; files without
+    an offset start with their last ``lines`` lines. Each ``log`` event's id
+    encodes all current offsets, so ``EventSource`` reconnects resume exactly.
+    The stream ends with an ``end`` event once ``is_finished()`` is true and
+    everything has been delivered.
+    """
+    offsets = dict(offsets or {})
+    follower, queue = _acquire(key, list_files)
+    check_every = min(heartbeat, 1.0)
+    last_sent = time.monotonic()
+    try:
+        backlog = await asyncio.to_thread(_catch_up, list_files, offsets, lines)
+        for chunk in backlog:
+            yield _sse("log", chunk, offsets)
+        while True:
+            try:
+                chunk = await asyncio.wait_for(queue.get(), timeout=check_every)
+            except asyncio.TimeoutError:
+                chunk = None
+            missed: list[dict] = []
+            if getattr(queue, "lagging", False):
+                queue.lagging = False  # type: ignore[attr-defined]
+                while not queue.empty():
+                    queue.get_nowait()
+                chunk = None
+                missed = await asyncio.to_thread(_catch_up, list_files, offsets, lines)
+            if chunk is not None:
+                name = chunk["file"]
+                known = offsets.get(name)
+                if chunk["reset"] or chunk["start"] == (known or 0):
+                    offsets[name] = chunk["offset"]
+                    if chunk["text"]:
+                        missed = [chunk]
+                elif known is None or chunk["offset"] > known:
+                    # Out of step with the watcher (resumed behind it, or our
+                    # backlog read ended mid-chunk): read the file ourselves.
+                    missed = await asyncio.to_thread(_catch_up, list_files, offsets, lines)
+                # Otherwise the chunk was already delivered via the backlog.
+            for item in missed:
+                yield _sse("log", item, offsets)
+                last_sent = time.monotonic()
+            if chunk is not None or missed:
+                continue
+            if is_disconnected is not None and await is_disconnected():
+                return
+            if is_finished is not None and is_finished():
+                for item in await asyncio.to_thread(_catch_up, list_files, offsets, lines):
+                    yield _sse("log", item, offsets)
+                yield _sse("end", {"offsets": offsets}, offsets)
+                return
+            if time.monotonic() - last_sent >= heartbeat:
+                last_sent = time.monotonic()
+                yield ": ping\n\n"
+    finally:
+        _release(follower, queue)
@@ -0,0 +1,118 @@
+"""Compiled multi-phrase matchers for bad words, blacklists and deal breakers.
+
+Each configured list is compiled once into a single case-insensitive
+alternation regex, so scanning a job description is one pass over the text
+instead of one ``in`` / ``re.search`` per phrase. Every phrase sits in its
+own named group, which lets ``search`` report which phrase matched.
+
+User regexes (``regex`` mode) are compiled on their own instead: inline
+global flags such as ``(?i)`` and numbered backreferences such as ``\1`` only
+work at the start of / relative to their own pattern.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Iterable
+
+# Matching modes:
+#   substring — plain case-insensitive containment (``word.lower() in text``)
+#   word      — whole-word match (``\bphrase\b``)
+#   regex     — phrases that look like regexes are used verbatim, others as ``word``
+SUBSTRING = "substring"
+WORD = "word"
+REGEX = "regex"
+
+# Config key -> matching mode (mirrors the legacy per-list loops).
+PHRASE_LIST_MODES: dict[str, str] = {
+    "bad_words": SUBSTRING,
+    "about_company_good_words": SUBSTRING,
+    "about_company_bad_words": SUBSTRING,
+    "visa_deal_breakers": REGEX,
+    "tech_blacklists": WORD,
+    "location_blacklists": SUBSTRING,
+    "education_blacklists": SUBSTRING,
+}
+
+
+def _looks_like_regex(phrase: str) -> bool:
+    return "\\" in phrase or "[" in phrase
+
+
+def _phrase_pattern(phrase: str, mode: str) -> str:
+    if mode == REGEX and _looks_like_regex(phrase):
+        return phrase
+    if mode == SUBSTRING:
+        return re.escape(phrase)
+    return r"\b" + re.escape(phrase) + r"\b"
+
+
+class PhraseMatcher:
+    """One compiled regex for a list of phrases (plus one per raw user regex)."""
+
+    def __init__(self, phrases: Iterable[Any] | None, *, mode: str = SUBSTRING):
+        self.mode = mode
+        self.phrases: list[str] = []
+        parts: list[tuple[int, str]] = []
+        # (phrase index, pattern) searched one at a time.
+        self._singles: list[tuple[int, re.Pattern[str]]] = []
+        for phrase in phrases or []:
+            phrase = str(phrase or "").strip()
+            if not phrase:
+                continue
+            index = len(self.phrases)
+            self.phrases.append(phrase)
+            pattern = _phrase_pattern(phrase, mode)
+            if mode == REGEX and pattern == phrase:
+                try:
+                    self._singles.append((index, re.compile(pattern, re.IGNORECASE)))
+                    continue
+                except re.error:
+                    # A broken user regex should not disable the whole list.
+                    pattern = _phrase_pattern(phrase, WORD)
+            parts.append((index, pattern))
+        self._regex = None
+        if parts:
+            try:
+                self._regex = re.compile(
+                    "|".join(f"(?P<p{i}>{pattern})" for i, pattern in parts), re.IGNORECASE
+                )
+            except re.error:
+                self._singles.extend((i, re.compile(pattern, re.IGNORECASE)) for i, pattern in parts)
+                self._singles.sort(key=lambda item: item[0])
+
+    def __bool__(self) -> bool:
+        return self._regex is not None or bool(self._singles)
+
+    def __len__(self) -> int:
+        return len(self.phrases)
+
+    def search(self, text: str | None) -> str | None:
+        """Return the configured phrase that matched first in ``text``, else ``None``."""
+        if not text or not self:
+            return None
+        best: tuple[int, int] | None = None  # (match start, phrase index)
+        if self._regex is not None:
+            match = self._regex.search(text)
+            if match is not None:
+                for name, value in match.groupdict().items():
+                    if value is not None and name.startswith("p") and name[1:].isdigit():
+                        best = (match.start(), int(name[1:]))
+                        break
+        for index, regex in self._singles:
+            match = regex.search(text)
+            if match is not None and (best is None or (match.start(), index) < best):
+                best = (match.start(), index)
+        return self.phrases[best[1]] if best else None
+
+
+def compile_phrase_matchers(config: dict[str, Any] | None) -> dict[str, PhraseMatcher]:
+    """Build a matcher for every list in ``PHRASE_LIST_MODES`` (missing lists are empty)."""
+    config = config or {}
+    matchers: dict[str, PhraseMatcher] = {}
+    for key, mode in PHRASE_LIST_MODES.items():
+        phrases = config.get(key) or []
+        if isinstance(phrases, str):
+            phrases = [phrases]
+        matchers[key] = PhraseMatcher(phrases, mode=mode)
+    return matchers
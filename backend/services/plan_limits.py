@@ -7,7 +7,11 @@ from fastapi import HTTPException
 from db_manager import db
 
 from services.admin import is_admin
-from services.cloud_billing import get_subscription_for_gating, uses_cloud_subscription
+from services.cloud_billing import (
+    fetch_subscription_for_gating,
+    get_subscription_for_gating,
+    uses_cloud_subscription,
+)
 from services.linkedin_env import (
     count_linkedin_accounts,
     list_supervisor_accounts,
@@ -50,6 +54,21 @@ PLAN_LIMITS = {
 }
 
 
+async def prefetch_gating_subscription(user_id: str) -> None:
+    """Warm the subscription cache without blocking the event loop.
+
+    Async routes await this before the sync ``assert_can_*`` checks so a
+    cloud-billing lookup never runs as a blocking call inside the loop.
+    Errors are left for the sync check to raise.
+    """
+    if is_admin(user_id) or not uses_cloud_subscription():
+        return
+    try:
+        await fetch_subscription_for_gating(user_id)
+    except HTTPException:
+        pass
+
+
 def assert_can_start_bot(user_id: str) -> None:
     if is_admin(user_id):
         runnable = len(list_supervisor_accounts(user_id=user_id))
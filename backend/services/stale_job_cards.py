@@ -0,0 +1,36 @@
+"""Retry for job-search result cards that went stale mid-loop.
+
+LinkedIn re-renders the results list (e.g. after a modal closes), which
+invalidates every WebElement read by ``extract_job_cards()``. Lives outside
+``run_ai_bot`` so it can be tested without launching Chrome.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, TypeVar
+
+from selenium.common.exceptions import StaleElementReferenceException
+
+T = TypeVar("T")
+
+
+def read_card_with_retry(
+    job_cards: list[dict],
+    index: int,
+    read: Callable[[dict], T],
+    refresh: Callable[[list[dict]], list[dict]],
+    on_stale: Callable[[], None] | None = None,
+) -> T:
+    """
+    Function to run `read` on `job_cards[index]`, re-reading the list once if the card is stale.
+    * `refresh` replaces `job_cards[index:]` in place (the current card included)
+    * `on_stale` runs before the refresh, e.g. to close a modal left open
+    * A second `StaleElementReferenceException` is raised to the caller, which skips the card
+    """
+    try:
+        return read(job_cards[index])
+    except StaleElementReferenceException:
+        if on_stale is not None:
+            on_stale()
+        job_cards[index:] = refresh(job_cards[index:])
+        return read(job_cards[index])
@@ -8,10 +8,9 @@ os.environ.setdefault(
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from db_manager import db
+from db_manager import create_db_engine, db
 from models import Base
 
 # Ephemeral SQLite DB for tests (same folder as conftest for predictable cleanup)
@@ -23,6 +22,17 @@ def _sqlite_url(path: Path) -> str:
     return "sqlite:///" + path.as_posix()
 
 
+def _remove_test_db() -> None:
+    # WAL mode leaves -wal / -shm companions next to the database file.
+    for suffix in ("", "-wal", "-shm"):
+        path = TEST_DB_PATH.with_name(TEST_DB_PATH.name + suffix)
+        if path.exists():
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_db():
     """
@@ -30,11 +40,7 @@ def setup_test_db():
 
     ``DatabaseManager`` uses SQLAlchemy (engine + sessionmaker), not ``conn``.
     """
-    if TEST_DB_PATH.exists():
-        try:
-            TEST_DB_PATH.unlink()
-        except OSError:
-            pass
+    _remove_test_db()
 
     test_url = _sqlite_url(TEST_DB_PATH)
 
@@ -42,22 +48,16 @@ def setup_test_db():
     db.engine.dispose()
 
     db.db_url = test_url
-    db.engine = create_engine(
-        test_url,
-        connect_args={"check_same_thread": False},
-    )
+    db.engine = create_db_engine(test_url)
     db.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db.engine)
 
     Base.metadata.create_all(bind=db.engine)
+    db.invalidate_config_cache()
 
     yield db
 
     db.engine.dispose()
-    if TEST_DB_PATH.exists():
-        try:
-            TEST_DB_PATH.unlink()
-        except OSError:
-            pass
+    _remove_test_db()
 
 
 @pytest.fixture(autouse=True)
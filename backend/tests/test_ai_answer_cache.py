@@ -0,0 +1,130 @@
+"""Tests for the persistent per-user AI answer cache."""
+
+from datetime import datetime, timedelta, timezone
+
+from models import AiAnswerCache
+from services.ai_answer_cache import (
+    answer_cache_key,
+    cached_ai_answer,
+    get_answer_cache_stats,
+    reset_answer_cache_stats,
+)
+
+
+def _producer(answer, calls):
+    def produce():
+        calls.append(1)
+        return answer
+
+    return produce
+
+
+def test_cache_key_normalises_label():
+    a = answer_cache_key("How many years of experience with Python?", "text")
+    b = answer_cache_key("  how many YEARS of experience with python ", "text")
+    assert a == b
+    assert a != answer_cache_key("How many years of experience with Python?", "textarea")
+
+
+def test_cached_ai_answer_hits_after_first_call(test_db):
+    reset_answer_cache_stats()
+    uid = "ai-cache@test.com"
+    calls = []
+    first = cached_ai_answer(
+        user_id=uid,
+        label="Years of Python experience?",
+        question_type="text",
+        produce=_producer("5", calls),
+    )
+    second = cached_ai_answer(
+        user_id=uid,
+        label="years of python experience",
+        question_type="text",
+        produce=_producer("9", calls),
+    )
+
+    assert first == second == "5"
+    assert len(calls) == 1
+    stats = get_answer_cache_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_cache_is_per_user_and_skips_non_text_and_empty(test_db):
+    calls = []
+    cached_ai_answer(
+        user_id="a@test.com", label="Notice?", question_type="text",
+        produce=_producer("30", calls),
+    )
+    assert (
+        cached_ai_answer(
+            user_id="b@test.com", label="Notice?", question_type="text",
+            produce=_producer("60", calls),
+        )
+        == "60"
+    )
+
+    for _ in range(2):
+        cached_ai_answer(
+            user_id="a@test.com", label="Why us?", question_type="textarea",
+            produce=_producer("Because", calls),
+        )
+        cached_ai_answer(
+            user_id="a@test.com", label="Visa status?", question_type="select",
+            produce=_producer("Citizen", calls),
+        )
+        cached_ai_answer(
+            user_id="a@test.com", label="Empty?", question_type="text",
+            produce=_producer("", calls),
+        )
+    assert len(calls) == 8
+
+
+def test_unlabelled_questions_are_never_cached(test_db):
+    calls = []
+    for label in (None, "", "Unknown", "Unknown", None):
+        cached_ai_answer(
+            user_id="ai-unlabelled@test.com", label=label, question_type="text",
+            produce=_producer(f"answer {len(calls)}", calls),
+        )
+    assert len(calls) == 5
+
+
+def test_expired_entries_are_re_asked(test_db, monkeypatch):
+    monkeypatch.setenv("AI_ANSWER_CACHE_TTL_DAYS", "1")
+    uid = "ai-ttl@test.com"
+    calls = []
+    cached_ai_answer(
+        user_id=uid, label="Salary?", question_type="text",
+        produce=_producer("100", calls),
+    )
+    with test_db.get_session() as s:
+        row = s.get(AiAnswerCache, (uid, answer_cache_key("Salary?", "text")))
+        row.created_at = datetime.now(timezone.utc) - timedelta(days=2)
+        s.commit()
+
+    assert (
+        cached_ai_answer(
+            user_id=uid, label="Salary?", question_type="text",
+            produce=_producer("120", calls),
+        )
+        == "120"
+    )
+    assert len(calls) == 2
+
+
+def test_put_cached_ai_answer_evicts_least_recently_used(test_db):
+    uid = "ai-lru@test.com"
+    for key in ("k1", "k2", "k3"):
+        test_db.put_cached_ai_answer(
+            uid, key, question=key, question_type="text", answer=key, max_entries=3
+        )
+    assert test_db.get_cached_ai_answer(uid, "k1") == "k1"  # k2 is now LRU
+
+    test_db.put_cached_ai_answer(
+        uid, "k4", question="k4", question_type="text", answer="k4", max_entries=3
+    )
+
+    assert test_db.get_cached_ai_answer(uid, "k2") is None
+    for key in ("k1", "k3", "k4"):
+        assert test_db.get_cached_ai_answer(uid, key) == key
@@ -0,0 +1,122 @@
+"""Tests for the bot's write-behind ``applications`` queue."""
+
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from services import application_log_writer as alw
+from services.application_log_writer import ApplicationLogWriter
+
+
+class _Sink:
+    def __init__(self):
+        self.batches = []
+        self.down = False
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def __call__(self, rows):
+        self.gate.wait(5)
+        if self.down:
+            raise RuntimeError("database is locked")
+        self.batches.append([dict(r) for r in rows])
+        return len(rows)
+
+    @property
+    def rows(self):
+        return [r for batch in self.batches for r in batch]
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_rows_are_batched_by_size_and_flushed_on_close(tmp_path):
+    sink = _Sink()
+    writer = ApplicationLogWriter(
+        batch_size=3, flush_seconds=60, spill_dir=str(tmp_path), sink=sink
+    )
+    for i in range(7):
+        writer.submit("u@example.com", status="applied", job_title=f"Role {i}")
+    _wait_for(lambda: len(sink.batches) == 2)
+    writer.close()
+
+    assert [len(b) for b in sink.batches] == [3, 3, 1]
+    assert [r["job_title"] for r in sink.rows] == [f"Role {i}" for i in range(7)]
+    assert all(isinstance(r["timestamp"], datetime) for r in sink.rows)
+
+
+def test_partial_batch_is_flushed_after_interval(tmp_path):
+    sink = _Sink()
+    writer = ApplicationLogWriter(
+        batch_size=50, flush_seconds=0.05, spill_dir=str(tmp_path), sink=sink
+    )
+    writer.submit("u@example.com", status="skipped", reason="Blacklisted Company")
+    _wait_for(lambda: sink.rows)
+    assert sink.rows[0]["reason"] == "Blacklisted Company"
+    writer.close()
+
+
+def test_failed_batches_spill_and_replay_when_db_returns(tmp_path, monkeypatch):
+    sink = _Sink()
+    sink.down = True
+    when = datetime(2026, 6, 1, 12, 0, tzinfo=timezone.utc)
+    writer = ApplicationLogWriter(
+        batch_size=2, flush_seconds=60, spill_dir=str(tmp_path), sink=sink
+    )
+    writer.submit("u@example.com", status="applied", company="Acme", timestamp=when)
+    writer.submit("u@example.com", status="failed", company="Beta")
+    writer.close()
+    assert sink.rows == []
+    assert list(tmp_path.glob("*.jsonl"))
+
+    # The next worker claims the dead worker's file once it counts as idle.
+    monkeypatch.setattr(alw, "_FOREIGN_SPILL_IDLE_SECONDS", 0.0)
+    sink.down = False
+    restarted = ApplicationLogWriter(spill_dir=str(tmp_path), sink=sink)
+    restarted.close()
+    assert [r["company"] for r in sink.rows] == ["Acme", "Beta"]
+    assert sink.rows[0]["timestamp"] == when
+    assert not list(tmp_path.iterdir())
+
+
+def test_full_queue_spills_instead_of_blocking(tmp_path):
+    sink = _Sink()
+    sink.gate.clear()  # DB stalls on the first batch
+    writer = ApplicationLogWriter(
+        batch_size=1, flush_seconds=60, max_queue=2, spill_dir=str(tmp_path), sink=sink
+    )
+    started = time.monotonic()
+    for i in range(20):
+        writer.submit("u@example.com", status="applied", job_title=f"Role {i}")
+    assert time.monotonic() - started < 1.0
+    assert list(tmp_path.iterdir())  # overflow went to a spill file
+
+    sink.gate.set()
+    writer.close()
+    assert sorted(r["job_title"] for r in sink.rows) == sorted(f"Role {i}" for i in range(20))
+
+
+def test_unknown_column_is_rejected_up_front(tmp_path):
+    writer = ApplicationLogWriter(spill_dir=str(tmp_path), sink=_Sink())
+    with pytest.raises(TypeError):
+        writer.submit("u@example.com", status="applied", not_a_column=1)
+
+
+def test_log_applications_inserts_batch(test_db):
+    user = "batch-writer@example.com"
+    assert test_db.log_applications(
+        [
+            {"user_id": user, "status": "applied", "company": "Acme"},
+            {"user_id": user, "status": "skipped", "reason": "Blacklisted Company"},
+        ]
+    ) == 2
+    stats = test_db.get_application_stats(user)
+    assert stats["total"] == 2
+    assert stats["applied"] == 1
+    assert stats["skipped"] == 1
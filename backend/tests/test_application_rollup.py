@@ -0,0 +1,118 @@
+"""Tests for the per-day ``application_daily_counts`` rollup."""
+
+from datetime import datetime, timedelta, timezone
+
+from models import Application, ApplicationDailyCount
+
+
+def _rollup(test_db, user):
+    with test_db.get_session() as s:
+        rows = (
+            s.query(ApplicationDailyCount)
+            .filter(ApplicationDailyCount.user_id == user)
+            .order_by(ApplicationDailyCount.day, ApplicationDailyCount.status)
+            .all()
+        )
+        return [(r.day, r.status, r.count, r.last_application_id) for r in rows]
+
+
+def test_log_application_maintains_daily_counts(test_db):
+    user = "rollup-counts@example.com"
+    day1 = datetime(2026, 3, 1, 9, 0, tzinfo=timezone.utc)
+    day2 = datetime(2026, 3, 2, 23, 30, tzinfo=timezone.utc)
+    test_db.log_application(user, status="applied", company="A", timestamp=day1)
+    test_db.log_application(user, status="applied", company="B", timestamp=day1 + timedelta(hours=1))
+    test_db.log_application(user, status="skipped", company="C", timestamp=day2)
+    test_db.log_applications(
+        [
+            {"user_id": user, "status": "failed", "company": "D", "timestamp": day2},
+            {"user_id": user, "status": "applied", "company": "E", "timestamp": day2},
+        ]
+    )
+
+    assert [(d, s, c) for d, s, c, _ in _rollup(test_db, user)] == [
+        ("2026-03-01", "applied", 2),
+        ("2026-03-02", "applied", 1),
+        ("2026-03-02", "failed", 1),
+        ("2026-03-02", "skipped", 1),
+    ]
+    assert test_db.get_application_stats(user) == {
+        "total": 5,
+        "applied": 3,
+        "skipped": 1,
+        "failed": 1,
+    }
+
+
+def test_monthly_count_is_exact_at_the_window_edge(test_db):
+    user = "rollup-monthly@example.com"
+    now = datetime.now(timezone.utc)
+    for age in (timedelta(days=31), timedelta(days=30, minutes=5), timedelta(days=29, hours=23), timedelta(days=2), timedelta(0)):
+        test_db.log_application(user, status="applied", timestamp=now - age)
+    test_db.log_application(user, status="skipped", timestamp=now)
+
+    # 30d+5m is outside the window even though its day is partly inside.
+    assert test_db.get_monthly_application_count(user) == 3
+
+
+def test_last_activity_uses_newest_row_even_when_logged_late(test_db):
+    user = "rollup-last@example.com"
+    base = datetime(2026, 4, 10, 12, 0, tzinfo=timezone.utc)
+    test_db.log_application(user, status="applied", company="Newest", timestamp=base + timedelta(hours=2))
+    # Replayed from a spill file after the newer row.
+    test_db.log_application(user, status="applied", company="Older", timestamp=base)
+    test_db.log_application(user, status="failed", company="Broken", reason="form", timestamp=base)
+
+    snap = test_db.get_last_activity_snapshot(user)
+    assert snap["last_applied"]["company"] == "Newest"
+    assert snap["last_failed"]["reason"] == "form"
+    assert test_db.get_last_activity_snapshot("rollup-nobody@example.com") == {
+        "last_applied": None,
+        "last_failed": None,
+    }
+
+
+def test_rebuild_backfills_rows_written_outside_log_applications(test_db):
+    user = "rollup-backfill@example.com"
+    test_db.log_application(user, status="applied", timestamp=datetime(2026, 5, 1, tzinfo=timezone.utc))
+    incremental = _rollup(test_db, user)
+
+    with test_db.get_session() as s:
+        s.add_all(
+            Application(user_id=user, status="applied", timestamp=datetime(2026, 5, 1, 8, tzinfo=timezone.utc))
+            for _ in range(3)
+        )
+        s.commit()
+    assert test_db.get_application_stats(user)["applied"] == 1
+
+    assert test_db.rebuild_application_rollup(user) == 1
+    assert test_db.get_application_stats(user)["applied"] == 4
+    day, status, count, last_id = _rollup(test_db, user)[0]
+    assert (day, status, count) == ("2026-05-01", "applied", 4)
+    assert last_id != incremental[0][3]
+
+
+def test_rollup_is_backfilled_when_its_table_first_appears(tmp_path, monkeypatch):
+    from db_manager import DatabaseManager, create_db_engine
+
+    url = "sqlite:///" + (tmp_path / "legacy.db").as_posix()
+    engine = create_db_engine(url)
+    Application.__table__.create(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            Application.__table__.insert(),
+            [
+                {"user_id": "legacy@example.com", "status": "applied", "timestamp": datetime(2026, 1, 5, tzinfo=timezone.utc)},
+                {"user_id": "legacy@example.com", "status": "failed", "timestamp": datetime(2026, 1, 6, tzinfo=timezone.utc)},
+            ],
+        )
+    engine.dispose()
+
+    monkeypatch.delenv("LINKDAPPLY_LOCAL_DATA", raising=False)
+    monkeypatch.setenv("DATABASE_URL", url)
+    upgraded = DatabaseManager()
+    try:
+        assert upgraded.get_application_stats("legacy@example.com")["total"] == 2
+        assert upgraded.get_last_activity_snapshot("legacy@example.com")["last_failed"] is not None
+    finally:
+        upgraded.engine.dispose()
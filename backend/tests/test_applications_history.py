@@ -0,0 +1,88 @@
+"""Tests for the keyset-paginated ``/api/applications/history`` endpoint."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+BASE = datetime(2026, 2, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def history(auth_as, test_db):
+    """Seven rows for a fresh user (the test DB is shared across tests)."""
+    user = f"history-{uuid.uuid4().hex[:8]}@example.com"
+    auth_as(user)
+    test_db.log_applications(
+        [
+            {
+                "user_id": user,
+                "status": "applied" if i % 2 else "failed",
+                "company": "Acme Corp" if i < 4 else "Globex",
+                "job_title": f"Role {i}",
+                "reason": "x" * 500,
+                "answer_generated": "y" * 500,
+                # Rows 2 and 3 share a timestamp; the id breaks the tie.
+                "timestamp": BASE + timedelta(days=min(i, 2) if i < 4 else i),
+            }
+            for i in range(7)
+        ]
+    )
+    test_db.log_application("someone-else@example.com", status="applied", company="Acme Corp")
+
+
+def _page(client, **params):
+    res = client.get("/api/applications/history", params=params)
+    assert res.status_code == 200, res.text
+    return res.json()
+
+
+def test_cursor_walks_all_rows_newest_first(client, history):
+    titles, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        body = _page(client, **params)
+        titles += [row["job_title"] for row in body["history"]]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+    assert titles == ["Role 6", "Role 5", "Role 4", "Role 3", "Role 2", "Role 1", "Role 0"]
+
+
+def test_heavy_columns_only_when_requested(client, history):
+    light = _page(client, limit=1)["history"][0]
+    assert "reason" not in light and "answer_generated" not in light
+    assert light["company"] == "Globex"
+
+    full = _page(client, limit=1, include="reason")["history"][0]
+    assert full["reason"] == "x" * 500
+    assert "answer_generated" not in full
+
+    res = client.get("/api/applications/history", params={"include": "user_id"})
+    assert res.status_code == 400
+
+
+def test_filters_by_status_company_and_date_range(client, history):
+    failed = _page(client, status="failed")["history"]
+    assert {row["status"] for row in failed} == {"failed"}
+    assert len(failed) == 4
+
+    acme = _page(client, company="acme")["history"]
+    assert [row["job_title"] for row in acme] == ["Role 3", "Role 2", "Role 1", "Role 0"]
+
+    ranged = _page(client, since="2026-02-02", until="2026-02-03")["history"]
+    assert [row["job_title"] for row in ranged] == ["Role 3", "Role 2", "Role 1"]
+
+    assert client.get("/api/applications/history", params={"since": "yesterday"}).status_code == 400
+
+
+def test_offset_bounds_are_converted_to_utc(client, history):
+    # 17:00+05:30 is 11:30Z, just before the 12:00Z rows of that day.
+    ranged = _page(
+        client, since="2026-02-02T17:00:00+05:30", until="2026-02-03T17:00:00+05:30"
+    )["history"]
+    assert [row["job_title"] for row in ranged] == ["Role 1"]
+
+    # 01:00+05:30 on the 2nd is 19:30Z on the 1st: Role 0 (12:00Z) is before it.
+    since_late = _page(client, since="2026-02-02T01:00:00+05:30")["history"]
+    assert since_late[-1]["job_title"] == "Role 1"
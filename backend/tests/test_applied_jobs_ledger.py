@@ -0,0 +1,82 @@
+"""Tests for the per-user applied job ID ledger."""
+
+import csv
+
+from services.applied_jobs_ledger import (
+    AppliedJobsLedger,
+    clear_applied_jobs_ledgers,
+    get_applied_jobs_ledger,
+    import_legacy_csv,
+    ledger_path_for,
+)
+
+
+def _write_csv(path, job_ids):
+    with open(path, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(["Job ID", "Title", "About Job"])
+        for job_id in job_ids:
+            writer.writerow([job_id, "Engineer", "x" * 4000])
+
+
+def test_import_legacy_csv_skips_header_and_duplicates(tmp_path):
+    csv_path = tmp_path / "applied.csv"
+    _write_csv(csv_path, ["101", "102", "101"])
+    ledger_path = tmp_path / "ids" / "u.txt"
+
+    assert import_legacy_csv(str(csv_path), str(ledger_path)) == 2
+    assert ledger_path.read_text(encoding="utf-8").split() == ["101", "102"]
+
+
+def test_ledger_seeds_from_csv_once(tmp_path):
+    csv_path = tmp_path / "applied.csv"
+    _write_csv(csv_path, ["1", "2"])
+    path = ledger_path_for("user@example.com", str(csv_path))
+
+    ledger = AppliedJobsLedger(path, legacy_csv=str(csv_path))
+    assert "1" in ledger and "2" in ledger
+    assert "Job ID" not in ledger
+
+    # Later CSV rows are not re-imported; the ledger is the source of truth.
+    _write_csv(csv_path, ["1", "2", "3"])
+    reopened = AppliedJobsLedger(path, legacy_csv=str(csv_path))
+    assert "3" not in reopened
+    assert len(reopened) == 2
+
+
+def test_ledger_add_appends_and_refresh_sees_other_writers(tmp_path):
+    path = str(tmp_path / "ids" / "u.txt")
+    first = AppliedJobsLedger(path)
+    second = AppliedJobsLedger(path)
+
+    assert first.add("42") is True
+    assert first.add("42") is False
+    assert "42" not in second
+
+    assert second.refresh() == 1
+    assert "42" in second
+
+
+def test_refresh_ignores_partial_trailing_line(tmp_path):
+    path = tmp_path / "u.txt"
+    path.write_text("7\n8", encoding="utf-8")
+    ledger = AppliedJobsLedger(str(path))
+    assert "7" in ledger
+    assert "8" not in ledger
+
+    with open(path, "a", encoding="utf-8") as fh:
+        fh.write("\n9\n")
+    assert ledger.refresh() == 2
+    assert "8" in ledger and "9" in ledger
+
+
+def test_get_applied_jobs_ledger_is_per_user(tmp_path):
+    clear_applied_jobs_ledgers()
+    csv_path = str(tmp_path / "applied.csv")
+    a = get_applied_jobs_ledger("a@example.com", csv_path)
+    b = get_applied_jobs_ledger("b@example.com", csv_path)
+
+    assert a is get_applied_jobs_ledger("a@example.com", csv_path)
+    a.add("5")
+    assert "5" not in b
+    clear_applied_jobs_ledgers()
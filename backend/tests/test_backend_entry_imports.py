@@ -0,0 +1,91 @@
+"""Cold-start budget for the desktop sidecar's worker modes.
+
+``linkdapply_backend_entry.py`` is the process for the API server, every bot
+worker (``--bot``), the supervisor and every automation task
+(``--automation``). Only the API mode may pay for uvicorn / ``server`` and its
+routers; these tests run fresh interpreters under ``-X importtime`` and fail
+when a worker path starts pulling that graph in again.
+
+``ENTRY_IMPORT_BUDGET_MS`` raises the wall-clock budget on slow machines; the
+module-count and forbidden-module checks are deterministic.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+
+# Imported only by the API server mode (server.py and its routers / billing).
+API_ONLY_MODULES = ["server", "uvicorn", "fastapi", "stripe", "routes"]
+
+_IMPORTTIME_RE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)")
+
+
+def _backend_root() -> str:
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _importtime(args: list[str]) -> tuple[subprocess.CompletedProcess, dict[str, int], int]:
+    """Run ``python -X importtime <args>``; return (result, module -> cumulative us, total us)."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([_backend_root(), os.path.join(_backend_root(), "config")])
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        cwd=_backend_root(),
+        env=env,
+        timeout=60,
+    )
+    modules: dict[str, int] = {}
+    total_us = 0
+    for line in result.stderr.splitlines():
+        m = _IMPORTTIME_RE.match(line)
+        if not m:
+            continue
+        cumulative, indent, name = int(m.group(2)), m.group(3), m.group(4)
+        modules[name] = cumulative
+        if len(indent) == 1:  # top-level import: cumulative covers its subtree
+            total_us += cumulative
+    return result, modules, total_us
+
+
+def _api_modules(modules: dict[str, int]) -> list[str]:
+    return [
+        m for m in API_ONLY_MODULES
+        if m in modules or any(k.startswith(m + ".") for k in modules)
+    ]
+
+
+def _budget_ms(default: float) -> float:
+    raw = (os.getenv("ENTRY_IMPORT_BUDGET_MS") or "").strip()
+    return float(raw) if raw else default
+
+
+def test_automation_help_skips_api_import_graph():
+    result, modules, total_us = _importtime(
+        ["linkdapply_backend_entry.py", "--automation", "--help"]
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    assert "generate-calendar" in result.stdout
+
+    loaded = _api_modules(modules)
+    assert not loaded, f"--automation imported API-only modules: {loaded}"
+    # The full API graph is ~900 modules; the automation CLI needs ~130.
+    assert len(modules) < 300, f"--automation imported {len(modules)} modules"
+    assert total_us / 1000 < _budget_ms(600.0), f"--automation imports took {total_us / 1000:.0f}ms"
+
+
+def test_worker_modes_skip_api_import_graph():
+    """The entry module plus the ``--supervisor`` target, without running it.
+
+    ``runAiBot`` is left out: importing it already launches Chrome.
+    """
+    code = "import linkdapply_backend_entry\nimport supervisor\n"
+    result, modules, _ = _importtime(["-c", code])
+    assert result.returncode == 0, result.stderr[-2000:]
+    assert "linkdapply_backend_entry" in modules
+    loaded = _api_modules(modules)
+    assert not loaded, f"worker modes imported API-only modules: {loaded}"
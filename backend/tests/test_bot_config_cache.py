@@ -1,3 +1,4 @@
+import json
 import os
 
 import pytest
@@ -60,3 +61,33 @@ def test_load_rate_settings_uses_cache_when_warmed(monkeypatch, test_db):
     settings = load_rate_settings_from_db(user_id=uid)
 
     assert settings.max_applications_per_day == 33
+
+
+def test_custom_qa_loaded_once_and_reloaded_on_mtime(tmp_path):
+    from services.bot_config_cache import get_custom_qa
+
+    path = tmp_path / "custom_qa.json"
+    path.write_text(json.dumps({"Are you a U.S. Citizen?": "No"}), encoding="utf-8")
+
+    qa = get_custom_qa(str(path))
+    assert get_custom_qa(str(path)) is qa
+    assert qa["Are you a U.S. Citizen?"] == "No"
+    assert "are you a u.s. citizen" in qa
+    assert "Are you a U.K. Citizen?" not in qa
+
+    path.write_text(json.dumps({"Notice period?": "30"}), encoding="utf-8")
+    os.utime(path, (path.stat().st_atime, path.stat().st_mtime + 5))
+    reloaded = get_custom_qa(str(path))
+    assert reloaded is not qa
+    assert reloaded["notice period"] == "30"
+
+
+def test_custom_qa_missing_file_and_fuzzy_lookup(tmp_path):
+    from services.bot_config_cache import CustomQAIndex, get_custom_qa
+
+    assert len(get_custom_qa(str(tmp_path / "missing.json"))) == 0
+
+    qa = CustomQAIndex({"How many years of experience do you have with Python?": "5"})
+    label = "How many years of experience do you have with Pythn?"
+    assert qa.lookup(label) is None
+    assert qa.lookup(label, fuzzy=True) == "5"
@@ -0,0 +1,122 @@
+"""Tests for the heap-based connect campaign scheduler."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from services import campaign_scheduler as cs
+from services import connect_campaigns as cc
+
+USER = "scheduler@example.com"
+NOW = datetime(2026, 6, 16, 9, 5, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def sched(test_db, monkeypatch):
+    from models import ConnectCampaign, ConnectCampaignRun
+
+    def _clear():
+        with test_db.get_session() as session:
+            session.query(ConnectCampaignRun).delete()
+            session.query(ConnectCampaign).delete()
+            session.commit()
+
+    _clear()
+    clock = {"now": NOW}
+    monkeypatch.setattr(cs, "_utcnow", lambda: clock["now"])
+    monkeypatch.setattr(cc, "_now_iso", lambda: clock["now"].isoformat())
+    monkeypatch.setattr(cs, "scheduler", cs.CampaignScheduler())
+    launches = []
+
+    def fake_run(user_id, campaign_id, *, source="manual", **_kwargs):
+        if clock.get("fail"):
+            raise ValueError("A connect task is already running for this account")
+        launches.append((campaign_id, source))
+        cc.record_connect_task_start(user_id, campaign_id, f"la-{len(launches)}", source=source)
+
+    monkeypatch.setattr(cc, "run_campaign", fake_run)
+    yield cs.scheduler, clock, launches
+    _clear()
+
+
+def _campaign(time="09:00", **extra):
+    return cc.create_campaign(
+        USER,
+        {"name": "Daily", "query": "IIT", "schedule_enabled": True, "schedule_time": time, **extra},
+    )
+
+
+def test_next_fire_at_catches_up_within_grace():
+    campaign = {"schedule_enabled": True, "schedule_time": "09:00", "last_run_at": None}
+    slot = NOW.replace(minute=0)
+
+    assert cc.next_fire_at(campaign, NOW, grace_seconds=900) == slot
+    assert cc.next_fire_at(campaign, NOW, grace_seconds=60) == slot + timedelta(days=1)
+    campaign["last_run_at"] = NOW.replace(hour=7).isoformat()
+    assert cc.next_fire_at(campaign, NOW, grace_seconds=900) == slot + timedelta(days=1)
+
+    late = {"schedule_enabled": True, "schedule_time": "23:55"}
+    just_after_midnight = datetime(2026, 6, 17, 0, 5, tzinfo=timezone.utc)
+    assert cc.next_fire_at(late, just_after_midnight, grace_seconds=900) == datetime(
+        2026, 6, 16, 23, 55, tzinfo=timezone.utc
+    )
+    assert cc.next_fire_at({"schedule_enabled": False, "schedule_time": "09:00"}, NOW) is None
+
+
+def test_create_update_delete_maintain_heap(sched):
+    scheduler, _, _ = sched
+    campaign = _campaign(time="10:30")
+    assert scheduler.next_fire_at(campaign["id"]) == NOW.replace(hour=10, minute=30)
+
+    cc.update_campaign(USER, campaign["id"], {"schedule_time": "11:00"})
+    assert scheduler.next_fire_at(campaign["id"]) == NOW.replace(hour=11, minute=0)
+    assert scheduler.seconds_until_next(NOW) == pytest.approx(115 * 60)
+
+    cc.update_campaign(USER, campaign["id"], {"schedule_enabled": False})
+    assert scheduler.next_fire_at(campaign["id"]) is None
+    cc.update_campaign(USER, campaign["id"], {"schedule_enabled": True})
+    cc.delete_campaign(USER, campaign["id"])
+    assert scheduler.seconds_until_next(NOW) is None
+
+
+def test_missed_slot_fires_once_then_moves_to_tomorrow(sched):
+    scheduler, _, launches = sched
+    campaign = _campaign()
+    assert scheduler.rebuild() == 1
+
+    due = scheduler.pop_due(NOW)
+    assert due == [(campaign["id"], USER)]
+    assert scheduler.fire(*due[0]) is True
+    assert launches == [(campaign["id"], "schedule")]
+    assert scheduler.next_fire_at(campaign["id"]) == NOW.replace(minute=0) + timedelta(days=1)
+    assert scheduler.pop_due(NOW) == []
+
+
+def test_failed_launch_retries_inside_grace(sched, monkeypatch):
+    scheduler, clock, launches = sched
+    campaign = _campaign()
+    clock["fail"] = True
+    assert scheduler.fire(campaign["id"], USER) is False
+    assert scheduler.next_fire_at(campaign["id"]) == NOW + timedelta(seconds=60)
+
+    monkeypatch.setenv("CONNECT_SCHEDULE_GRACE", "300")
+    assert scheduler.fire(campaign["id"], USER) is False
+    assert scheduler.next_fire_at(campaign["id"]) == NOW.replace(minute=0) + timedelta(days=1)
+    assert launches == []
+
+
+async def test_loop_wakes_on_new_campaign(sched):
+    scheduler, _, launches = sched
+    task = asyncio.create_task(scheduler.run())
+    try:
+        await asyncio.sleep(0.05)
+        campaign = await asyncio.to_thread(_campaign)
+        for _ in range(200):
+            if launches:
+                break
+            await asyncio.sleep(0.01)
+        assert launches == [(campaign["id"], "schedule")]
+    finally:
+        scheduler.stop()
+        await asyncio.wait_for(task, timeout=5)
@@ -0,0 +1,92 @@
+"""Tests for the cached cloud subscription lookup."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from services import cloud_billing as cb
+
+
+@pytest.fixture
+def cloud(monkeypatch):
+    monkeypatch.setenv("CLOUD_API_URL", "https://cloud.example")
+    monkeypatch.setenv("LINKDAPPLY_INTERNAL_KEY", "k")
+    state = {"plan": "pro", "status_code": 200, "calls": 0}
+
+    def handler(request):
+        state["calls"] += 1
+        assert request.headers["x-linkdapply-key"] == "k"
+        return httpx.Response(
+            state["status_code"], json={"plan": state["plan"], "status": "active"}
+        )
+
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(cb, "_sync_client", httpx.Client(transport=transport))
+    monkeypatch.setattr(cb, "_async_client", None)
+    monkeypatch.setattr(
+        httpx, "AsyncClient", _with_transport(httpx.AsyncClient, transport)
+    )
+    cb.invalidate_subscription_cache()
+    yield state
+    cb.invalidate_subscription_cache()
+
+
+def _with_transport(cls, transport):
+    def factory(*args, **kwargs):
+        kwargs["transport"] = transport
+        return cls(*args, **kwargs)
+
+    return factory
+
+
+def _age_entry(user_id, seconds):
+    sub, fetched_at = cb._cache[user_id]
+    cb._cache[user_id] = (sub, fetched_at - seconds)
+
+
+def test_fresh_entry_is_reused_and_invalidated(cloud):
+    assert cb.get_subscription_for_gating("u@example.com")["plan"] == "pro"
+    assert cb.get_subscription_for_gating("u@example.com")["plan"] == "pro"
+    assert cloud["calls"] == 1
+
+    cloud["plan"] = "agency"
+    cb.invalidate_subscription_cache("u@example.com")
+    assert cb.get_subscription_for_gating("u@example.com")["plan"] == "agency"
+    assert cloud["calls"] == 2
+
+
+def test_stale_entry_is_served_while_refreshing(cloud):
+    cb.get_subscription_for_gating("u@example.com")
+    _age_entry("u@example.com", 120)
+    cloud["plan"] = "agency"
+
+    assert cb.get_subscription_for_gating("u@example.com")["plan"] == "pro"
+    deadline = time.monotonic() + 5
+    while cb._cache["u@example.com"][0]["plan"] != "agency":
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_stale_entry_survives_cloud_outage(cloud):
+    cb.get_subscription_for_gating("u@example.com")
+    _age_entry("u@example.com", 120)
+    cloud["status_code"] = 500
+
+    assert cb.get_subscription_for_gating("u@example.com")["plan"] == "pro"
+
+    _age_entry("u@example.com", 3600)
+    with pytest.raises(HTTPException) as exc:
+        cb.get_subscription_for_gating("u@example.com")
+    assert exc.value.status_code == 503
+
+
+def test_async_lookup_warms_sync_cache(cloud):
+    async def _run():
+        return await cb.fetch_subscription_for_gating("a@example.com")
+
+    assert asyncio.run(_run())["plan"] == "pro"
+    assert cb.get_subscription_for_gating("a@example.com")["plan"] == "pro"
+    assert cloud["calls"] == 1
@@ -37,3 +37,33 @@ def test_create_post_and_reply(client: TestClient):
     thread = client.get(f"/api/community/posts/{post_id}").json()
     assert thread["reply_count"] == 1
     assert thread["replies"][0]["body"].startswith("Start with remote")
+
+
+def test_list_community_posts_keyset_pages(client: TestClient, test_db):
+    created = [
+        test_db.create_community_post(author_name="Pager", body=f"Paging thread {i}")
+        for i in range(5)
+    ]
+    test_db.create_community_reply(
+        post_id=created[-1]["id"], author_name="A", body="first"
+    )
+    test_db.create_community_reply(
+        post_id=created[-1]["id"], author_name="B", body="second"
+    )
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor is not None:
+            params["cursor"] = cursor
+        page = client.get("/api/community/posts", params=params).json()
+        seen.extend(p["id"] for p in page["posts"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == len(set(seen))
+    assert [c["id"] for c in reversed(created)] == seen[:5]
+    newest = client.get("/api/community/posts", params={"limit": 1}).json()["posts"][0]
+    assert [r["body"] for r in newest["replies"]] == ["first", "second"]
@@ -45,3 +45,76 @@ def test_save_list_config(client, auth_as):
     assert "keywords =" in content
     assert "Python" in content
     assert "React" in content
+
+
+def test_set_configs_bulk_upserts_and_encrypts(test_db):
+    uid = "bulk-config@example.com"
+    test_db.set_config("first_name", "Old", "personals", user_id=uid)
+
+    written = test_db.set_configs_bulk(
+        "personals",
+        {"first_name": "New", "phone_number": "555", "LINKEDIN_PASSWORD_alt": "pw"},
+        user_id=uid,
+    )
+    assert written == 3
+    assert test_db.get_all_by_category("personals", user_id=uid) == {
+        "first_name": "New",
+        "phone_number": "555",
+        "LINKEDIN_PASSWORD_alt": "pw",
+    }
+
+    from models import Config
+
+    with test_db.get_session() as session:
+        row = session.get(Config, (uid, "LINKEDIN_PASSWORD_alt"))
+        assert row.is_encrypted == 1
+        assert "pw" not in row.value
+    assert test_db.set_configs_bulk("personals", {}, user_id=uid) == 0
+
+
+def test_get_all_by_category_is_cached_until_written(test_db, monkeypatch):
+    import db_manager
+
+    uid = "cached-config@example.com"
+    test_db.set_config("LINKEDIN_PASSWORD", "pw", "secrets", user_id=uid)
+    assert test_db.get_all_by_category("secrets", user_id=uid) == {"LINKEDIN_PASSWORD": "pw"}
+
+    decrypts = []
+    real_decrypt = db_manager.decrypt_data
+    monkeypatch.setattr(
+        db_manager, "decrypt_data", lambda v: decrypts.append(v) or real_decrypt(v)
+    )
+    cached = test_db.get_all_by_category("secrets", user_id=uid)
+    cached["LINKEDIN_PASSWORD"] = "mutated"
+    assert test_db.get_all_by_category("secrets", user_id=uid) == {"LINKEDIN_PASSWORD": "pw"}
+    assert decrypts == []
+
+    test_db.set_config("LINKEDIN_PASSWORD", "pw2", "secrets", user_id=uid)
+    assert test_db.get_all_by_category("secrets", user_id=uid) == {"LINKEDIN_PASSWORD": "pw2"}
+    test_db.delete_config("LINKEDIN_PASSWORD", "secrets", user_id=uid)
+    assert test_db.get_all_by_category("secrets", user_id=uid) == {}
+
+
+def test_config_cache_is_lru_bounded(test_db, monkeypatch):
+    monkeypatch.setenv("CONFIG_CACHE_MAX", "2")
+    uid = "lru-config@example.com"
+    for category in ("a", "b", "c"):
+        test_db.get_all_by_category(category, user_id=uid)
+    assert list(test_db._config_cache)[-2:] == [(uid, "b"), (uid, "c")]
+    assert len(test_db._config_cache) == 2
+
+
+def test_shared_config_cache_sees_other_process_writes(test_db, monkeypatch):
+    monkeypatch.setenv("CONFIG_CACHE_SHARED", "1")
+    uid = "shared-config@example.com"
+    test_db.set_config("first_name", "Ada", "personals", user_id=uid)
+    assert test_db.get_all_by_category("personals", user_id=uid) == {"first_name": "Ada"}
+
+    # Another worker writes: its own cache is invalidated, ours is not.
+    from models import Config
+
+    with test_db.get_session() as session:
+        session.get(Config, (uid, "first_name")).value = '"Grace"'
+        test_db._bump_config_version(session, uid)
+        session.commit()
+    assert test_db.get_all_by_category("personals", user_id=uid) == {"first_name": "Grace"}
@@ -0,0 +1,64 @@
+"""Concurrent-polling load test for /api/linkedin-automation/dashboard.
+
+Blocking DB / filesystem work runs on the offload pool, so a slow dashboard
+read must not stall unrelated requests on the event loop.
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+POLLERS = 24
+SLOW_READ_S = 0.05
+
+
+def _p99(samples):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+
+
+@pytest.mark.asyncio
+async def test_dashboard_p99_under_concurrent_polling(monkeypatch, auth_as):
+    from routes import linkedin_automation as la_routes
+    from server import app
+
+    auth_as("load@example.com")
+    real_health = la_routes._health_snapshot
+
+    def slow_health(user_id):
+        time.sleep(SLOW_READ_S)  # stands in for a slow SQLite read / large file probe
+        return real_health(user_id=user_id)
+
+    monkeypatch.setattr(la_routes, "_health_snapshot", slow_health)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+
+        async def timed(path):
+            started = time.perf_counter()
+            resp = await client.get(path)
+            assert resp.status_code == 200
+            return time.perf_counter() - started
+
+        dashboard = [
+            asyncio.create_task(timed("/api/linkedin-automation/dashboard"))
+            for _ in range(POLLERS)
+        ]
+        await asyncio.sleep(0.01)
+        health = [
+            asyncio.create_task(timed("/api/health")) for _ in range(POLLERS)
+        ]
+        dashboard_latency = await asyncio.gather(*dashboard)
+        health_latency = await asyncio.gather(*health)
+
+    health_p99, dashboard_p99 = _p99(health_latency), _p99(dashboard_latency)
+    # Inline blocking reads would serialise every poll on the loop
+    # (>= POLLERS * SLOW_READ_S) and make /health wait behind them.
+    assert health_p99 < POLLERS * SLOW_READ_S / 2, (
+        f"/health p99={health_p99 * 1000:.0f}ms ({POLLERS} concurrent pollers)"
+    )
+    assert dashboard_p99 < POLLERS * SLOW_READ_S, (
+        f"/dashboard p99={dashboard_p99 * 1000:.0f}ms ({POLLERS} concurrent pollers)"
+    )
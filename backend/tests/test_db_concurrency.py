@@ -0,0 +1,109 @@
+"""Many processes writing one SQLite file through ``DatabaseManager``.
+
+Mirrors the desktop layout: the API, the supervisor and one bot worker per
+account each hold their own engine on the same ``data.db``. Every writer is a
+fresh interpreter that imports ``db_manager`` against a temp database, waits
+for a shared start signal, then interleaves ``log_application`` and
+``set_config`` writes. None may hit ``database is locked``.
+
+``DB_STRESS_WRITERS`` / ``DB_STRESS_ROWS`` scale the run (defaults 6 x 60).
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+
+from sqlalchemy import text
+
+from db_manager import create_db_engine
+from models import Base
+
+_WRITER = r"""
+import os, sys, time
+from db_manager import db
+
+go, worker, rows = sys.argv[1], int(sys.argv[2]), int(sys.argv[3])
+while not os.path.exists(go):
+    time.sleep(0.005)
+errors = 0
+for i in range(rows):
+    try:
+        db.log_application(
+            f"stress-{worker}@example.com",
+            job_title=f"Role {i}",
+            company="Acme",
+            status="applied" if i % 3 else "skipped",
+        )
+        db.set_config("progress", i, "stress", user_id=f"stress-{worker}@example.com")
+    except Exception as exc:
+        errors += 1
+        print(f"ERROR {type(exc).__name__}: {exc}", file=sys.stderr)
+print(f"DONE {worker} errors={errors}")
+"""
+
+
+def _backend_root() -> str:
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = (os.getenv(name) or "").strip()
+    return int(raw) if raw else default
+
+
+def test_engine_profile_applies_pragmas(tmp_path):
+    engine = create_db_engine("sqlite:///" + (tmp_path / "p.db").as_posix())
+    try:
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 30000
+    finally:
+        engine.dispose()
+
+
+def test_concurrent_writer_processes_never_hit_lock_errors(tmp_path):
+    writers = _env_int("DB_STRESS_WRITERS", 6)
+    rows = _env_int("DB_STRESS_ROWS", 60)
+    db_path = tmp_path / "stress.db"
+    go = tmp_path / "go"
+
+    engine = create_db_engine("sqlite:///" + db_path.as_posix())
+    Base.metadata.create_all(engine)
+    engine.dispose()
+
+    env = dict(os.environ)
+    env.pop("LINKDAPPLY_LOCAL_DATA", None)
+    env["DATABASE_URL"] = "sqlite:///" + db_path.as_posix()
+    env["PYTHONPATH"] = os.pathsep.join([_backend_root(), os.path.join(_backend_root(), "config")])
+    procs = [
+        subprocess.Popen(
+            [sys.executable, "-c", _WRITER, str(go), str(n), str(rows)],
+            cwd=_backend_root(),
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        for n in range(writers)
+    ]
+    time.sleep(0.5)  # let the interpreters finish importing before the race
+    go.touch()
+
+    outputs = [p.communicate(timeout=180) for p in procs]
+    for proc, (out, err) in zip(procs, outputs):
+        assert proc.returncode == 0, err[-2000:]
+        assert "errors=0" in out, err[-2000:]
+        assert "database is locked" not in err
+
+    with sqlite3.connect(db_path) as conn:
+        count = conn.execute("SELECT COUNT(*) FROM applications").fetchone()[0]
+        configs = conn.execute(
+            "SELECT COUNT(*) FROM configs WHERE category = 'stress'"
+        ).fetchone()[0]
+    assert count == writers * rows
+    assert configs == writers
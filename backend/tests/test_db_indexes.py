@@ -57,11 +57,28 @@ def test_applications_indexes_created(test_db):
     assert "ix_applications_user_status_ts" in names
 
 
+def test_application_rollup_index_created(test_db):
+    assert "ix_application_daily_counts_user_status_day" in _existing_indexes(
+        test_db, "application_daily_counts"
+    )
+
+
 def test_bot_runs_indexes_created(test_db):
     names = _existing_indexes(test_db, "bot_runs")
     assert "ix_bot_runs_start_time" in names
 
 
+
+def test_connect_campaign_indexes_created(test_db):
+    assert {
+        "ix_connect_campaigns_user_updated",
+        "ix_connect_campaigns_schedule",
+    } <= _existing_indexes(test_db, "connect_campaigns")
+    assert {
+        "ix_connect_campaign_runs_campaign",
+        "ix_connect_campaign_runs_task",
+    } <= _existing_indexes(test_db, "connect_campaign_runs")
+
 # ---------------------------------------------------------------------------
 # Plan checks: the optimizer must actually pick the index
 # ---------------------------------------------------------------------------
@@ -124,6 +141,25 @@ def test_recent_applications_uses_index(test_db):
     ), plan
 
 
+def test_history_keyset_page_uses_index_without_sort(test_db):
+    for i in range(3):
+        test_db.log_application("idx-page-u", status="applied", job_title=f"j{i}")
+    last_id = test_db.list_applications("idx-page-u", limit=1)[0]["id"]
+
+    plan = _plan(
+        test_db,
+        "SELECT id, timestamp FROM applications WHERE user_id = :u AND "
+        "timestamp <= (SELECT timestamp FROM applications WHERE id = :c AND user_id = :u) AND "
+        "(timestamp < (SELECT timestamp FROM applications WHERE id = :c AND user_id = :u) "
+        "OR (timestamp = (SELECT timestamp FROM applications WHERE id = :c AND user_id = :u) AND id < :c)) "
+        "ORDER BY timestamp DESC, id DESC LIMIT 50",
+        {"u": "idx-page-u", "c": last_id},
+    )
+    # Seeks to the cursor (range on timestamp) and reads in index order.
+    assert "ix_applications_user_timestamp (user_id=? AND timestamp<?)" in plan, plan
+    assert "TEMP B-TREE" not in plan, plan
+
+
 def test_monthly_application_count_uses_index(test_db):
     for _ in range(3):
         test_db.log_application(
@@ -159,6 +195,18 @@ def test_last_activity_snapshot_uses_index(test_db):
     assert "ix_applications_user_status_ts" in plan, plan
 
 
+def test_last_activity_rollup_lookup_uses_index(test_db):
+    test_db.log_application("idx-rollup-u", status="applied", job_title="t", company="c")
+
+    plan = _plan(
+        test_db,
+        "SELECT last_application_id FROM application_daily_counts "
+        "WHERE user_id = :u AND status = :s ORDER BY day DESC LIMIT 1",
+        {"u": "idx-rollup-u", "s": "applied"},
+    )
+    assert "ix_application_daily_counts_user_status_day" in plan, plan
+
+
 def test_recent_bot_runs_uses_index(test_db):
     test_db.start_bot_run("idx-bot-u")
     test_db.start_bot_run("idx-bot-u")
@@ -170,6 +218,16 @@ def test_recent_bot_runs_uses_index(test_db):
     assert "ix_bot_runs_start_time" in plan, plan
 
 
+
+def test_due_connect_campaigns_uses_index(test_db):
+    plan = _plan(
+        test_db,
+        "SELECT id FROM connect_campaigns "
+        "WHERE schedule_enabled IS 1 AND schedule_time = :t AND enabled IS 1",
+        {"t": "09:30"},
+    )
+    assert "ix_connect_campaigns_schedule" in plan, plan
+
 # ---------------------------------------------------------------------------
 # Idempotency: rerunning create_all (e.g. on every backend boot) is safe
 # ---------------------------------------------------------------------------
@@ -5,9 +5,13 @@ import pytest
 from utils.debug_logs import (
     API_LOG,
     SUPERVISOR_LOG,
+    BufferedLogSink,
     bot_log_path,
     collect_bot_logs_payload,
+    iter_lines_reverse,
     logs_dir,
+    read_since,
+    read_tail,
     run_has_logs,
     run_logs_dir,
     scoped_log_path,
@@ -83,3 +87,124 @@ def test_collect_bot_logs_empty_message(tmp_path, monkeypatch):
     assert payload["infra"] == []
     assert "No log files yet" in payload["logs"]
     assert payload["log_dir"] in payload["logs"]
+
+
+def test_buffered_log_sink_flushes_on_size_and_close(tmp_path):
+    path = str(tmp_path / "logs" / "bot-1.txt")
+    sink = BufferedLogSink(max_buffer_bytes=32, flush_interval=60)
+    sink.write(path, "short\n")
+    assert not os.path.exists(path) or open(path, encoding="utf-8").read() == ""
+
+    sink.write(path, "x" * 40 + "\n")
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == "short\n" + "x" * 40 + "\n"
+
+    sink.write(path, "tail\n")
+    sink.close()
+    with open(path, encoding="utf-8") as f:
+        assert f.read().endswith("tail\n")
+
+    # Writes after close go straight to disk.
+    sink.write(path, "late\n")
+    with open(path, encoding="utf-8") as f:
+        assert f.read().endswith("late\n")
+
+
+def test_buffered_log_sink_time_based_flush(tmp_path):
+    import time
+
+    path = str(tmp_path / "bot-2.txt")
+    sink = BufferedLogSink(max_buffer_bytes=1 << 20, flush_interval=0.05)
+    sink.write(path, "idle line\n")
+    deadline = time.time() + 2
+    while time.time() < deadline:
+        if os.path.exists(path) and "idle line" in open(path, encoding="utf-8").read():
+            break
+        time.sleep(0.02)
+    sink.close()
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == "idle line\n"
+
+
+@pytest.mark.parametrize("trailing", ["\n", ""])
+@pytest.mark.parametrize("block_size", [7, 64, 65536])
+def test_read_tail_matches_readlines(tmp_path, trailing, block_size):
+    path = tmp_path / "big.txt"
+    path.write_text("\n".join(f"line {i}" for i in range(500)) + trailing, encoding="utf-8")
+    expected = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    for n in (1, 3, 120, 500, 800):
+        text, end = read_tail(str(path), n, block_size=block_size)
+        assert text == "".join(expected[-n:])
+        assert end == path.stat().st_size
+
+
+def test_read_tail_reads_only_the_end(tmp_path, monkeypatch):
+    path = tmp_path / "big.txt"
+    path.write_bytes(b"x" * 2_000_000 + b"\nlast\n")
+    reads = []
+    real_open = open
+
+    def counting_open(*args, **kwargs):
+        fh = real_open(*args, **kwargs)
+        real_read = fh.read
+
+        class _Wrapped:
+            def __getattr__(self, name):
+                return getattr(fh, name)
+
+            def read(self, size=-1):
+                data = real_read(size)
+                reads.append(len(data))
+                return data
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                fh.close()
+
+        return _Wrapped()
+
+    monkeypatch.setattr("builtins.open", counting_open)
+    text, _ = read_tail(str(path), 1, block_size=1024)
+    assert text == "last\n"
+    assert sum(reads) <= 1024
+
+
+@pytest.mark.parametrize("content", ["a\nbb\nccc\n", "a\nbb", "\n\nx\n\n", "x", ""])
+@pytest.mark.parametrize("block_size", [1, 2, 64])
+def test_iter_lines_reverse_matches_splitlines(tmp_path, content, block_size):
+    path = tmp_path / "log.txt"
+    path.write_text(content, encoding="utf-8")
+    lines = list(iter_lines_reverse(str(path), block_size=block_size))
+    assert lines == content.splitlines()[::-1]
+
+
+def test_iter_lines_reverse_stops_at_max_bytes(tmp_path):
+    path = tmp_path / "log.txt"
+    path.write_text("old line\nnew\nnewest\n", encoding="utf-8")
+    assert list(iter_lines_reverse(str(path), max_bytes=12, block_size=4)) == ["newest", "new"]
+    assert list(iter_lines_reverse(str(path), max_bytes=11, block_size=4)) == ["newest"]
+
+
+def test_read_since_returns_complete_lines_and_offset(tmp_path):
+    path = tmp_path / "run.txt"
+    path.write_text("a\nb\n", encoding="utf-8")
+    _, offset = read_tail(str(path), 10)
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("c\npartial")
+    text, offset = read_since(str(path), offset)
+    assert text == "c\n"
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(" line\n")
+    text, offset = read_since(str(path), offset)
+    assert text == "partial line\n"
+    assert read_since(str(path), offset) == ("", offset)
+
+
+def test_read_since_restarts_after_truncation(tmp_path):
+    path = tmp_path / "run.txt"
+    path.write_text("new\n", encoding="utf-8")
+    assert read_since(str(path), 10_000) == ("new\n", 4)
@@ -649,6 +649,39 @@ def test_persist_opportunities_writes_incrementally(tmp_path):
     assert second["opportunities"][0]["author"] == "Jane"
 
 
+def test_stream_output_appends_lines_and_rewrites_progress(tmp_path):
+    from linkedin_automation.linkedin_ui.opportunity_scan import OpportunityScanMixin
+    from linkedin_automation.scan_output import is_stream_output, progress_path_for
+
+    class _Opp(OpportunityScanMixin):
+        pass
+
+    bot = _Opp()
+    out = tmp_path / "opportunities.jsonl"
+    assert is_stream_output(str(out))
+    assert not is_stream_output(str(tmp_path / "opportunities.json"))
+
+    bot._append_opportunity(str(out), {"author": "Jane"})
+    bot._append_opportunity(str(out), {"author": "Ravi"})
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["author"] for line in lines] == ["Jane", "Ravi"]
+
+    bot._write_opportunity_progress(
+        str(out),
+        found=2,
+        posts_scanned=9,
+        started_at="2026-06-17T00:00:00+00:00",
+        in_progress=False,
+    )
+    progress = json.loads(
+        (tmp_path / "opportunities.progress.json").read_text(encoding="utf-8")
+    )
+    assert progress_path_for(str(out)).endswith("opportunities.progress.json")
+    assert progress["found"] == 2
+    assert progress["posts_scanned"] == 9
+    assert progress["in_progress"] is False
+
+
 def test_hiring_post_saved_without_contact_when_not_required():
     from linkedin_automation.linkedin_ui.opportunity_scan import OpportunityScanMixin
 
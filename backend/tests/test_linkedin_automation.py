@@ -7,8 +7,11 @@ plan gating, and the Linkedln-Automation-Framework package layout.
 Chrome from the test suite.
 """
 
+import json
 import os
 import subprocess
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 
 import pytest
@@ -32,6 +35,7 @@ class FakePopen:
     def __init__(self, *args, **kwargs):
         self.pid = 99999
         self._exit_code: int | None = None
+        self._exited = threading.Event()
         self.cmd = args[0] if args else kwargs.get("args")
         self.cwd = kwargs.get("cwd")
         self.env = kwargs.get("env")
@@ -41,18 +45,21 @@ class FakePopen:
         return self._exit_code
 
     def wait(self, timeout=None):
-        return self._exit_code if self._exit_code is not None else 0
+        if not self._exited.wait(timeout):
+            raise subprocess.TimeoutExpired(self.cmd, timeout)
+        return self._exit_code
 
     def terminate(self):
         if self._exit_code is None:
-            self._exit_code = -15
+            self.exit(-15)
 
     def kill(self):
         if self._exit_code is None:
-            self._exit_code = -9
+            self.exit(-9)
 
     def exit(self, code: int = 0) -> None:
         self._exit_code = code
+        self._exited.set()
 
 
 @pytest.fixture
@@ -85,7 +92,7 @@ def fake_popen(monkeypatch):
     for t in list(la_service._tasks.values()):
         proc = t.process
         if isinstance(proc, FakePopen) and proc._exit_code is None:
-            proc._exit_code = 0
+            proc.exit(0)
         la_service._reap(t)
     la_service._tasks.clear()
 
@@ -935,6 +942,29 @@ def test_stop_task_404_when_unknown(client):
     assert res.status_code == 404
 
 
+def test_exited_task_is_finalized_without_polling(
+    client, test_db, fake_popen, clear_automation_tasks
+):
+    """The waiter thread records the exit; no request has to reap it."""
+    from services import linkedin_automation as la_service
+
+    start = client.post(
+        "/api/linkedin-automation/post",
+        json={"post_text": "reaped", "user_id": TEST_USER},
+    )
+    task_id = start.json()["id"]
+    task = la_service.get_task(task_id)
+    fake_popen.instances[-1].exit(0)
+
+    deadline = time.monotonic() + 5
+    while (test_db.get_automation_task(task_id) or {}).get("status") == "running":
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert test_db.get_automation_task(task_id)["status"] == "completed"
+    assert task.log_handle.closed
+    assert la_service.task_to_dict(task)["running"] is False
+
+
 # ---------------------------------------------------------------------------
 # Routes: combined /dashboard endpoint + ETag
 # ---------------------------------------------------------------------------
@@ -1047,6 +1077,56 @@ def test_dashboard_etag_per_user(client, test_db, clear_automation_tasks, auth_a
     assert r1.headers["ETag"] != r2.headers["ETag"]
 
 
+def test_dashboard_304_skips_payload_build(
+    client, clear_automation_tasks, auth_as, monkeypatch
+):
+    from routes import linkedin_automation as la_routes
+
+    auth_as("lu")
+    etag = client.get("/api/linkedin-automation/dashboard").headers["ETag"]
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("payload built for an unchanged dashboard")
+
+    monkeypatch.setattr(la_routes, "_dashboard_parts", _fail)
+    res = client.get(
+        "/api/linkedin-automation/dashboard", headers={"If-None-Match": etag}
+    )
+    assert res.status_code == 304
+
+
+def test_dashboard_etag_changes_on_config_write(
+    client, test_db, clear_automation_tasks, auth_as
+):
+    auth_as("lu")
+    etag = client.get("/api/linkedin-automation/dashboard").headers["ETag"]
+
+    test_db.set_config("LINKEDIN_AUTOMATION_HEADLESS", True, "automation", user_id="lu")
+
+    res = client.get(
+        "/api/linkedin-automation/dashboard", headers={"If-None-Match": etag}
+    )
+    assert res.status_code == 200
+    assert res.headers["ETag"] != etag
+    test_db.delete_config("LINKEDIN_AUTOMATION_HEADLESS", "automation", user_id="lu")
+
+
+def test_dashboard_etag_expires_with_time_bucket(
+    client, clear_automation_tasks, auth_as, monkeypatch
+):
+    from routes import linkedin_automation as la_routes
+
+    auth_as("lu")
+    etag = client.get("/api/linkedin-automation/dashboard").headers["ETag"]
+
+    now = la_routes.time.time() + 3600
+    monkeypatch.setattr(la_routes.time, "time", lambda: now)
+    res = client.get(
+        "/api/linkedin-automation/dashboard", headers={"If-None-Match": etag}
+    )
+    assert res.status_code == 200
+
+
 # ---------------------------------------------------------------------------
 # LinkedIn account discovery + per-task account capture
 # ---------------------------------------------------------------------------
@@ -1615,6 +1695,47 @@ def test_artifact_rejects_path_traversal(
     assert res.status_code == 403
 
 
+def test_artifact_pages_streamed_scan_by_offset(
+    client, test_db, tmp_path, monkeypatch
+):
+    """A ``.jsonl`` scan is paged by byte offset; a half-written line waits."""
+    from services import linkedin_automation as la_service
+
+    monkeypatch.setattr(la_service, "get_framework_dir", lambda: str(tmp_path))
+    out = tmp_path / "opps.jsonl"
+    out.write_text(
+        "".join(json.dumps({"author": f"A{i}"}) + "\n" for i in range(3))
+        + '{"author": "A3"',
+        encoding="utf-8",
+    )
+    (tmp_path / "opps.progress.json").write_text(
+        json.dumps({"found": 4, "in_progress": True}), encoding="utf-8"
+    )
+    test_db.create_automation_task(
+        "la-scan-opportunities-stream",
+        "scan-opportunities",
+        ["scan-opportunities", "--output", "opps.jsonl"],
+        "/tmp/scan.log",
+        user_id=TEST_USER,
+    )
+
+    url = "/api/linkedin-automation/tasks/la-scan-opportunities-stream/artifact"
+    first = client.get(url, params={"limit": 2}).json()
+    assert [item["author"] for item in first["items"]] == ["A0", "A1"]
+    assert first["progress"]["found"] == 4
+    assert first["eof"] is False
+
+    second = client.get(url, params={"offset": first["next_offset"]}).json()
+    assert [item["author"] for item in second["items"]] == ["A2"]
+
+    with out.open("a", encoding="utf-8") as fh:
+        fh.write("}\n")
+    third = client.get(url, params={"offset": second["next_offset"]}).json()
+    assert [item["author"] for item in third["items"]] == ["A3"]
+    assert third["eof"] is True
+    assert third["next_offset"] == out.stat().st_size
+
+
 # ---------------------------------------------------------------------------
 # /calendar — direct read of the framework's content_calendar.txt
 # ---------------------------------------------------------------------------
@@ -1696,11 +1817,17 @@ def test_dashboard_etag_changes_when_tasks_change(
 
 @pytest.fixture
 def clear_connect_campaigns(test_db):
-    from services.connect_campaigns import CONNECT_CAMPAIGNS_CATEGORY, CAMPAIGNS_KEY
+    from models import ConnectCampaign, ConnectCampaignRun
 
-    test_db.delete_config(CAMPAIGNS_KEY, CONNECT_CAMPAIGNS_CATEGORY, user_id=TEST_USER)
+    def _clear():
+        with test_db.get_session() as session:
+            session.query(ConnectCampaignRun).delete()
+            session.query(ConnectCampaign).delete()
+            session.commit()
+
+    _clear()
     yield
-    test_db.delete_config(CAMPAIGNS_KEY, CONNECT_CAMPAIGNS_CATEGORY, user_id=TEST_USER)
+    _clear()
 
 
 def test_connect_campaign_crud(client, clear_connect_campaigns):
@@ -1805,6 +1932,82 @@ def test_connect_task_finished_updates_campaign_stats(
     assert updated["runs"][0]["status"] == "completed"
 
 
+def test_connect_counts_prefer_result_sidecar(tmp_path, monkeypatch):
+    from linkedin_automation.__main__ import write_result
+    from services import connect_campaigns as cc
+    from services import linkedin_automation as la_service
+
+    log_path = tmp_path / "linkedin_automation_la-connect-x.log"
+    log_path.write_text("Connect summary: sent=1 skipped=1 errors=0\n", encoding="utf-8")
+    monkeypatch.setenv("LINKDAPPLY_AUTOMATION_RESULT", la_service.result_path_for(str(log_path)))
+    write_result("connect", {"sent": 7, "skipped": 3, "errors": []}, 0)
+
+    assert cc._parse_connect_log(str(log_path)) == (7, 3)
+
+
+def test_connect_log_fallback_scans_from_the_end(tmp_path):
+    from services import connect_campaigns as cc
+
+    log_path = tmp_path / "connect.log"
+    noise = "".join(f"visited profile {i}\n" for i in range(20_000))
+    dump = '{\n  "query": "IIT",\n  "sent": 5,\n  "skipped": 9,\n  "errors": []\n}\n'
+    log_path.write_text(noise + "Connect results: " + dump + "LinkedIn Bot completed\n", encoding="utf-8")
+    assert cc._parse_connect_log(str(log_path)) == (5, 9)
+
+    log_path.write_text(noise, encoding="utf-8")
+    assert cc._parse_connect_log(str(log_path)) == (0, 0)
+    assert cc._parse_connect_log(str(tmp_path / "missing.log")) == (0, 0)
+
+
+def test_connect_run_history_is_trimmed(test_db, clear_connect_campaigns, monkeypatch):
+    from services import connect_campaigns as cc
+
+    monkeypatch.setattr(cc, "MAX_RUN_HISTORY", 3)
+    campaign = cc.create_campaign(TEST_USER, {"name": "Trim", "query": "IIT"})
+    for n in range(5):
+        cc.record_connect_task_start(TEST_USER, campaign["id"], f"la-trim-{n}")
+
+    updated = cc.get_campaign(TEST_USER, campaign["id"])
+    assert [r["task_id"] for r in updated["runs"]] == ["la-trim-4", "la-trim-3", "la-trim-2"]
+    assert updated["totals"]["runs"] == 5
+    assert updated["last_task_id"] == "la-trim-4"
+
+
+def test_legacy_campaign_blob_is_migrated(test_db, clear_connect_campaigns):
+    from services import connect_campaigns as cc
+
+    legacy = {
+        "id": "legacy1",
+        "name": "Old",
+        "query": "IIT Delhi",
+        "max_connects": 5,
+        "bio_keywords": ["SDE"],
+        "schedule_enabled": True,
+        "schedule_time": "08:15",
+        "enabled": True,
+        "created_at": "2026-01-01T00:00:00+00:00",
+        "updated_at": "2026-01-02T00:00:00+00:00",
+        "totals": {"runs": 1, "sent": 0, "skipped": 0},
+        "runs": [{"task_id": "la-legacy", "started_at": "2026-01-02T00:00:00+00:00",
+                  "status": "running", "sent": 0, "skipped": 0}],
+    }
+    test_db.set_config(
+        cc.CAMPAIGNS_KEY, [legacy], cc.CONNECT_CAMPAIGNS_CATEGORY, user_id=TEST_USER
+    )
+    test_db.set_config("la-legacy", "legacy1", cc.TASK_MAP_CATEGORY, user_id=TEST_USER)
+
+    assert cc.migrate_legacy_campaigns() == 1
+    assert cc.migrate_legacy_campaigns() == 0
+    assert test_db.get_all_by_category(cc.TASK_MAP_CATEGORY, user_id=TEST_USER) == {}
+
+    # An open legacy run still finishes into the new rows.
+    cc.on_connect_task_finished("la-legacy", TEST_USER, None, status="completed", exit_code=0)
+    migrated = cc.get_campaign(TEST_USER, "legacy1")
+    assert migrated["bio_keywords"] == ["SDE"]
+    assert migrated["runs"][0]["status"] == "completed"
+    assert [c for _, c in test_db.list_scheduled_connect_campaigns("08:15")][0]["id"] == "legacy1"
+
+
 def test_schedule_due_once_per_day():
     from datetime import datetime, timezone
 
@@ -0,0 +1,99 @@
+"""Tests for the SSE log follower (services/log_stream.py)."""
+
+import asyncio
+import json
+
+import pytest
+
+from services import log_stream
+
+
+@pytest.fixture(autouse=True)
+def fast_poll(monkeypatch):
+    monkeypatch.setattr(log_stream, "POLL_INTERVAL", 0.01)
+
+
+def _events(frames):
+    out = []
+    for frame in frames:
+        if frame.startswith(":"):
+            continue
+        fields = dict(
+            line.split(": ", 1) for line in frame.strip().splitlines() if ": " in line
+        )
+        out.append((fields.get("event"), json.loads(fields["data"]), fields.get("id")))
+    return out
+
+
+async def _take(gen, count):
+    frames = []
+    while len(frames) < count:
+        frame = await asyncio.wait_for(gen.__anext__(), timeout=5)
+        if not frame.startswith(":"):
+            frames.append(frame)
+    return _events(frames)
+
+
+def test_offsets_round_trip():
+    raw = log_stream.encode_offsets({"bot-main.txt": 120, "supervisor.txt": 8})
+    assert log_stream.decode_offsets(raw) == {"bot-main.txt": 120, "supervisor.txt": 8}
+    assert log_stream.decode_offsets("junk=x&a.txt=3") == {"a.txt": 3}
+
+
+async def test_viewers_share_one_follower_and_get_appends(tmp_path):
+    log = tmp_path / "bot-main.txt"
+    log.write_text("one\ntwo\n", encoding="utf-8")
+    files = log_stream.directory_files(str(tmp_path))
+    key = f"run:{tmp_path}"
+
+    a = log_stream.stream_log_events(key, files, lines=1, heartbeat=0.05)
+    b = log_stream.stream_log_events(key, files, lines=10, heartbeat=0.05)
+    try:
+        [(_, first_a, _)] = await _take(a, 1)
+        [(_, first_b, _)] = await _take(b, 1)
+        assert first_a["text"] == "two\n"
+        assert first_b["text"] == "one\ntwo\n"
+        assert log_stream.active_followers() == {key: 2}
+
+        with open(log, "a", encoding="utf-8") as fh:
+            fh.write("three\n")
+        [(_, next_a, id_a)] = await _take(a, 1)
+        [(_, next_b, _)] = await _take(b, 1)
+        assert next_a["text"] == next_b["text"] == "three\n"
+        assert log_stream.decode_offsets(id_a) == {"bot-main.txt": log.stat().st_size}
+    finally:
+        await a.aclose()
+        await b.aclose()
+    assert log_stream.active_followers() == {}
+
+
+async def test_resume_from_offsets_sends_only_missed_lines(tmp_path):
+    log = tmp_path / "task.log"
+    log.write_text("old\n", encoding="utf-8")
+    offset = log.stat().st_size
+    log.write_text("old\nmissed\n", encoding="utf-8")
+
+    gen = log_stream.stream_log_events(
+        f"file:{log}",
+        log_stream.single_file(str(log)),
+        offsets={"task.log": offset},
+        heartbeat=0.05,
+    )
+    try:
+        [(_, data, _)] = await _take(gen, 1)
+        assert data["text"] == "missed\n"
+    finally:
+        await gen.aclose()
+
+
+async def test_stream_ends_when_finished(tmp_path):
+    log = tmp_path / "task.log"
+    log.write_text("done\n", encoding="utf-8")
+    gen = log_stream.stream_log_events(
+        f"file:{log}",
+        log_stream.single_file(str(log)),
+        is_finished=lambda: True,
+        heartbeat=0.05,
+    )
+    events = [event for event, _, _ in _events([f async for f in gen])]
+    assert events == ["log", "end"]
@@ -0,0 +1,62 @@
+"""Tests for compiled bad-word / blacklist / deal-breaker matchers."""
+
+from services.phrase_matcher import (
+    REGEX,
+    SUBSTRING,
+    WORD,
+    PhraseMatcher,
+    compile_phrase_matchers,
+)
+
+
+def test_substring_mode_matches_inside_words_case_insensitively():
+    m = PhraseMatcher(["Crypto", "gambling"], mode=SUBSTRING)
+    assert m.search("We build CRYPTOcurrency wallets") == "Crypto"
+    assert m.search("A friendly bank") is None
+
+
+def test_word_mode_requires_whole_words():
+    m = PhraseMatcher(["php", "c++"], mode=WORD)
+    assert m.search("Experience with PHP required") == "php"
+    assert m.search("graphpheme") is None
+
+
+def test_regex_mode_uses_raw_patterns_and_reports_phrase():
+    m = PhraseMatcher([r"u\.?s\.? citizen", "clearance"], mode=REGEX)
+    assert m.search("Must be a U.S. citizen") == r"u\.?s\.? citizen"
+    assert m.search("Active clearance needed") == "clearance"
+    assert m.search("nuclearances") is None
+
+
+def test_invalid_regex_falls_back_to_literal():
+    m = PhraseMatcher(["foo[", "visa"], mode=REGEX)
+    assert len(m) == 2
+    assert m.search("see foo[bar") == "foo["
+    assert m.search("no visa sponsorship") == "visa"
+
+
+def test_regex_mode_keeps_inline_flags_and_backreferences():
+    m = PhraseMatcher([r"(?i)\bno sponsorship\b", r"(\w+) \1 only", "clearance"], mode=REGEX)
+    assert m.search("Sorry, NO SPONSORSHIP available") == r"(?i)\bno sponsorship\b"
+    assert m.search("citizens citizens only") == r"(\w+) \1 only"
+    assert m.search("clearance, and no sponsorship") == "clearance"
+    assert m.search("sponsorship offered") is None
+
+
+def test_empty_lists_never_match():
+    m = PhraseMatcher(["", None], mode=SUBSTRING)
+    assert not m
+    assert m.search("anything") is None
+
+
+def test_compile_phrase_matchers_handles_missing_lists():
+    matchers = compile_phrase_matchers({"bad_words": ["unpaid"]})
+    assert matchers["bad_words"].search("This is an UNPAID internship") == "unpaid"
+    assert matchers["tech_blacklists"].search("php") is None
+
+
+def test_many_phrases_single_pass():
+    phrases = [f"term{i}" for i in range(300)]
+    m = PhraseMatcher(phrases, mode=WORD)
+    assert m.search("nothing here but term299 at the end") == "term299"
+    assert m.search("term3000") is None
@@ -0,0 +1,53 @@
+"""Retrying a search result card after the results list re-rendered."""
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+
+from services.stale_job_cards import read_card_with_retry
+
+
+def _cards(*job_ids, gen=0):
+    return [{"job_id": j, "gen": gen} for j in job_ids]
+
+
+def _refresh(cards):
+    return [{**c, "gen": c["gen"] + 1} for c in cards]
+
+
+def test_stale_card_is_refreshed_and_read_again():
+    cards = _cards("1", "2", "3")
+    calls, resets = [], []
+
+    def read(card):
+        calls.append(dict(card))
+        if card["gen"] == 0:
+            raise StaleElementReferenceException("list re-rendered")
+        return card["job_id"]
+
+    assert read_card_with_retry(cards, 1, read, _refresh, on_stale=lambda: resets.append(1)) == "2"
+    assert calls == [{"job_id": "2", "gen": 0}, {"job_id": "2", "gen": 1}]
+    assert resets == [1]
+    # The current card and everything after it were re-read; earlier ones were not.
+    assert [c["gen"] for c in cards] == [0, 1, 1]
+
+
+def test_card_still_stale_after_refresh_is_raised():
+    cards = _cards("1", "2")
+    calls = []
+
+    def read(card):
+        calls.append(card["job_id"])
+        raise StaleElementReferenceException("still gone")
+
+    with pytest.raises(StaleElementReferenceException):
+        read_card_with_retry(cards, 0, read, _refresh)
+    assert calls == ["1", "1"]
+
+
+def test_fresh_card_skips_refresh():
+    cards = _cards("1")
+
+    def refresh(_cards):
+        raise AssertionError("refresh should not run")
+
+    assert read_card_with_retry(cards, 0, lambda c: c["job_id"], refresh) == "1"
@@ -114,3 +114,84 @@ def test_api_rejects_spoofed_user_id_query(client, auth_as):
         params={"user_id": "victim@example.com"},
     )
     assert res.status_code == 403
+
+
+def _mock_session_client(monkeypatch, handler):
+    import asyncio
+
+    import httpx
+
+    calls = []
+
+    def _handle(request):
+        calls.append(request.headers.get("cookie"))
+        return handler(request)
+
+    monkeypatch.setattr(
+        ur, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(_handle))
+    )
+    monkeypatch.setattr(ur, "_http_client_loop", asyncio.get_running_loop())
+    ur.clear_session_cache()
+    return calls
+
+
+class _CookieReq:
+    def __init__(self, cookie):
+        self.headers = {"cookie": cookie}
+
+
+@pytest.mark.asyncio
+async def test_session_email_is_cached_per_cookie(monkeypatch):
+    import httpx
+
+    calls = _mock_session_client(
+        monkeypatch,
+        lambda request: httpx.Response(
+            200,
+            json={"user": {"email": "alice@example.com"}}
+            if "alice" in request.headers["cookie"]
+            else {},
+        ),
+    )
+
+    assert await ur._session_email(_CookieReq("s=alice")) == "alice@example.com"
+    assert await ur._session_email(_CookieReq("s=alice")) == "alice@example.com"
+    assert await ur._session_email(_CookieReq("s=nobody")) is None
+    assert await ur._session_email(_CookieReq("s=nobody")) is None
+    assert calls == ["s=alice", "s=nobody"]
+
+    stats = ur.get_session_cache_stats()
+    assert stats["hits"] == 1 and stats["negative_hits"] == 1
+    assert stats["misses"] == 2 and stats["verifications"] == 2
+    assert stats["hit_rate"] == 0.5
+    ur.clear_session_cache()
+
+
+@pytest.mark.asyncio
+async def test_session_cache_ttl_bound_and_upstream_errors(monkeypatch):
+    import httpx
+
+    monkeypatch.setenv("SESSION_CACHE_MAX", "1")
+    status = {"code": 500}
+    calls = _mock_session_client(
+        monkeypatch,
+        lambda request: httpx.Response(
+            status["code"], json={"user": {"email": request.headers["cookie"]}}
+        ),
+    )
+
+    # 5xx answers are not negatively cached.
+    assert await ur._session_email(_CookieReq("a")) is None
+    status["code"] = 200
+    assert await ur._session_email(_CookieReq("a")) == "a"
+    assert await ur._session_email(_CookieReq("b")) == "b"
+    # "a" was evicted by the size bound.
+    assert await ur._session_email(_CookieReq("a")) == "a"
+    assert calls == ["a", "a", "b", "a"]
+
+    monkeypatch.setenv("SESSION_CACHE_TTL", "0")
+    ur.clear_session_cache()
+    await ur._session_email(_CookieReq("c"))
+    await ur._session_email(_CookieReq("c"))
+    assert calls[-2:] == ["c", "c"]
+    ur.clear_session_cache()